@@ -0,0 +1,100 @@
+"""Add normalized gym load entries
+
+Revision ID: 2b8d41c7e9a3
+Revises: 7c1e5b9a2f40
+Create Date: 2026-10-18 11:24:37.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2b8d41c7e9a3'
+down_revision: Union[str, Sequence[str], None] = '7c1e5b9a2f40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Frozen copy of app.services.gym_loads as of this revision, so later changes to
+# the service do not change what this migration backfills.
+def _exercise_capacities(exercises_snapshot):
+    """Map exercise name -> physical-motor capacity (first occurrence wins)."""
+    capacities = {}
+    for ex in exercises_snapshot or []:
+        capacities.setdefault(ex.get("name"), ex.get("physicalMotorCapacity") or None)
+    return capacities
+
+
+def _build_load_entries(performed_loads, capacities, session_id, athlete_id):
+    """Load entry dicts (one per set) for a feedback's performed_loads JSON."""
+    entries = []
+    for exercise_name, loads in (performed_loads or {}).items():
+        if not isinstance(loads, list):
+            continue
+        for set_index, load in enumerate(loads):
+            if load is None:
+                continue
+            entries.append({
+                "session_id": session_id,
+                "athlete_id": athlete_id,
+                "exercise_name": exercise_name,
+                "physical_motor_capacity": capacities.get(exercise_name),
+                "set_index": set_index,
+                "load": float(load),
+            })
+    return entries
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    gymloadentry = op.create_table('gymloadentry',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('feedback_id', sa.Integer(), nullable=False),
+    sa.Column('session_id', sa.Integer(), nullable=False),
+    sa.Column('athlete_id', sa.Integer(), nullable=False),
+    sa.Column('exercise_name', sa.String(), nullable=False),
+    sa.Column('physical_motor_capacity', sa.String(), nullable=True),
+    sa.Column('set_index', sa.Integer(), nullable=False),
+    sa.Column('load', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['athlete_id'], ['athlete.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['feedback_id'], ['gymfeedback.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['session_id'], ['gymsession.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_gymloadentry_id'), 'gymloadentry', ['id'], unique=False)
+    op.create_index('ix_gymloadentry_session_athlete', 'gymloadentry', ['session_id', 'athlete_id'], unique=False)
+    op.create_index('ix_gymloadentry_feedback_id', 'gymloadentry', ['feedback_id'], unique=False)
+
+    # Backfill from the performed_loads JSON of existing feedbacks
+    gymsession = sa.table('gymsession', sa.column('id', sa.Integer()), sa.column('exercises_snapshot', sa.JSON()))
+    gymfeedback = sa.table(
+        'gymfeedback',
+        sa.column('id', sa.Integer()),
+        sa.column('session_id', sa.Integer()),
+        sa.column('athlete_id', sa.Integer()),
+        sa.column('performed_loads', sa.JSON()),
+    )
+    bind = op.get_bind()
+    capacities = {
+        session_id: _exercise_capacities(snapshot)
+        for session_id, snapshot in bind.execute(sa.select(gymsession.c.id, gymsession.c.exercises_snapshot))
+    }
+    entries = []
+    for feedback_id, session_id, athlete_id, performed_loads in bind.execute(sa.select(
+        gymfeedback.c.id, gymfeedback.c.session_id, gymfeedback.c.athlete_id, gymfeedback.c.performed_loads
+    )):
+        for entry in _build_load_entries(performed_loads, capacities.get(session_id, {}), session_id, athlete_id):
+            entries.append({**entry, 'feedback_id': feedback_id})
+    if entries:
+        op.bulk_insert(gymloadentry, entries)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_gymloadentry_feedback_id', table_name='gymloadentry')
+    op.drop_index('ix_gymloadentry_session_athlete', table_name='gymloadentry')
+    op.drop_index(op.f('ix_gymloadentry_id'), table_name='gymloadentry')
+    op.drop_table('gymloadentry')
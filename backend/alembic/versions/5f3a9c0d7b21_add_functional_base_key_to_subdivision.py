@@ -0,0 +1,59 @@
+"""Add normalized functional_base_key to trainingsubdivision
+
+Revision ID: 5f3a9c0d7b21
+Revises: 2b8d41c7e9a3
+Create Date: 2026-10-18 12:08:53.671904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f3a9c0d7b21'
+down_revision: Union[str, Sequence[str], None] = '2b8d41c7e9a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Frozen copy of app.models.training.normalize_functional_base as of this revision,
+# so later changes to the app function do not change what this migration backfills.
+def _normalize_functional_base(name):
+    """Matching key of a functional base or direction name ("Aeróbico A1" -> "aerobico_a1")."""
+    if not name:
+        return None
+    key = name.strip().lower().replace("á", "a").replace("é", "e").replace("ó", "o").replace(" ", "_")
+    return key or None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('trainingsubdivision', sa.Column('functional_base_key', sa.String(), nullable=True))
+    op.create_index(op.f('ix_trainingsubdivision_functional_base_key'), 'trainingsubdivision', ['functional_base_key'], unique=False)
+
+    # Backfill: one UPDATE per distinct functional base
+    trainingsubdivision = sa.table(
+        'trainingsubdivision',
+        sa.column('functional_base', sa.String()),
+        sa.column('functional_base_key', sa.String()),
+    )
+    bind = op.get_bind()
+    functional_bases = bind.execute(
+        sa.select(trainingsubdivision.c.functional_base).where(
+            trainingsubdivision.c.functional_base.isnot(None)
+        ).distinct()
+    ).scalars().all()
+    for functional_base in functional_bases:
+        bind.execute(
+            trainingsubdivision.update().where(
+                trainingsubdivision.c.functional_base == functional_base
+            ).values(functional_base_key=_normalize_functional_base(functional_base))
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_trainingsubdivision_functional_base_key'), table_name='trainingsubdivision')
+    op.drop_column('trainingsubdivision', 'functional_base_key')
@@ -0,0 +1,28 @@
+"""Add (athlete_id, date) index to assessment
+
+Revision ID: 7c1e5b9a2f40
+Revises: e0422dd3ca20
+Create Date: 2026-10-18 10:02:11.530742
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e5b9a2f40'
+down_revision: Union[str, Sequence[str], None] = 'e0422dd3ca20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_assessment_athlete_id_date', 'assessment', ['athlete_id', 'date'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_assessment_athlete_id_date', table_name='assessment')
@@ -0,0 +1,33 @@
+"""Add session-RPE load to dailytrainingrollup
+
+Existing rows keep NULL (read as 0) until the rollup is rebuilt with
+scripts/rebuild_daily_rollup.py.
+
+Revision ID: 9d2e6b4f1c83
+Revises: 5f3a9c0d7b21
+Create Date: 2026-10-18 14:21:37.402118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d2e6b4f1c83'
+down_revision: Union[str, Sequence[str], None] = '5f3a9c0d7b21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('dailytrainingrollup', sa.Column('rpe_load', sa.Float(), nullable=True))
+    op.add_column('dailytrainingrollup', sa.Column('rpe_athletes', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('dailytrainingrollup', 'rpe_athletes')
+    op.drop_column('dailytrainingrollup', 'rpe_load')
@@ -0,0 +1,28 @@
+"""Add (date, id) index to trainingsession
+
+Revision ID: a93c5e1d7f02
+Revises: c41f7a2d9e56
+Create Date: 2026-10-18 15:24:37.118409
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a93c5e1d7f02'
+down_revision: Union[str, Sequence[str], None] = 'c41f7a2d9e56'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_trainingsession_date_id', 'trainingsession', ['date', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_trainingsession_date_id', table_name='trainingsession')
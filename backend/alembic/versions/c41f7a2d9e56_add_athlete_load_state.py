@@ -0,0 +1,39 @@
+"""Add EWMA load state to athlete
+
+Run scripts/rebuild_daily_rollup.py afterwards to compute the averages from
+the existing feedbacks and wellness reports.
+
+Revision ID: c41f7a2d9e56
+Revises: 9d2e6b4f1c83
+Create Date: 2026-10-18 15:02:11.538064
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41f7a2d9e56'
+down_revision: Union[str, Sequence[str], None] = '9d2e6b4f1c83'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('athlete', sa.Column('chronic_load', sa.Float(), nullable=True))
+    op.add_column('athlete', sa.Column('load_updated_on', sa.Date(), nullable=True))
+    op.add_column('athlete', sa.Column('wellness_fatigue', sa.Float(), nullable=True))
+    op.add_column('athlete', sa.Column('wellness_updated_on', sa.Date(), nullable=True))
+    op.create_index(op.f('ix_athlete_fatigue_score'), 'athlete', ['fatigue_score'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_athlete_fatigue_score'), table_name='athlete')
+    op.drop_column('athlete', 'wellness_updated_on')
+    op.drop_column('athlete', 'wellness_fatigue')
+    op.drop_column('athlete', 'load_updated_on')
+    op.drop_column('athlete', 'chronic_load')
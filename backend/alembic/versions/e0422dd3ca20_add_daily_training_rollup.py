@@ -0,0 +1,59 @@
+"""Add daily training rollup table
+
+Revision ID: e0422dd3ca20
+Revises: 4af9e7e9ef69
+Create Date: 2026-10-18 09:12:40.118233
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e0422dd3ca20'
+down_revision: Union[str, Sequence[str], None] = '4af9e7e9ef69'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('dailytrainingrollup',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('kind', sa.String(), nullable=False),
+    sa.Column('category', sa.String(), nullable=True),
+    sa.Column('athlete_id', sa.Integer(), nullable=True),
+    sa.Column('planned_sessions', sa.Integer(), nullable=True),
+    sa.Column('planned_volume', sa.Float(), nullable=True),
+    sa.Column('ddr_volume', sa.Float(), nullable=True),
+    sa.Column('dcr_volume', sa.Float(), nullable=True),
+    sa.Column('functional_base_volumes', sa.JSON(), nullable=True),
+    sa.Column('er_weighted', sa.Float(), nullable=True),
+    sa.Column('er_distance', sa.Float(), nullable=True),
+    sa.Column('re_weighted', sa.Float(), nullable=True),
+    sa.Column('re_distance', sa.Float(), nullable=True),
+    sa.Column('completed_volume', sa.Float(), nullable=True),
+    sa.Column('completed_ddr_volume', sa.Float(), nullable=True),
+    sa.Column('completed_dcr_volume', sa.Float(), nullable=True),
+    sa.Column('gym_sessions', sa.Integer(), nullable=True),
+    sa.Column('gym_load', sa.Float(), nullable=True),
+    sa.Column('gym_capacity_loads', sa.JSON(), nullable=True),
+    sa.Column('feedback_count', sa.Integer(), nullable=True),
+    sa.Column('present_count', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['athlete_id'], ['athlete.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_dailytrainingrollup_id'), 'dailytrainingrollup', ['id'], unique=False)
+    op.create_index('ix_dailytrainingrollup_date_kind', 'dailytrainingrollup', ['date', 'kind'], unique=False)
+    op.create_index('ix_dailytrainingrollup_athlete_date', 'dailytrainingrollup', ['athlete_id', 'date'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_dailytrainingrollup_athlete_date', table_name='dailytrainingrollup')
+    op.drop_index('ix_dailytrainingrollup_date_kind', table_name='dailytrainingrollup')
+    op.drop_index(op.f('ix_dailytrainingrollup_id'), table_name='dailytrainingrollup')
+    op.drop_table('dailytrainingrollup')
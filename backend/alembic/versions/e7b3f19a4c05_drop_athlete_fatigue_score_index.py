@@ -0,0 +1,31 @@
+"""Drop the fatigue_score index from athlete
+
+The roster decays fatigue_score to today at read time, so the stored value
+cannot be filtered or sorted on in SQL and the index was never used.
+
+Revision ID: e7b3f19a4c05
+Revises: a93c5e1d7f02
+Create Date: 2026-10-18 18:41:07.302118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b3f19a4c05'
+down_revision: Union[str, Sequence[str], None] = 'a93c5e1d7f02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index(op.f('ix_athlete_fatigue_score'), table_name='athlete')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_athlete_fatigue_score'), 'athlete', ['fatigue_score'], unique=False)
@@ -1,7 +1,16 @@
 from fastapi import APIRouter
 from app.api.api_v1.endpoints import auth, users, athletes, cycles, training, gym, analytics, cycles_dashboard, home_dashboard
+from app.core.config import settings
 
 api_router = APIRouter()
+
+if settings.ASYNC_DB:
+    # Async hot endpoints go first so they take over the matching sync routes
+    # (left out of the schema, which keeps documenting the sync ones)
+    from app.api.api_v1.endpoints import cycles_dashboard_async, training_async
+    api_router.include_router(cycles_dashboard_async.router, prefix="/cycles", include_in_schema=False)
+    api_router.include_router(training_async.router, prefix="/training", include_in_schema=False)
+
 api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
 api_router.include_router(users.router, prefix="/users", tags=["users"])
 api_router.include_router(athletes.router, prefix="/athletes", tags=["athletes"])
@@ -5,6 +5,9 @@ from datetime import date
 
 from app import models, schemas
 from app.api import deps
+from app.services import athlete_load
+from app.services.body_weight import BodyWeightTimeline, sync_athlete_body_weight
+from app.services.dashboard_cache import invalidate_from_on_commit, invalidate_on_commit
 
 router = APIRouter()
 
@@ -31,15 +34,16 @@ def create_assessment(
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
     db_obj = models.Assessment(**assessment_in.dict())
+    db.add(db_obj)
     
-    # Auto-update athlete current weight if provided
+    # Auto-update athlete current weight (latest weighed assessment) if provided
     if assessment_in.weight:
-        athlete = db.query(models.Athlete).filter(models.Athlete.id == assessment_in.athlete_id).first()
-        if athlete:
-            athlete.body_weight = assessment_in.weight
-            db.add(athlete)
+        db.flush()
+        sync_athlete_body_weight(db, assessment_in.athlete_id)
+        # Relative loads read the weight as of each cycle's end: later cycles change too
+        invalidate_from_on_commit(db, {db_obj.date})
             
-    db.add(db_obj)
+    invalidate_on_commit(db, {db_obj.date})
     db.commit()
     db.refresh(db_obj)
     return db_obj
@@ -54,17 +58,18 @@ def create_assessments_bulk(
     db_objs = []
     for assessment_in in bulk_in.assessments:
         db_obj = models.Assessment(**assessment_in.dict())
-        
-        # Auto-update athlete current weight if provided
-        if assessment_in.weight:
-            athlete = db.query(models.Athlete).filter(models.Athlete.id == assessment_in.athlete_id).first()
-            if athlete:
-                athlete.body_weight = assessment_in.weight
-                db.add(athlete)
-        
         db.add(db_obj)
         db_objs.append(db_obj)
     
+    # Auto-update athletes current weight (latest weighed assessment) if provided
+    weighed_athlete_ids = {obj.athlete_id for obj in db_objs if obj.weight}
+    if weighed_athlete_ids:
+        db.flush()
+        for athlete_id in weighed_athlete_ids:
+            sync_athlete_body_weight(db, athlete_id)
+        invalidate_from_on_commit(db, {obj.date for obj in db_objs if obj.weight})
+    
+    invalidate_on_commit(db, {obj.date for obj in db_objs})
     db.commit()
     for obj in db_objs:
         db.refresh(obj)
@@ -83,16 +88,22 @@ def update_assessment(
         raise HTTPException(status_code=404, detail="Assessment not found")
     
     update_data = assessment_in.dict(exclude_unset=True)
-    if "weight" in update_data and update_data["weight"]:
-        athlete = db.query(models.Athlete).filter(models.Athlete.id == db_obj.athlete_id).first()
-        if athlete:
-            athlete.body_weight = update_data["weight"]
-            db.add(athlete)
 
+    previous_date = db_obj.date
+    previous_weight = db_obj.weight
     for field in update_data:
         setattr(db_obj, field, update_data[field])
     
     db.add(db_obj)
+    
+    # Keep athlete current weight in sync with the weight timeline
+    if "weight" in update_data or "date" in update_data:
+        db.flush()
+        sync_athlete_body_weight(db, db_obj.athlete_id)
+        if previous_weight or db_obj.weight:
+            invalidate_from_on_commit(db, {previous_date, db_obj.date})
+    
+    invalidate_on_commit(db, {previous_date, db_obj.date})
     db.commit()
     db.refresh(db_obj)
     return db_obj
@@ -108,9 +119,32 @@ def delete_assessment(
     if not obj:
         raise HTTPException(status_code=404, detail="Assessment not found")
     db.delete(obj)
+    if obj.weight:
+        db.flush()
+        sync_athlete_body_weight(db, obj.athlete_id)
+        invalidate_from_on_commit(db, {obj.date})
+    invalidate_on_commit(db, {obj.date})
     db.commit()
     return {"status": "success"}
 
+@router.get("/body-weights/")
+def read_body_weights(
+    db: Session = Depends(deps.get_db),
+    current_user: models.User = Depends(deps.get_current_active_user),
+    on_date: Optional[date] = Query(None, description="Reference date (defaults to today)"),
+    athlete_id: Optional[int] = None,
+) -> Any:
+    """
+    Body weight of every athlete (or one athlete) as of a date, from the assessment timeline.
+    Used to turn relative gym loads (% of body weight) into absolute prescriptions.
+    """
+    on_date = on_date or date.today()
+    timeline = BodyWeightTimeline.load(db, until=on_date, athlete_id=athlete_id)
+    return [
+        {"athlete_id": key, "weight": weight}
+        for key, weight in sorted(timeline.weights_at(on_date).items())
+    ]
+
 # --- Wellness ---
 
 @router.get("/wellness/", response_model=List[schemas.Wellness])
@@ -156,6 +190,8 @@ def create_wellness(
     
     db_obj = models.Wellness(**data)
     db.add(db_obj)
+    athlete_load.record_wellness(db, db_obj)
+    invalidate_on_commit(db, {db_obj.date})
     db.commit()
     db.refresh(db_obj)
     return db_obj
@@ -185,6 +221,11 @@ def create_wellness_bulk(
         db.add(db_obj)
         db_objs.append(db_obj)
     
+    # In date order, so each report is folded in O(1) unless it predates the athlete's last one
+    db.flush()
+    for obj in sorted(db_objs, key=lambda obj: (obj.date, obj.id)):
+        athlete_load.record_wellness(db, obj)
+    invalidate_on_commit(db, {obj.date for obj in db_objs})
     db.commit()
     for obj in db_objs:
         db.refresh(obj)
@@ -215,10 +256,18 @@ def update_wellness(
         valid_scores = [s for s in new_scores if s is not None]
         update_data["overall_score"] = sum(valid_scores) / len(valid_scores) if valid_scores else 0
 
+    previous_date = db_obj.date
+    previous_athlete_id = db_obj.athlete_id
     for field in update_data:
         setattr(db_obj, field, update_data[field])
     
     db.add(db_obj)
+    if update_data.keys() & {"fatigue_level", "date", "athlete_id"}:
+        for athlete_id in {previous_athlete_id, db_obj.athlete_id}:
+            athlete = db.get(models.Athlete, athlete_id)
+            if athlete:
+                athlete_load.recompute_wellness(db, athlete)
+    invalidate_on_commit(db, {previous_date, db_obj.date})
     db.commit()
     db.refresh(db_obj)
     return db_obj
@@ -1,9 +1,12 @@
-from typing import Any, List
+from datetime import date
+from typing import Any, List, Literal, Optional
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from app import models, schemas
 from app.api import deps
+from app.services import athlete_load
+from app.services.dashboard_cache import invalidate_all_on_commit
 
 router = APIRouter()
 
@@ -16,9 +19,15 @@ def read_athletes(
     search: str = None,
     category: str = None,
     status: str = None,
+    min_fatigue: Optional[float] = None,
+    max_fatigue: Optional[float] = None,
+    sort_by: Optional[Literal["name", "fatigue_score", "recent_load"]] = None,
+    sort_desc: bool = False,
 ) -> Any:
     """
     Retrieve athletes.
+    Load and fatigue are decayed to today at read time (nothing is written), so the
+    fatigue filters and load/fatigue sorting apply to the decayed values.
     """
     query = db.query(models.Athlete)
     
@@ -28,9 +37,31 @@ def read_athletes(
         query = query.filter(models.Athlete.category == category)
     if status:
         query = query.filter(models.Athlete.status == status)
-
-    athletes = query.offset(skip).limit(limit).all()
-    return athletes
+    if sort_by == "name":
+        columns = [models.Athlete.first_name, models.Athlete.last_name]
+        query = query.order_by(*[column.desc() if sort_desc else column for column in columns], models.Athlete.id)
+    
+    today = date.today()
+    if min_fatigue is None and max_fatigue is None and sort_by in (None, "name"):
+        return [athlete_as_of(athlete, today) for athlete in query.offset(skip).limit(limit)]
+
+    athletes = [athlete_as_of(athlete, today) for athlete in query.order_by(models.Athlete.id)]
+    if min_fatigue is not None:
+        athletes = [athlete for athlete in athletes if athlete.fatigue_score >= min_fatigue]
+    if max_fatigue is not None:
+        athletes = [athlete for athlete in athletes if athlete.fatigue_score <= max_fatigue]
+    if sort_by in ("fatigue_score", "recent_load"):
+        # Stable sort: ties keep the id order
+        athletes.sort(key=lambda athlete: getattr(athlete, sort_by), reverse=sort_desc)
+    return athletes[skip:skip + limit]
+
+
+def athlete_as_of(athlete: models.Athlete, today: date) -> schemas.Athlete:
+    """The athlete with load and fatigue decayed to `today`."""
+    load = athlete_load.load_as_of(athlete, today)
+    return schemas.Athlete.model_validate(athlete).model_copy(
+        update={"recent_load": load["recent_load"], "fatigue_score": load["fatigue_score"]}
+    )
 
 @router.post("/", response_model=schemas.Athlete)
 def create_athlete(
@@ -52,6 +83,7 @@ def create_athlete(
 
     db_obj = models.Athlete(**athlete_in.dict())
     db.add(db_obj)
+    invalidate_all_on_commit(db)
     db.commit()
     db.refresh(db_obj)
     return db_obj
@@ -151,7 +183,7 @@ def read_athlete(
     athlete = db.query(models.Athlete).filter(models.Athlete.id == id).first()
     if not athlete:
         raise HTTPException(status_code=404, detail="Athlete not found")
-    return athlete
+    return athlete_as_of(athlete, date.today())
 
 @router.put("/{id}", response_model=schemas.Athlete)
 def update_athlete(
@@ -173,6 +205,7 @@ def update_athlete(
         setattr(athlete, field, value)
     
     db.add(athlete)
+    invalidate_all_on_commit(db)
     db.commit()
     db.refresh(athlete)
     return athlete
@@ -192,5 +225,6 @@ def delete_athlete(
         raise HTTPException(status_code=404, detail="Athlete not found")
     
     db.delete(athlete)
+    invalidate_all_on_commit(db)
     db.commit()
     return athlete
@@ -1,25 +1,31 @@
 from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app import models, schemas
 from app.api import deps
+from app.db.loading import eager_load
+from app.db.query_budget import query_budget
+from app.services.dashboard_cache import invalidate_all_on_commit
 
 router = APIRouter()
 
 # --- Macro Cycle Endpoints ---
 
 @router.get("/macros/", response_model=List[schemas.MacroCycle])
+@query_budget(4)
 def read_macros(
     db: Session = Depends(deps.get_db),
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=500),
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
     Retrieve macro cycles (including nested mesos/micros).
     """
-    return db.query(models.MacroCycle).offset(skip).limit(limit).all()
+    return db.query(models.MacroCycle).options(
+        *eager_load((models.MacroCycle.mesos, models.MesoCycle.micros))
+    ).offset(skip).limit(limit).all()
 
 @router.post("/macros/", response_model=schemas.MacroCycle)
 def create_macro(
@@ -44,6 +50,7 @@ def create_macro(
     
     db_obj = models.MacroCycle(**macro_in.dict())
     db.add(db_obj)
+    invalidate_all_on_commit(db)
     db.commit()
     db.refresh(db_obj)
     return db_obj
@@ -59,6 +66,7 @@ def delete_macro(
     if not macro:
         raise HTTPException(status_code=404, detail="Macro cycle not found")
     db.delete(macro)
+    invalidate_all_on_commit(db)
     db.commit()
     return macro
 
@@ -96,6 +104,7 @@ def update_macro(
         setattr(macro, field, value)
     
     db.add(macro)
+    invalidate_all_on_commit(db)
     db.commit()
     db.refresh(macro)
     return macro
@@ -136,6 +145,7 @@ def create_meso(
 
     db_obj = models.MesoCycle(**meso_in.dict())
     db.add(db_obj)
+    invalidate_all_on_commit(db)
     db.commit()
     db.refresh(db_obj)
     return db_obj
@@ -151,6 +161,7 @@ def delete_meso(
     if not meso:
         raise HTTPException(status_code=404, detail="Meso cycle not found")
     db.delete(meso)
+    invalidate_all_on_commit(db)
     db.commit()
     return meso
 
@@ -195,6 +206,7 @@ def update_meso(
         setattr(meso, field, value)
     
     db.add(meso)
+    invalidate_all_on_commit(db)
     db.commit()
     db.refresh(meso)
     return meso
@@ -234,6 +246,7 @@ def create_micro(
 
     db_obj = models.MicroCycle(**micro_in.dict())
     db.add(db_obj)
+    invalidate_all_on_commit(db)
     db.commit()
     db.refresh(db_obj)
     return db_obj
@@ -249,6 +262,7 @@ def delete_micro(
     if not micro:
         raise HTTPException(status_code=404, detail="Micro cycle not found")
     db.delete(micro)
+    invalidate_all_on_commit(db)
     db.commit()
     return micro
 
@@ -292,6 +306,7 @@ def update_micro(
         setattr(micro, field, value)
     
     db.add(micro)
+    invalidate_all_on_commit(db)
     db.commit()
     db.refresh(micro)
     return micro
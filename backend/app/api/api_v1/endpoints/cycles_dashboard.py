@@ -1,11 +1,18 @@
-from typing import Any, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+import time
+from typing import Any, Callable, List, Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
-from datetime import date
+from sqlalchemy import func
+from datetime import date, timedelta
 
 from app import models, schemas
 from app.api import deps
+from app.db.query_budget import query_budget
+from app.services import daily_rollup, load_metrics
+from app.services.body_weight import BodyWeightTimeline
+from app.services.functional_direction import get_direction_matcher
+from app.services.dashboard_cache import dashboard_cache
+from app.services.dashboard_sections import run_sections, server_timing_header
 
 router = APIRouter()
 
@@ -15,59 +22,22 @@ def get_swimming_data(db: Session, start_date: date, end_date: date, athlete_id:
     
     Team view (no athlete): Total planned volume from all sessions.
     Athlete view: Volume from sessions where the athlete has attendance (SessionFeedback).
-    """
-    
-    if athlete_id:
-        # Get distinct session IDs where the athlete has feedback (attended)
-        attended_session_ids = db.query(models.SessionFeedback.session_id).filter(
-            models.SessionFeedback.athlete_id == athlete_id
-        ).distinct().subquery()
-        
-        # Get parent sessions that the athlete attended (via their executed clones)
-        sessions = db.query(models.TrainingSession).filter(
-            models.TrainingSession.date >= start_date,
-            models.TrainingSession.date <= end_date,
-            models.TrainingSession.parent_session_id.is_(None), # Only PLANNED sessions
-            models.TrainingSession.id.in_(
-                db.query(models.TrainingSession.parent_session_id).filter(
-                    models.TrainingSession.id.in_(attended_session_ids)
-                )
-            ) | models.TrainingSession.id.in_(attended_session_ids)
-        ).all()
-    else:
-        # Team view: all planned sessions
-        sessions = db.query(models.TrainingSession).filter(
-            models.TrainingSession.date >= start_date,
-            models.TrainingSession.date <= end_date,
-            models.TrainingSession.parent_session_id.is_(None)
-        ).all()
-    
-    total_volume = 0.0
-    ddr_volume = 0.0
-    dcr_volume = 0.0
-    
-    session_ids = set()
     
-    for session in sessions:
-        session_ids.add(session.id)
-        
-        # Calculate volume from series -> subdivisions
-        for series in session.series:
-            for subdiv in series.subdivisions:
-                volume = (subdiv.distance or 0) * (subdiv.reps or 0)
-                total_volume += volume
-                
-                if subdiv.type == "DDR":
-                    ddr_volume += volume
-                elif subdiv.type == "DCR":
-                    dcr_volume += volume
-    
-    total_sessions = len(session_ids)
+    Read from the daily rollup (see app/services/daily_rollup.py).
+    """
+    totals = daily_rollup.sum_rollup(db, daily_rollup.POOL, start_date, end_date, athlete_id)
+    return summarize_swimming(totals)
+
+
+def summarize_swimming(totals: dict) -> dict:
+    """Build the swimming section from summed pool rollup rows."""
+    total_volume = totals["planned_volume"]
+    total_sessions = totals["planned_sessions"]
     
     # Convert to km
     total_volume_km = total_volume / 1000
-    ddr_volume_km = ddr_volume / 1000
-    dcr_volume_km = dcr_volume / 1000
+    ddr_volume_km = totals["ddr_volume"] / 1000
+    dcr_volume_km = totals["dcr_volume"] / 1000
     
     # Average meters per session (based on plan)
     avg_per_session = total_volume / total_sessions if total_sessions > 0 else 0
@@ -88,35 +58,10 @@ def get_target_er_re(db: Session, start_date: date, end_date: date) -> dict:
     Weighted by subdivision distance (volume).
     Considers all sessions in the date range.
     """
-    sessions = db.query(models.TrainingSession).filter(
-        models.TrainingSession.date >= start_date,
-        models.TrainingSession.date <= end_date,
-        models.TrainingSession.parent_session_id.is_(None) # Only count PLANNED sessions
-    ).all()
-    
-    total_er_weighted = 0.0
-    total_er_distance = 0.0
-    
-    total_re_weighted = 0.0
-    total_re_distance = 0.0
-    
-    for session in sessions:
-        for series in session.series:
-            for subdiv in series.subdivisions:
-                dist = subdiv.distance or 0
-                if dist <= 0:
-                    continue
-                
-                if subdiv.da_er is not None:
-                    total_er_weighted += (subdiv.da_er * dist)
-                    total_er_distance += dist
-                
-                if subdiv.da_re is not None:
-                    total_re_weighted += (subdiv.da_re * dist)
-                    total_re_distance += dist
-    
-    avg_er = total_er_weighted / total_er_distance if total_er_distance > 0 else None
-    avg_re = total_re_weighted / total_re_distance if total_re_distance > 0 else None
+    totals = daily_rollup.sum_rollup(db, daily_rollup.POOL, start_date, end_date)
+    
+    avg_er = totals["er_weighted"] / totals["er_distance"] if totals["er_distance"] > 0 else None
+    avg_re = totals["re_weighted"] / totals["re_distance"] if totals["re_distance"] > 0 else None
     
     return {
         "target_er": round(avg_er, 2) if avg_er is not None else None,
@@ -124,80 +69,31 @@ def get_target_er_re(db: Session, start_date: date, end_date: date) -> dict:
     }
 
 
+# physicalMotorCapacity -> breakdown field (DDR / DCR categories)
+GYM_CAPACITY_FIELDS = {
+    "Força Explosiva": "ddr_explosive",
+    "Explosiva": "ddr_explosiva",
+    "Força Rápida": "ddr_fast",
+    "Resistência Força": "ddr_resistance",
+    "Força Máxima": "dcr_max",
+    "Força Resistiva": "dcr_resistive",
+}
+
+
 def get_gym_data(db: Session, start_date: date, end_date: date, athlete_id: Optional[int] = None, detailed: bool = False) -> dict:
     """Aggregate gym training data for a date range.
     
     Total Load is the ABSOLUTE SUM of all loads lifted by the team (or athlete).
     It is NOT an average per athlete anymore.
     """
-    
-    # DDR/DCR category mapping
-    DDR_TYPES = {"Força Explosiva", "Explosiva", "Força Rápida", "Resistência Força"}
-    DCR_TYPES = {"Força Máxima", "Força Resistiva"}
-    
-    # Initialize breakdown accumulators
-    ddr_explosive = 0.0  # Força Explosiva
-    ddr_explosiva = 0.0  # Explosiva (separate)
-    ddr_fast = 0.0
-    ddr_resistance = 0.0
-    dcr_max = 0.0
-    dcr_resistive = 0.0
-    
-    def get_exercise_capacity(session, exercise_name):
-        """Get physicalMotorCapacity for an exercise from session's exercises_snapshot."""
-        exercises = session.exercises_snapshot or []
-        for ex in exercises:
-            if ex.get("name") == exercise_name:
-                return ex.get("physicalMotorCapacity", "")
-        return ""
-    
-    def add_to_breakdown(capacity, load_sum):
-        nonlocal ddr_explosive, ddr_explosiva, ddr_fast, ddr_resistance, dcr_max, dcr_resistive
-        if capacity == "Força Explosiva":
-            ddr_explosive += load_sum
-        elif capacity == "Explosiva":
-            ddr_explosiva += load_sum
-        elif capacity == "Força Rápida":
-            ddr_fast += load_sum
-        elif capacity == "Resistência Força":
-            ddr_resistance += load_sum
-        elif capacity == "Força Máxima":
-            dcr_max += load_sum
-        elif capacity == "Força Resistiva":
-            dcr_resistive += load_sum
-    
-    # Common query for sessions in range
-    sessions = db.query(models.GymSession).filter(
-        models.GymSession.date >= start_date,
-        models.GymSession.date <= end_date
-    ).all()
-    
-    total_load = 0.0
-    sessions_with_feedback_count = 0
-    
-    for session in sessions:
-        session_has_relevant_feedback = False
-        
-        for feedback in session.feedbacks:
-            # Filter by athlete if requested
-            if athlete_id and feedback.athlete_id != int(athlete_id):
-                continue
-            
-            if feedback.performed_loads:
-                # Mark session as having feedback (for average calculation)
-                session_has_relevant_feedback = True
-                
-                # Sum loads
-                for exercise_name, loads in feedback.performed_loads.items():
-                    if isinstance(loads, list):
-                        load_sum = sum(loads)
-                        total_load += load_sum
-                        if detailed:
-                            capacity = get_exercise_capacity(session, exercise_name)
-                            add_to_breakdown(capacity, load_sum)
-        
-        if session_has_relevant_feedback:
-            sessions_with_feedback_count += 1
+    totals = daily_rollup.sum_rollup(db, daily_rollup.GYM, start_date, end_date, athlete_id)
+    return summarize_gym(totals, detailed)
+
+
+def summarize_gym(totals: dict, detailed: bool = False) -> dict:
+    """Build the gym section from summed gym rollup rows."""
+    total_load = totals["gym_load"]
+    sessions_with_feedback_count = totals["gym_sessions"]
     
     # Average load per realized session
     avg_load = total_load / sessions_with_feedback_count if sessions_with_feedback_count > 0 else 0
@@ -209,14 +105,9 @@ def get_gym_data(db: Session, start_date: date, end_date: date, athlete_id: Opti
     }
     
     if detailed:
-        result.update({
-            "ddr_explosive": round(ddr_explosive, 2),
-            "ddr_explosiva": round(ddr_explosiva, 2),
-            "ddr_resistance": round(ddr_resistance, 2),
-            "ddr_fast": round(ddr_fast, 2),
-            "dcr_max": round(dcr_max, 2),
-            "dcr_resistive": round(dcr_resistive, 2),
-        })
+        capacity_loads = totals["gym_capacity_loads"]
+        for capacity, field in GYM_CAPACITY_FIELDS.items():
+            result[field] = round(capacity_loads.get(capacity, 0.0), 2)
     
     return result
 
@@ -224,33 +115,58 @@ def get_gym_data(db: Session, start_date: date, end_date: date, athlete_id: Opti
 def get_athletes_data(db: Session, start_date: date, end_date: date, athlete_id: Optional[int] = None) -> dict:
     """Aggregate athlete metrics for a date range."""
     
-    # Get all active athletes
-    athletes_query = db.query(models.Athlete).filter(models.Athlete.status == "Active")
+    # First and last assessment in the range of every active athlete, ranked in SQL
+    assessment = models.Assessment
+    ranked = db.query(
+        assessment.athlete_id,
+        assessment.id,
+        assessment.weight,
+        assessment.jump_height,
+        assessment.throw_distance,
+        func.row_number().over(
+            partition_by=assessment.athlete_id,
+            order_by=(assessment.date.asc(), assessment.id.asc())
+        ).label("first_rank"),
+        func.row_number().over(
+            partition_by=assessment.athlete_id,
+            order_by=(assessment.date.desc(), assessment.id.desc())
+        ).label("last_rank"),
+    ).join(
+        models.Athlete, models.Athlete.id == assessment.athlete_id
+    ).filter(
+        models.Athlete.status == "Active",
+        assessment.date >= start_date,
+        assessment.date <= end_date
+    )
     if athlete_id:
-        athletes_query = athletes_query.filter(models.Athlete.id == athlete_id)
+        ranked = ranked.filter(assessment.athlete_id == athlete_id)
+    ranked = ranked.subquery()
     
-    athletes = athletes_query.all()
+    first_assessments = {}
+    last_assessments = {}
+    for row in db.query(ranked).filter((ranked.c.first_rank == 1) | (ranked.c.last_rank == 1)):
+        if row.first_rank == 1:
+            first_assessments[row.athlete_id] = row
+        if row.last_rank == 1:
+            last_assessments[row.athlete_id] = row
     
+    # Calculate attendance from session feedbacks (COUNT/SUM kept in the daily rollup)
+    totals = daily_rollup.sum_rollup(db, daily_rollup.POOL, start_date, end_date, athlete_id)
+    
+    return summarize_athletes(first_assessments, last_assessments, totals)
+
+
+def summarize_athletes(first_assessments: dict, last_assessments: dict, pool_totals: dict) -> dict:
+    """Athlete metrics from the first/last assessment of each athlete ({athlete_id: row}) and the pool totals."""
     improved_count = 0
     declined_count = 0
     weight_gained_count = 0
     weight_lost_count = 0
     
-    for athlete in athletes:
-        # Get first and last assessment in the range
-        first_assessment = db.query(models.Assessment).filter(
-            models.Assessment.athlete_id == athlete.id,
-            models.Assessment.date >= start_date,
-            models.Assessment.date <= end_date
-        ).order_by(models.Assessment.date.asc()).first()
-        
-        last_assessment = db.query(models.Assessment).filter(
-            models.Assessment.athlete_id == athlete.id,
-            models.Assessment.date >= start_date,
-            models.Assessment.date <= end_date
-        ).order_by(models.Assessment.date.desc()).first()
+    for athlete_key, first_assessment in first_assessments.items():
+        last_assessment = last_assessments[athlete_key]
         
-        if first_assessment and last_assessment and first_assessment.id != last_assessment.id:
+        if first_assessment.id != last_assessment.id:
             # Check weight change
             if first_assessment.weight and last_assessment.weight:
                 weight_diff = last_assessment.weight - first_assessment.weight
@@ -268,21 +184,8 @@ def get_athletes_data(db: Session, start_date: date, end_date: date, athlete_id:
             elif last_perf < first_perf:
                 declined_count += 1
     
-    # Calculate attendance from session feedbacks
-    total_feedbacks = db.query(models.SessionFeedback).join(
-        models.TrainingSession
-    ).filter(
-        models.TrainingSession.date >= start_date,
-        models.TrainingSession.date <= end_date
-    )
-    
-    if athlete_id:
-        total_feedbacks = total_feedbacks.filter(models.SessionFeedback.athlete_id == athlete_id)
-    
-    total_feedbacks = total_feedbacks.all()
-    
-    present_count = sum(1 for f in total_feedbacks if f.attendance == "Present")
-    attendance_rate = (present_count / len(total_feedbacks) * 100) if total_feedbacks else 0
+    feedback_count = pool_totals["feedback_count"]
+    attendance_rate = (pool_totals["present_count"] / feedback_count * 100) if feedback_count else 0
     
     return {
         "improved_count": improved_count,
@@ -304,8 +207,11 @@ def get_wellness_data(db: Session, start_date: date, end_date: date, athlete_id:
     if athlete_id:
         query = query.filter(models.Wellness.athlete_id == athlete_id)
     
-    wellness_records = query.all()
-    
+    return summarize_wellness(query.all())
+
+
+def summarize_wellness(wellness_records: list) -> dict:
+    """Average the wellness scores of a list of records."""
     if not wellness_records:
         return {
             "avg_sleep": None,
@@ -339,100 +245,31 @@ def get_functional_direction_data(db: Session, start_date: date, end_date: date,
     Considers all PLANNED subdivisions in the date range.
     """
     
-    # Get all configured functional directions from the system
-    configured_directions = db.query(models.ConfigFunctionalDirectionRange).all()
-    
-    # Initialize direction volumes with ONLY configured directions
-    direction_volumes: dict[str, float] = {}
-    direction_name_map: dict[str, str] = {}  # Maps normalized key to original name
-    
-    for config in configured_directions:
-        original_name = config.direction
-        normalized = original_name.lower().replace("á", "a").replace("é", "e").replace("ó", "o").replace(" ", "_")
-        direction_volumes[original_name] = 0.0
-        direction_name_map[normalized] = original_name
+    # Matcher compiled from the configured functional directions
+    matcher = get_direction_matcher(db)
     
-    # All athletes/team: all subdivisions from sessions in date range
-    subdivisions = db.query(models.TrainingSubdivision).join(
-        models.TrainingSeries
-    ).join(
-        models.TrainingSession
-    ).filter(
-        models.TrainingSession.date >= start_date,
-        models.TrainingSession.date <= end_date,
-        models.TrainingSession.parent_session_id.is_(None), # Only count PLANNED sessions
-        models.TrainingSubdivision.functional_base.isnot(None),
-        models.TrainingSubdivision.functional_base != ""
-    ).all()
-    
-    # Sum volume for each functional base
-    for subdiv in subdivisions:
-        fb = (subdiv.functional_base or "").strip()
-        if not fb:
-            continue
-            
-        volume = (subdiv.distance or 0) * (subdiv.reps or 0)
-        if volume <= 0:
-            continue
-        
-        # Normalize the functional base name for matching
-        fb_normalized = fb.lower().replace("á", "a").replace("é", "e").replace("ó", "o").replace(" ", "_")
-        
-        # Try to find a matching configured direction
-        matched = False
-        for normalized_key, original_name in direction_name_map.items():
-            if fb_normalized == normalized_key:
-                direction_volumes[original_name] += volume
-                matched = True
-                break
-        
-        # If no exact match, try pattern matching against configured directions
-        if not matched:
-            for normalized_key, original_name in direction_name_map.items():
-                # Check if the subdivision's functional_base contains the direction name
-                if normalized_key in fb_normalized or fb_normalized in normalized_key:
-                    direction_volumes[original_name] += volume
-                    break
+    # All athletes/team: planned volume per functional base key in date range
+    totals = daily_rollup.sum_rollup(db, daily_rollup.POOL, start_date, end_date)
     
-    return direction_volumes
+    return matcher.direction_volumes(totals["functional_base_volumes"])
 
 
-def calculate_relative_load(db: Session, start_date: date, end_date: date, total_load: float, athlete_id: Optional[int] = None) -> Optional[float]:
+def relative_load_from_timeline(
+    timeline: BodyWeightTimeline, end_date: date, total_load: float, athlete_id: Optional[int] = None
+) -> Optional[float]:
     """Calculate relative load (Total Load / Body Weight).
-    
+
     If athlete_id is provided: Load / Athlete's Weight.
-    If no athlete_id (Team): Total Team Load / Sum of weights of all Active athletes.
+    If no athlete_id (Team): Total Team Load / Sum of weights of the timeline's athletes.
+    Weights are the most recent assessment up to end_date.
     """
     if total_load <= 0:
         return None
 
-    total_weight = 0.0
-    
     if athlete_id:
-        # Specific athlete weight
-        assessment = db.query(models.Assessment).filter(
-            models.Assessment.athlete_id == athlete_id,
-            models.Assessment.date <= end_date, # Use most recent relative to cycle end
-            models.Assessment.weight.isnot(None)
-        ).order_by(models.Assessment.date.desc()).first()
-        
-        if assessment and assessment.weight:
-            total_weight = assessment.weight
+        total_weight = timeline.weight_at(athlete_id, end_date) or 0.0
     else:
-        # Team weight (Sum of all active athletes' latest weight)
-        # 1. Get all active athletes
-        active_athletes = db.query(models.Athlete).filter(models.Athlete.status == "Active").all()
-        
-        for athlete in active_athletes:
-            # Get latest weight for each athlete
-            assessment = db.query(models.Assessment).filter(
-                models.Assessment.athlete_id == athlete.id,
-                models.Assessment.date <= end_date,
-                models.Assessment.weight.isnot(None)
-            ).order_by(models.Assessment.date.desc()).first()
-            
-            if assessment and assessment.weight:
-                total_weight += assessment.weight
+        total_weight = sum(weight for weight in timeline.weights_at(end_date).values() if weight)
 
     if total_weight > 0:
         return round(total_load / total_weight, 2)
@@ -440,10 +277,370 @@ def calculate_relative_load(db: Session, start_date: date, end_date: date, total
     return None
 
 
+def cycle_dashboard_sections(level: str, start_date: date, end_date: date, athlete_id: Optional[int] = None) -> dict:
+    """Independent read sections of a macro/meso/micro dashboard ({name: fn(db)})."""
+    sections = {
+        "swimming": lambda s: get_swimming_data(s, start_date, end_date, athlete_id),
+        "gym": lambda s: get_gym_data(s, start_date, end_date, athlete_id, detailed=True),
+        "athletes": lambda s: get_athletes_data(s, start_date, end_date, athlete_id),
+        "wellness": lambda s: get_wellness_data(s, start_date, end_date, athlete_id),
+        "body_weight": lambda s: BodyWeightTimeline.load(
+            s, until=end_date, athlete_id=athlete_id, active_only=not athlete_id
+        ),
+    }
+    if level in ("meso", "micro"):
+        sections["functional_direction"] = lambda s: get_functional_direction_data(s, start_date, end_date, athlete_id)
+    if level == "meso":
+        sections["target_er_re"] = lambda s: get_target_er_re(s, start_date, end_date)
+    return sections
+
+
+def assemble_cycle_dashboard(level: str, sections: dict, end_date: date, athlete_id: Optional[int] = None) -> dict:
+    """Merge evaluated sections into the macro/meso/micro dashboard payload."""
+    dashboard = {
+        "swimming": sections["swimming"],
+        "gym": sections["gym"],
+        "athletes": sections["athletes"],
+        "wellness": sections["wellness"],
+    }
+    if level == "macro":
+        dashboard["results"] = {}
+    if "functional_direction" in sections:
+        dashboard["functional_direction"] = sections["functional_direction"]
+    if "target_er_re" in sections:
+        dashboard["target_er"] = sections["target_er_re"]["target_er"]
+        dashboard["target_re"] = sections["target_er_re"]["target_re"]
+    dashboard["relative_load"] = relative_load_from_timeline(
+        sections["body_weight"], end_date, sections["gym"]["total_load"], athlete_id
+    )
+    return dashboard
+
+
+def build_cycle_dashboard(
+    db: Session,
+    level: str,
+    cycle: Any,
+    athlete_id: Optional[int] = None,
+    timings: Optional[dict] = None,
+) -> dict:
+    sections = run_sections(db, cycle_dashboard_sections(level, cycle.start_date, cycle.end_date, athlete_id), timings)
+    return assemble_cycle_dashboard(level, sections, cycle.end_date, athlete_id)
+
+
+def build_macro_dashboard(db: Session, macro: models.MacroCycle, timings: Optional[dict] = None) -> dict:
+    return build_cycle_dashboard(db, "macro", macro, timings=timings)
+
+
+def build_meso_dashboard(db: Session, meso: models.MesoCycle, timings: Optional[dict] = None) -> dict:
+    return build_cycle_dashboard(db, "meso", meso, timings=timings)
+
+
+def build_micro_dashboard(
+    db: Session,
+    micro: models.MicroCycle,
+    athlete_id: Optional[int] = None,
+    timings: Optional[dict] = None,
+) -> dict:
+    return build_cycle_dashboard(db, "micro", micro, athlete_id, timings)
+
+
+def build_micro_dashboards(db: Session, meso: models.MesoCycle, micros: list, athlete_id: Optional[int] = None) -> dict:
+    """Build the dashboard of every micro in a meso with one scan of the meso range.
+    
+    Swimming, gym, attendance, assessments, wellness and functional direction data
+    are fetched once for the whole meso and bucketed by day into each micro, so the
+    number of queries does not depend on the number of micros. Returns {micro_id: dashboard}.
+    """
+    pool_days = daily_rollup.sum_rollup_by_day(db, daily_rollup.POOL, meso.start_date, meso.end_date, athlete_id)
+    gym_days = daily_rollup.sum_rollup_by_day(db, daily_rollup.GYM, meso.start_date, meso.end_date, athlete_id)
+    
+    # Functional direction is a team metric (same as the single micro dashboard)
+    team_pool_days = pool_days if not athlete_id else daily_rollup.sum_rollup_by_day(
+        db, daily_rollup.POOL, meso.start_date, meso.end_date
+    )
+    matcher = get_direction_matcher(db)
+    
+    wellness_query = db.query(models.Wellness).filter(
+        models.Wellness.date >= meso.start_date,
+        models.Wellness.date <= meso.end_date
+    )
+    if athlete_id:
+        wellness_query = wellness_query.filter(models.Wellness.athlete_id == athlete_id)
+    wellness_records = wellness_query.all()
+    
+    # Assessments of active athletes in the meso, in (date, id) order: the first and
+    # last of each athlete inside a micro are its first and last rows in that micro
+    assessment_query = db.query(
+        models.Assessment.athlete_id,
+        models.Assessment.id,
+        models.Assessment.date,
+        models.Assessment.weight,
+        models.Assessment.jump_height,
+        models.Assessment.throw_distance,
+    ).join(
+        models.Athlete, models.Athlete.id == models.Assessment.athlete_id
+    ).filter(
+        models.Athlete.status == "Active",
+        models.Assessment.date >= meso.start_date,
+        models.Assessment.date <= meso.end_date
+    )
+    if athlete_id:
+        assessment_query = assessment_query.filter(models.Assessment.athlete_id == athlete_id)
+    assessments = assessment_query.order_by(models.Assessment.date, models.Assessment.id).all()
+    
+    # One weight timeline for the whole meso instead of a lookup per micro
+    timeline = BodyWeightTimeline.load(db, until=meso.end_date, athlete_id=athlete_id, active_only=not athlete_id)
+    
+    def in_micro(days: dict, micro: models.MicroCycle) -> list:
+        return [totals for day, totals in days.items() if micro.start_date <= day <= micro.end_date]
+    
+    dashboards = {}
+    for micro in micros:
+        pool_totals = daily_rollup.combine_totals(daily_rollup.POOL, in_micro(pool_days, micro))
+        team_pool_totals = daily_rollup.combine_totals(daily_rollup.POOL, in_micro(team_pool_days, micro))
+        gym = summarize_gym(daily_rollup.combine_totals(daily_rollup.GYM, in_micro(gym_days, micro)), detailed=True)
+        
+        first_assessments, last_assessments = {}, {}
+        for row in assessments:
+            if micro.start_date <= row.date <= micro.end_date:
+                first_assessments.setdefault(row.athlete_id, row)
+                last_assessments[row.athlete_id] = row
+        
+        dashboards[micro.id] = {
+            "swimming": summarize_swimming(pool_totals),
+            "gym": gym,
+            "athletes": summarize_athletes(first_assessments, last_assessments, pool_totals),
+            "wellness": summarize_wellness([
+                w for w in wellness_records if micro.start_date <= w.date <= micro.end_date
+            ]),
+            "functional_direction": matcher.direction_volumes(team_pool_totals["functional_base_volumes"]),
+            "relative_load": relative_load_from_timeline(timeline, micro.end_date, gym["total_load"], athlete_id),
+        }
+    
+    return dashboards
+
+
+def build_squad_dashboard(db: Session, start_date: date, end_date: date) -> dict:
+    """Per-athlete matrix (swimming, gym, relative load, attendance, wellness) for a date range.
+    
+    Every metric comes from one GROUP BY athlete_id query, so the cost does
+    not depend on the roster size.
+    """
+    athletes = db.query(models.Athlete).filter(
+        models.Athlete.status == "Active"
+    ).order_by(models.Athlete.first_name, models.Athlete.last_name).all()
+    
+    pool_totals = daily_rollup.sum_rollup_by_athlete(db, daily_rollup.POOL, start_date, end_date)
+    gym_totals = daily_rollup.sum_rollup_by_athlete(db, daily_rollup.GYM, start_date, end_date)
+    
+    wellness_averages = {
+        athlete_id: averages
+        for athlete_id, *averages in db.query(
+            models.Wellness.athlete_id,
+            func.avg(models.Wellness.sleep_quality),
+            func.avg(models.Wellness.fatigue_level),
+            func.avg(models.Wellness.stress_level),
+            func.avg(models.Wellness.muscle_soreness),
+        ).filter(
+            models.Wellness.date >= start_date,
+            models.Wellness.date <= end_date
+        ).group_by(models.Wellness.athlete_id)
+    }
+    
+    # Latest weight of each athlete up to the end of the range
+    weights = BodyWeightTimeline.load(db, until=end_date, active_only=True).weights_at(end_date)
+    
+    empty_pool = {field: 0 for field in daily_rollup.ROLLUP_SUM_FIELDS}
+    rows = []
+    for athlete in athletes:
+        pool = pool_totals.get(athlete.id, empty_pool)
+        gym = summarize_gym(gym_totals.get(athlete.id, empty_pool))
+        
+        weight = weights.get(athlete.id)
+        relative_load = round(gym["total_load"] / weight, 2) if gym["total_load"] > 0 and weight and weight > 0 else None
+        
+        averages = wellness_averages.get(athlete.id, [None] * 4)
+        sleep, fatigue, stress, soreness = [round(float(v), 1) if v is not None else None for v in averages]
+        
+        rows.append({
+            "athlete_id": athlete.id,
+            "name": athlete.name,
+            "category": athlete.category,
+            "swimming": summarize_swimming(pool),
+            "gym": gym,
+            "relative_load": relative_load,
+            "average_attendance": round(
+                pool["present_count"] / pool["feedback_count"] * 100 if pool["feedback_count"] else 0, 2
+            ),
+            "wellness": {
+                "avg_sleep": sleep,
+                "avg_fatigue": fatigue,
+                "avg_stress": stress,
+                "avg_muscle_soreness": soreness,
+            },
+        })
+    
+    return {
+        "start_date": start_date,
+        "end_date": end_date,
+        "athletes": rows,
+    }
+
+
+TimeseriesMetric = Literal["rpe_load", "planned_volume", "completed_volume", "gym_load"]
+
+
+def timeseries_window(start_date: date, end_date: date) -> tuple:
+    """Dates fetched for a time series: the range plus the chronic ACWR warm-up before it."""
+    return start_date - timedelta(days=load_metrics.CHRONIC_DAYS - 1), end_date
+
+
+def build_timeseries(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    athlete_id: Optional[int] = None,
+    metric: str = "rpe_load",
+) -> dict:
+    """Daily and weekly (7-day blocks from start_date) load series with ACWR, monotony and strain.
+    
+    All days come from one GROUP BY over the daily rollup; the rolling metrics are
+    computed from prefix sums of the selected metric (see app/services/load_metrics.py).
+    """
+    fetch_start, _ = timeseries_window(start_date, end_date)
+    rows = daily_rollup.sum_rollup_series(
+        db, fetch_start, end_date,
+        ("planned_volume", "completed_volume", "rpe_load", "rpe_athletes", "gym_load"),
+        athlete_id
+    )
+    
+    dates = [fetch_start + timedelta(days=offset) for offset in range((end_date - fetch_start).days + 1)]
+    empty: dict = {}
+    pool = [rows.get((daily_rollup.POOL, day), empty) for day in dates]
+    gym = [rows.get((daily_rollup.GYM, day), empty) for day in dates]
+    
+    def rpe_load(totals: dict) -> float:
+        load = totals.get("rpe_load", 0) or 0
+        if athlete_id:
+            return load
+        # Team: average load of the athletes who reported an RPE
+        athletes = totals.get("rpe_athletes", 0) or 0
+        return load / athletes if athletes else 0.0
+    
+    series = {
+        "planned_volume": [(totals.get("planned_volume", 0) or 0) / 1000 for totals in pool],
+        "completed_volume": [(totals.get("completed_volume", 0) or 0) / 1000 for totals in pool],
+        "rpe_load": [rpe_load(totals) for totals in pool],
+        "gym_load": [totals.get("gym_load", 0) or 0 for totals in gym],
+    }
+    loads = series[metric]
+    acwr = load_metrics.acwr_series(loads)
+    sums = load_metrics.prefix_sums(loads)
+    square_sums = load_metrics.square_prefix_sums(loads)
+    field_sums = {field: load_metrics.prefix_sums(values) for field, values in series.items()}
+    
+    def optional_round(value: Optional[float]) -> Optional[float]:
+        return round(value, 2) if value is not None else None
+    
+    offset = len(dates) - ((end_date - start_date).days + 1)
+    days = [
+        {
+            "date": dates[i],
+            "planned_volume": round(series["planned_volume"][i], 2),
+            "completed_volume": round(series["completed_volume"][i], 2),
+            "gym_load": round(series["gym_load"][i], 2),
+            "rpe_load": round(series["rpe_load"][i], 2),
+            "acwr": optional_round(acwr[i]),
+        }
+        for i in range(offset, len(dates))
+    ]
+    
+    weeks = []
+    for week, week_start in enumerate(range(offset, len(dates), 7), start=1):
+        week_end = min(week_start + 7, len(dates))
+        totals = {field: prefix[week_end] - prefix[week_start] for field, prefix in field_sums.items()}
+        load, monotony, strain = load_metrics.window_monotony_strain(sums, square_sums, week_start, week_end)
+        weeks.append({
+            "week": week,
+            "start_date": dates[week_start],
+            "end_date": dates[week_end - 1],
+            "planned_volume": round(totals["planned_volume"], 2),
+            "completed_volume": round(totals["completed_volume"], 2),
+            "gym_load": round(totals["gym_load"], 2),
+            "rpe_load": round(totals["rpe_load"], 2),
+            "load": round(load, 2),
+            "acwr": optional_round(acwr[week_end - 1]),
+            "monotony": optional_round(monotony),
+            "strain": optional_round(strain),
+        })
+    
+    return {"athlete_id": athlete_id, "metric": metric, "days": days, "weeks": weeks}
+
+
+def get_cached_dashboard(
+    level: str,
+    cycle: Any,
+    athlete_id: Optional[int],
+    build: Callable[[], dict],
+    response: Optional[Response] = None,
+    timings: Optional[dict] = None,
+) -> dict:
+    """Serve a cycle dashboard from the cache, computing and storing it on a miss.
+    
+    When a response is given, a Server-Timing header reports the cache outcome and,
+    on a miss, the duration of each section filled into `timings` by the build.
+    """
+    key = (level, cycle.id, athlete_id)
+    cached = lookup_cached_dashboard(key, cycle, response)
+    if cached is not None:
+        return cached
+    
+    generation = dashboard_cache.generation
+    started = time.perf_counter()
+    result = build()
+    store_cached_dashboard(key, cycle, result, generation, started, response, timings)
+    return result
+
+
+def lookup_cached_dashboard(key: tuple, cycle: Any, response: Optional[Response] = None) -> Optional[dict]:
+    cached = dashboard_cache.get(key, cycle.start_date, cycle.end_date)
+    if cached is not None and response is not None:
+        response.headers.append("Server-Timing", 'cache;desc="hit"')
+    return cached
+
+
+def store_cached_dashboard(
+    key: tuple,
+    cycle: Any,
+    result: dict,
+    generation: int,
+    started: float,
+    response: Optional[Response] = None,
+    timings: Optional[dict] = None,
+) -> None:
+    dashboard_cache.set(key, result, cycle.start_date, cycle.end_date, generation)
+    if response is not None:
+        section_timings = dict(timings or {})
+        section_timings["total"] = (time.perf_counter() - started) * 1000
+        response.headers.append("Server-Timing", 'cache;desc="miss", ' + server_timing_header(section_timings))
+
+
+@router.get("/dashboard-cache/stats")
+def get_dashboard_cache_stats(
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Hit/miss counters of the dashboard cache.
+    """
+    return dashboard_cache.stats()
+
+
 @router.get("/macros/{id}/dashboard", response_model=schemas.MacroDashboardResponse)
+@query_budget(11)
 def get_macro_dashboard(
     *,
     db: Session = Depends(deps.get_db),
+    response: Response,
     id: int,
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
@@ -454,27 +651,20 @@ def get_macro_dashboard(
     if not macro:
         raise HTTPException(status_code=404, detail="Macro cycle not found")
     
-    swimming = get_swimming_data(db, macro.start_date, macro.end_date)
-    gym = get_gym_data(db, macro.start_date, macro.end_date, detailed=True)
-    athletes = get_athletes_data(db, macro.start_date, macro.end_date)
-    wellness = get_wellness_data(db, macro.start_date, macro.end_date)
-    
-    relative_load = calculate_relative_load(db, macro.start_date, macro.end_date, gym["total_load"])
-    
-    return {
-        "swimming": swimming,
-        "gym": gym,
-        "athletes": athletes,
-        "wellness": wellness,
-        "results": {},
-        "relative_load": relative_load,
-    }
+    timings: dict = {}
+    return get_cached_dashboard(
+        "macro", macro, None,
+        lambda: build_macro_dashboard(db, macro, timings=timings),
+        response, timings
+    )
 
 
 @router.get("/mesos/{id}/dashboard", response_model=schemas.MesoDashboardResponse)
+@query_budget(16)
 def get_meso_dashboard(
     *,
     db: Session = Depends(deps.get_db),
+    response: Response,
     id: int,
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
@@ -485,31 +675,20 @@ def get_meso_dashboard(
     if not meso:
         raise HTTPException(status_code=404, detail="Meso cycle not found")
     
-    swimming = get_swimming_data(db, meso.start_date, meso.end_date)
-    gym = get_gym_data(db, meso.start_date, meso.end_date, detailed=True)
-    athletes = get_athletes_data(db, meso.start_date, meso.end_date)
-    wellness = get_wellness_data(db, meso.start_date, meso.end_date)
-    functional_direction = get_functional_direction_data(db, meso.start_date, meso.end_date, None)
-    target_er_re = get_target_er_re(db, meso.start_date, meso.end_date)
-    
-    relative_load = calculate_relative_load(db, meso.start_date, meso.end_date, gym["total_load"])
-    
-    return {
-        "swimming": swimming,
-        "gym": gym,
-        "athletes": athletes,
-        "wellness": wellness,
-        "functional_direction": functional_direction,
-        "target_er": target_er_re["target_er"],
-        "target_re": target_er_re["target_re"],
-        "relative_load": relative_load,
-    }
+    timings: dict = {}
+    return get_cached_dashboard(
+        "meso", meso, None,
+        lambda: build_meso_dashboard(db, meso, timings=timings),
+        response, timings
+    )
 
 
 @router.get("/micros/{id}/dashboard", response_model=schemas.MicroDashboardResponse)
+@query_budget(14)
 def get_micro_dashboard(
     *,
     db: Session = Depends(deps.get_db),
+    response: Response,
     id: int,
     athlete_id: Optional[int] = Query(None, description="Filter by specific athlete ID"),
     current_user: models.User = Depends(deps.get_current_active_user),
@@ -522,19 +701,149 @@ def get_micro_dashboard(
     if not micro:
         raise HTTPException(status_code=404, detail="Micro cycle not found")
     
-    swimming = get_swimming_data(db, micro.start_date, micro.end_date, athlete_id)
-    gym = get_gym_data(db, micro.start_date, micro.end_date, athlete_id, detailed=True)
-    athletes = get_athletes_data(db, micro.start_date, micro.end_date, athlete_id)
-    wellness = get_wellness_data(db, micro.start_date, micro.end_date, athlete_id)
-    functional_direction = get_functional_direction_data(db, micro.start_date, micro.end_date, athlete_id)
+    timings: dict = {}
+    return get_cached_dashboard(
+        "micro", micro, athlete_id,
+        lambda: build_micro_dashboard(db, micro, athlete_id, timings),
+        response, timings
+    )
+
+
+@router.get("/mesos/{id}/micros/dashboard", response_model=List[schemas.MicroDashboardItem])
+@query_budget(10)
+def get_meso_micros_dashboard(
+    *,
+    db: Session = Depends(deps.get_db),
+    id: int,
+    athlete_id: Optional[int] = Query(None, description="Filter by specific athlete ID"),
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Get the dashboard of every micro cycle in a meso cycle in one call.
+    Each item carries the same payload as /micros/{id}/dashboard.
+    """
+    meso = db.query(models.MesoCycle).filter(models.MesoCycle.id == id).first()
+    if not meso:
+        raise HTTPException(status_code=404, detail="Meso cycle not found")
+    
+    micros = db.query(models.MicroCycle).filter(
+        models.MicroCycle.meso_id == meso.id
+    ).order_by(models.MicroCycle.start_date).all()
+    
+    # Reuse cached micro dashboards; rebuild all of them in one pass on any miss
+    dashboards = {}
+    for micro in micros:
+        cached = dashboard_cache.get(("micro", micro.id, athlete_id), micro.start_date, micro.end_date)
+        if cached is None:
+            dashboards = {}
+            break
+        dashboards[micro.id] = cached
+    
+    if micros and not dashboards:
+        generation = dashboard_cache.generation
+        dashboards = build_micro_dashboards(db, meso, micros, athlete_id)
+        for micro in micros:
+            dashboard_cache.set(
+                ("micro", micro.id, athlete_id), dashboards[micro.id], micro.start_date, micro.end_date, generation
+            )
+    
+    return [
+        {
+            "micro_id": micro.id,
+            "name": micro.name,
+            "start_date": micro.start_date,
+            "end_date": micro.end_date,
+            "dashboard": dashboards[micro.id],
+        }
+        for micro in micros
+    ]
+
+
+@router.get("/macros/{id}/timeseries", response_model=schemas.MacroTimeseriesResponse)
+@query_budget(3)
+def get_macro_timeseries(
+    *,
+    db: Session = Depends(deps.get_db),
+    id: int,
+    athlete_id: Optional[int] = Query(None, description="Filter by specific athlete ID"),
+    metric: TimeseriesMetric = Query("rpe_load", description="Load used for ACWR, monotony and strain"),
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Get daily and weekly load of a macro cycle (planned/executed volume, gym load,
+    session-RPE load) with acute:chronic workload ratio, monotony and strain.
+    """
+    macro = db.query(models.MacroCycle).filter(models.MacroCycle.id == id).first()
+    if not macro:
+        raise HTTPException(status_code=404, detail="Macro cycle not found")
+    
+    # Cached over the fetched range so writes in the ACWR warm-up also invalidate it
+    key = ("macro-timeseries", macro.id, athlete_id, metric)
+    fetch_start, fetch_end = timeseries_window(macro.start_date, macro.end_date)
+    result = dashboard_cache.get(key, fetch_start, fetch_end)
+    if result is None:
+        generation = dashboard_cache.generation
+        result = build_timeseries(db, macro.start_date, macro.end_date, athlete_id, metric)
+        result["macro_id"] = macro.id
+        dashboard_cache.set(key, result, fetch_start, fetch_end, generation)
+    return result
+
+
+@router.get("/macros/{id}/squad", response_model=schemas.SquadDashboardResponse)
+@query_budget(7)
+def get_macro_squad_dashboard(
+    *,
+    db: Session = Depends(deps.get_db),
+    id: int,
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Get per-athlete metrics of the macro cycle for squad comparison.
+    """
+    macro = db.query(models.MacroCycle).filter(models.MacroCycle.id == id).first()
+    if not macro:
+        raise HTTPException(status_code=404, detail="Macro cycle not found")
     
-    relative_load = calculate_relative_load(db, micro.start_date, micro.end_date, gym["total_load"], athlete_id)
+    return get_cached_dashboard(
+        "macro-squad", macro, None, lambda: build_squad_dashboard(db, macro.start_date, macro.end_date)
+    )
+
+
+@router.get("/mesos/{id}/squad", response_model=schemas.SquadDashboardResponse)
+@query_budget(7)
+def get_meso_squad_dashboard(
+    *,
+    db: Session = Depends(deps.get_db),
+    id: int,
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Get per-athlete metrics of the meso cycle for squad comparison.
+    """
+    meso = db.query(models.MesoCycle).filter(models.MesoCycle.id == id).first()
+    if not meso:
+        raise HTTPException(status_code=404, detail="Meso cycle not found")
     
-    return {
-        "swimming": swimming,
-        "gym": gym,
-        "athletes": athletes,
-        "wellness": wellness,
-        "functional_direction": functional_direction,
-        "relative_load": relative_load,
-    }
+    return get_cached_dashboard(
+        "meso-squad", meso, None, lambda: build_squad_dashboard(db, meso.start_date, meso.end_date)
+    )
+
+
+@router.get("/micros/{id}/squad", response_model=schemas.SquadDashboardResponse)
+@query_budget(7)
+def get_micro_squad_dashboard(
+    *,
+    db: Session = Depends(deps.get_db),
+    id: int,
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Get per-athlete metrics of the micro cycle for squad comparison.
+    """
+    micro = db.query(models.MicroCycle).filter(models.MicroCycle.id == id).first()
+    if not micro:
+        raise HTTPException(status_code=404, detail="Micro cycle not found")
+    
+    return get_cached_dashboard(
+        "micro-squad", micro, None, lambda: build_squad_dashboard(db, micro.start_date, micro.end_date)
+    )
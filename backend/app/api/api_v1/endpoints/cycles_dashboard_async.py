@@ -0,0 +1,107 @@
+"""
+Async versions of the cycle dashboards (enabled with ASYNC_DB).
+
+Same payloads and cache as cycles_dashboard.py; the sections run concurrently,
+each on its own AsyncSession.
+"""
+import time
+from typing import Any, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import models, schemas
+from app.api import deps
+from app.db.query_budget import query_budget
+from app.api.api_v1.endpoints.cycles_dashboard import (
+    assemble_cycle_dashboard,
+    cycle_dashboard_sections,
+    lookup_cached_dashboard,
+    store_cached_dashboard,
+)
+from app.services.dashboard_cache import dashboard_cache
+from app.services.dashboard_sections import run_sections_async
+
+router = APIRouter()
+
+
+async def get_cached_dashboard_async(
+    db: AsyncSession,
+    level: str,
+    cycle: Any,
+    athlete_id: Optional[int],
+    response: Response,
+) -> dict:
+    """Serve a cycle dashboard from the cache, building its sections concurrently on a miss."""
+    key = (level, cycle.id, athlete_id)
+    cached = lookup_cached_dashboard(key, cycle, response)
+    if cached is not None:
+        return cached
+
+    generation = dashboard_cache.generation
+    started = time.perf_counter()
+    timings: dict = {}
+    sections = await run_sections_async(
+        cycle_dashboard_sections(level, cycle.start_date, cycle.end_date, athlete_id), timings, db
+    )
+    result = assemble_cycle_dashboard(level, sections, cycle.end_date, athlete_id)
+    store_cached_dashboard(key, cycle, result, generation, started, response, timings)
+    return result
+
+
+@router.get("/macros/{id:int}/dashboard", response_model=schemas.MacroDashboardResponse)
+@query_budget(11)
+async def get_macro_dashboard(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    response: Response,
+    id: int,
+    current_user: models.User = Depends(deps.get_current_active_user_async),
+) -> Any:
+    """
+    Get aggregated dashboard data for a macro cycle.
+    """
+    macro = await db.get(models.MacroCycle, id)
+    if not macro:
+        raise HTTPException(status_code=404, detail="Macro cycle not found")
+
+    return await get_cached_dashboard_async(db, "macro", macro, None, response)
+
+
+@router.get("/mesos/{id:int}/dashboard", response_model=schemas.MesoDashboardResponse)
+@query_budget(16)
+async def get_meso_dashboard(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    response: Response,
+    id: int,
+    current_user: models.User = Depends(deps.get_current_active_user_async),
+) -> Any:
+    """
+    Get aggregated dashboard data for a meso cycle.
+    """
+    meso = await db.get(models.MesoCycle, id)
+    if not meso:
+        raise HTTPException(status_code=404, detail="Meso cycle not found")
+
+    return await get_cached_dashboard_async(db, "meso", meso, None, response)
+
+
+@router.get("/micros/{id:int}/dashboard", response_model=schemas.MicroDashboardResponse)
+@query_budget(14)
+async def get_micro_dashboard(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    response: Response,
+    id: int,
+    athlete_id: Optional[int] = Query(None, description="Filter by specific athlete ID"),
+    current_user: models.User = Depends(deps.get_current_active_user_async),
+) -> Any:
+    """
+    Get aggregated dashboard data for a micro cycle.
+    Optionally filter by athlete_id for individual view.
+    """
+    micro = await db.get(models.MicroCycle, id)
+    if not micro:
+        raise HTTPException(status_code=404, detail="Micro cycle not found")
+
+    return await get_cached_dashboard_async(db, "micro", micro, athlete_id, response)
@@ -1,22 +1,28 @@
 from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app import models, schemas
 from app.api import deps
+from app.db.loading import eager_load
+from app.db.query_budget import query_budget
+from app.services import daily_rollup, gym_loads
 
 router = APIRouter()
 
 # --- Templates ---
 
 @router.get("/templates/", response_model=List[schemas.GymTemplate])
+@query_budget(3)
 def read_templates(
     db: Session = Depends(deps.get_db),
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=500),
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
-    return db.query(models.GymTemplate).offset(skip).limit(limit).all()
+    return db.query(models.GymTemplate).options(
+        *eager_load((models.GymTemplate.exercises,))
+    ).offset(skip).limit(limit).all()
 
 @router.post("/templates/", response_model=schemas.GymTemplate)
 def create_template(
@@ -108,13 +114,16 @@ def parse_time_string(time_str: str) -> Any:
 # --- Sessions ---
 
 @router.get("/sessions/", response_model=List[schemas.GymSession])
+@query_budget(3)
 def read_sessions(
     db: Session = Depends(deps.get_db),
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=500),
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
-    return db.query(models.GymSession).offset(skip).limit(limit).all()
+    return db.query(models.GymSession).options(
+        *eager_load((models.GymSession.feedbacks,))
+    ).offset(skip).limit(limit).all()
 
 @router.post("/sessions/", response_model=schemas.GymSession)
 def create_session(
@@ -135,6 +144,7 @@ def create_session(
 
     db_session = models.GymSession(**session_data)
     db.add(db_session)
+    daily_rollup.refresh_gym_days(db, {db_session.date})
     db.commit()
     db.refresh(db_session)
     return db_session
@@ -168,6 +178,7 @@ def start_session(
         parent_session_id=original_session.id
     )
     db.add(new_session)
+    daily_rollup.refresh_gym_days(db, {new_session.date})
     db.commit()
     db.refresh(new_session)
     return new_session
@@ -182,7 +193,9 @@ def delete_session(
     session = db.query(models.GymSession).filter(models.GymSession.id == id).first()
     if not session:
         raise HTTPException(status_code=404, detail="Gym Session not found")
+    session_date = session.date
     db.delete(session)
+    daily_rollup.refresh_gym_days(db, {session_date})
     db.commit()
     return {"status": "success"}
 
@@ -199,6 +212,7 @@ def update_session(
         raise HTTPException(status_code=404, detail="Gym Session not found")
     
     session_data = session_in.dict(exclude_unset=True)
+    previous_date = session.date
     
     # Handle time parsing
     if 'time' in session_data:
@@ -213,6 +227,10 @@ def update_session(
         setattr(session, field, value)
         
     db.add(session)
+    if 'exercises_snapshot' in session_data:
+        # Capacities of the recorded loads come from the snapshot
+        gym_loads.sync_session_loads(session)
+    daily_rollup.refresh_gym_days(db, {previous_date, session.date})
     db.commit()
     db.refresh(session)
     return session
@@ -244,7 +262,10 @@ def create_gym_feedback(
         # Create new
         db_obj = models.GymFeedback(**feedback_in.dict(), session_id=id)
         db.add(db_obj)
-        
+    
+    # Keep the normalized per-set loads in sync with performed_loads
+    gym_loads.sync_feedback_loads(db_obj, gym_loads.exercise_capacities(session.exercises_snapshot))
+    daily_rollup.refresh_gym_days(db, {session.date})
     db.commit()
     db.refresh(db_obj)
     return db_obj
@@ -5,6 +5,9 @@ from sqlalchemy.orm import Session
 
 from app import models
 from app.api import deps
+from app.db.query_budget import query_budget
+from app.services import daily_rollup
+from app.services.home_snapshot import home_snapshot
 from app.schemas import home_dashboard as schemas
 
 router = APIRouter()
@@ -26,27 +29,27 @@ def get_current_meso(db: Session, today: date):
     ).first()
 
 
+def get_current_cycles(db: Session, today: date) -> tuple:
+    """(MicroInfo, MesoInfo) of the cycles containing today, None where there is none."""
+    micro = get_current_micro(db, today)
+    meso = get_current_meso(db, today)
+    return (
+        schemas.MicroInfo(id=micro.id, name=micro.name, start_date=micro.start_date, end_date=micro.end_date)
+        if micro else None,
+        schemas.MesoInfo(id=meso.id, name=meso.name, start_date=meso.start_date, end_date=meso.end_date)
+        if meso else None,
+    )
+
+
 def get_week_volume(db: Session, today: date) -> float:
     """Calculate total swimming volume for the current week (Monday to Sunday)."""
     # Get start and end of current week
     week_start = today - timedelta(days=today.weekday())  # Monday
     week_end = week_start + timedelta(days=6)  # Sunday
     
-    # Get all completed training sessions in this week
-    sessions = db.query(models.TrainingSession).filter(
-        models.TrainingSession.date >= week_start,
-        models.TrainingSession.date <= week_end,
-        models.TrainingSession.status == "Completed"
-    ).all()
-    
-    total_volume = 0.0
-    for session in sessions:
-        for series in session.series:
-            for subdiv in series.subdivisions:
-                if subdiv.distance:
-                    # distance * reps
-                    reps = subdiv.reps or 1
-                    total_volume += subdiv.distance * reps
+    # Completed training sessions in this week (daily rollup)
+    totals = daily_rollup.sum_rollup(db, daily_rollup.POOL, week_start, week_end)
+    total_volume = totals["completed_volume"]
     
     return total_volume
 
@@ -70,26 +73,10 @@ def get_ddr_dcr_percentages(db: Session, meso) -> tuple[float, float]:
     if not meso:
         return 0.0, 0.0
     
-    # Get all completed sessions in the meso date range
-    sessions = db.query(models.TrainingSession).filter(
-        models.TrainingSession.date >= meso.start_date,
-        models.TrainingSession.date <= meso.end_date,
-        models.TrainingSession.status == "Completed"
-    ).all()
-    
-    ddr_volume = 0.0
-    dcr_volume = 0.0
-    
-    for session in sessions:
-        for series in session.series:
-            for subdiv in series.subdivisions:
-                if subdiv.distance:
-                    reps = subdiv.reps or 1
-                    volume = subdiv.distance * reps
-                    if subdiv.type == "DDR":
-                        ddr_volume += volume
-                    elif subdiv.type == "DCR":
-                        dcr_volume += volume
+    # Completed sessions in the meso date range (daily rollup)
+    totals = daily_rollup.sum_rollup(db, daily_rollup.POOL, meso.start_date, meso.end_date)
+    ddr_volume = totals["completed_ddr_volume"]
+    dcr_volume = totals["completed_dcr_volume"]
     
     total = ddr_volume + dcr_volume
     if total <= 0:
@@ -137,6 +124,7 @@ def get_todays_gym_sessions(db: Session, today: date) -> list:
 
 
 @router.get("/dashboard", response_model=schemas.HomeDashboardResponse)
+@query_budget(10)
 def get_home_dashboard(
     *,
     db: Session = Depends(deps.get_db),
@@ -146,39 +134,34 @@ def get_home_dashboard(
     Get aggregated dashboard data for the home page.
     """
     today = date.today()
-    
-    # Indicators
-    active_athletes_count = db.query(models.Athlete).filter(
-        models.Athlete.status == "Active"
-    ).count()
-    
-    current_micro = get_current_micro(db, today)
-    current_meso = get_current_meso(db, today)
-    week_volume = get_week_volume(db, today)
+    week_start = today - timedelta(days=today.weekday())
+
+    # Indicators, from the day's snapshot (parts are recomputed only after writes to their dates)
+    active_athletes_count = home_snapshot.part(
+        today, "active_athletes", None,
+        lambda: db.query(models.Athlete).filter(models.Athlete.status == "Active").count(),
+    )
+    current_micro, current_meso = home_snapshot.part(today, "cycles", None, lambda: get_current_cycles(db, today))
+    week_volume = home_snapshot.part(
+        today, "week_volume", (week_start, week_start + timedelta(days=6)), lambda: get_week_volume(db, today)
+    )
     
     # Planning view
     meso_progress = get_meso_progress(current_meso, today)
-    ddr_pct, dcr_pct = get_ddr_dcr_percentages(db, current_meso)
+    ddr_pct, dcr_pct = home_snapshot.part(
+        today, "ddr_dcr", (current_meso.start_date, current_meso.end_date) if current_meso else None,
+        lambda: get_ddr_dcr_percentages(db, current_meso),
+    )
     
-    # Agenda
+    # Agenda (always live)
     todays_pool = get_todays_pool_sessions(db, today)
     todays_gym = get_todays_gym_sessions(db, today)
     
     return {
         "active_athletes_count": active_athletes_count,
-        "current_micro": schemas.MicroInfo(
-            id=current_micro.id,
-            name=current_micro.name,
-            start_date=current_micro.start_date,
-            end_date=current_micro.end_date
-        ) if current_micro else None,
+        "current_micro": current_micro,
         "week_volume": week_volume,
-        "current_meso": schemas.MesoInfo(
-            id=current_meso.id,
-            name=current_meso.name,
-            start_date=current_meso.start_date,
-            end_date=current_meso.end_date
-        ) if current_meso else None,
+        "current_meso": current_meso,
         "meso_progress": round(meso_progress, 1),
         "ddr_percentage": ddr_pct,
         "dcr_percentage": dcr_pct,
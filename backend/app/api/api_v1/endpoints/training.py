@@ -1,20 +1,91 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import date
+from typing import Any, List, Literal, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Integer, func, insert, literal, select, tuple_
 from sqlalchemy.orm import Session
 
 from app import models, schemas
 from app.api import deps
+from app.db.loading import eager_load
+from app.db.query_budget import query_budget
+from app.services import daily_rollup
+from app.services.dashboard_cache import invalidate_all_on_commit
+from app.services.session_events import event_payload, event_stream, publish_on_commit, session_events
 
 router = APIRouter()
 
+# selectinload sends at most 500 parent ids per query: with pages of up to 100 sessions,
+# the series and feedbacks fit in one query and the subdivisions in two (up to 10 series a session)
 @router.get("/", response_model=List[schemas.TrainingSession])
+@query_budget(6)
 def read_training_sessions(
     db: Session = Depends(deps.get_db),
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=100),
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
-    return db.query(models.TrainingSession).offset(skip).limit(limit).all()
+    return query_sessions_with_children(db).offset(skip).limit(limit).all()
+
+def encode_session_cursor(session_date: date, session_id: int) -> str:
+    return f"{session_date.isoformat()},{session_id}"
+
+def decode_session_cursor(cursor: str) -> tuple:
+    """(date, id) of the last session of the previous page."""
+    try:
+        session_date, session_id = cursor.split(",")
+        return date.fromisoformat(session_date), int(session_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+@router.get("/summary", response_model=schemas.TrainingSessionPage)
+@query_budget(2)
+def read_training_session_summaries(
+    db: Session = Depends(deps.get_db),
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    status: Optional[str] = None,
+    category: Optional[str] = None,
+    micro_cycle_id: Optional[int] = None,
+    kind: Optional[Literal["plan", "execution"]] = Query(
+        None, description="'plan': sessions without a parent; 'execution': clones started from a plan"
+    ),
+    parent_session_id: Optional[int] = None,
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(100, ge=1, le=500),
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Sessions ordered by (date, id), without series or feedbacks, one page at a time.
+    Only the summary columns are selected.
+    """
+    Training = models.TrainingSession
+    columns = [getattr(Training, field) for field in schemas.TrainingSessionSummary.model_fields]
+    query = db.query(*columns)
+    if start_date:
+        query = query.filter(Training.date >= start_date)
+    if end_date:
+        query = query.filter(Training.date <= end_date)
+    if status:
+        query = query.filter(Training.status == status)
+    if category:
+        query = query.filter(Training.category == category)
+    if micro_cycle_id is not None:
+        query = query.filter(Training.micro_cycle_id == micro_cycle_id)
+    if kind == "plan":
+        query = query.filter(Training.parent_session_id.is_(None))
+    elif kind == "execution":
+        query = query.filter(Training.parent_session_id.isnot(None))
+    if parent_session_id is not None:
+        query = query.filter(Training.parent_session_id == parent_session_id)
+    if cursor:
+        query = query.filter(tuple_(Training.date, Training.id) > tuple_(*decode_session_cursor(cursor)))
+
+    # One row more than the page tells whether there is a next one
+    rows = query.order_by(Training.date, Training.id).limit(limit + 1).all()
+    items = rows[:limit]
+    next_cursor = encode_session_cursor(items[-1].date, items[-1].id) if len(rows) > limit else None
+    return {"items": items, "next_cursor": next_cursor}
 
 @router.get("/functional-direction-ranges", response_model=List[schemas.ConfigFunctionalDirectionRange])
 def read_functional_direction_ranges(
@@ -33,6 +104,7 @@ def create_functional_direction_range(
     """Create a new functional direction range."""
     db_obj = models.ConfigFunctionalDirectionRange(**range_in.dict())
     db.add(db_obj)
+    invalidate_all_on_commit(db)
     db.commit()
     db.refresh(db_obj)
     return db_obj
@@ -56,6 +128,7 @@ def update_functional_direction_range(
         setattr(db_obj, field, value)
     
     db.add(db_obj)
+    invalidate_all_on_commit(db)
     db.commit()
     db.refresh(db_obj)
     return db_obj
@@ -75,9 +148,31 @@ def delete_functional_direction_range(
         raise HTTPException(status_code=404, detail="Functional direction range not found")
     
     db.delete(db_obj)
+    invalidate_all_on_commit(db)
     db.commit()
     return db_obj
 
+def build_training_session(session_in: schemas.TrainingSessionCreate) -> models.TrainingSession:
+    """Session -> series -> subdivisions graph of a nested create, with total_volume summed on the way."""
+    db_session = models.TrainingSession(**session_in.dict(exclude={"series"}))
+    total_volume = 0.0
+    for series_data in session_in.series:
+        series_obj = models.TrainingSeries(**series_data.dict(exclude={"subdivisions"}))
+        for sub_data in series_data.subdivisions:
+            series_obj.subdivisions.append(models.TrainingSubdivision(**sub_data.dict()))
+            # Sum distance * reps for total volume
+            total_volume += (sub_data.distance or 0) * (sub_data.reps or 1)
+        db_session.series.append(series_obj)
+    db_session.total_volume = total_volume
+    return db_session
+
+def query_sessions_with_children(db: Session):
+    """TrainingSession query loading everything schemas.TrainingSession serializes."""
+    return db.query(models.TrainingSession).options(*eager_load(
+        (models.TrainingSession.series, models.TrainingSeries.subdivisions),
+        (models.TrainingSession.feedbacks,),
+    ))
+
 @router.post("/", response_model=schemas.TrainingSession)
 def create_training_session(
     *,
@@ -85,58 +180,75 @@ def create_training_session(
     session_in: schemas.TrainingSessionCreate,
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
-    # Manual Nested Creation to ensure relationships and IDs are correct
-    # Pydantic/SQLAlchemy interaction can be tricky with deep nesting, 
-    # but straightforward iteration works well.
-    
-    session_data = session_in.dict(exclude={"series"})
-    db_session = models.TrainingSession(**session_data)
+    # The whole graph is flushed at once: one multi-row INSERT per table
+    # (RETURNING the new ids where the backend supports it), one commit.
+    db_session = build_training_session(session_in)
     db.add(db_session)
+    daily_rollup.refresh_pool_days(db, {db_session.date})
     db.commit()
-    db.refresh(db_session)
+    return query_sessions_with_children(db).filter(models.TrainingSession.id == db_session.id).first()
 
-    total_volume = 0.0
-    
-    for series_data in session_in.series:
-        subdivisions = series_data.subdivisions
-        series_obj = models.TrainingSeries(
-            **series_data.dict(exclude={"subdivisions"}), 
-            session_id=db_session.id
-        )
-        db.add(series_obj)
-        db.commit()
-        db.refresh(series_obj)
-
-        for sub_data in subdivisions:
-            sub_obj = models.TrainingSubdivision(
-                **sub_data.dict(), 
-                series_id=series_obj.id
-            )
-            db.add(sub_obj)
-            # Sum distance * reps for total volume
-            total_volume += (sub_data.distance or 0) * (sub_data.reps or 1)
-        
-        db.commit()
-
-    # Update session with calculated total_volume
-    db_session.total_volume = total_volume
-    db.add(db_session)
+@router.post("/bulk", response_model=List[schemas.TrainingSession])
+def create_training_sessions_bulk(
+    *,
+    db: Session = Depends(deps.get_db),
+    bulk_in: schemas.TrainingSessionBulkCreate,
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """Create several sessions (e.g. a whole week) in one transaction."""
+    db_sessions = [build_training_session(session_in) for session_in in bulk_in.sessions]
+    db.add_all(db_sessions)
+    daily_rollup.refresh_pool_days(db, {s.date for s in db_sessions})
     db.commit()
-    db.refresh(db_session)
-    return db_session
+    ids = [s.id for s in db_sessions]
+    by_id = {s.id: s for s in query_sessions_with_children(db).filter(models.TrainingSession.id.in_(ids))}
+    return [by_id[id] for id in ids]
 
 @router.get("/{id}", response_model=schemas.TrainingSession)
+@query_budget(5)
 def read_training_session(
     *,
     db: Session = Depends(deps.get_db),
     id: int,
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
-    session = db.query(models.TrainingSession).filter(models.TrainingSession.id == id).first()
+    session = query_sessions_with_children(db).filter(models.TrainingSession.id == id).first()
     if not session:
         raise HTTPException(status_code=404, detail="Training session not found")
     return session
 
+@router.get("/{id}/events")
+def stream_session_events(
+    *,
+    db: Session = Depends(deps.get_db),
+    id: int,
+    last_event_id: Optional[str] = Header(None),
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Server-Sent Events stream of a training session (typically the 'Active' clone).
+    Starts with a `snapshot` event (full session) and then pushes deltas: `feedback`,
+    `series`, `session` (status and other fields), `started`, `reload` and `deleted`.
+    Reconnecting with Last-Event-ID replays the missed events instead of the snapshot.
+    """
+    # Cursor taken before reading, so nothing committed meanwhile is missed
+    after_id = session_events.last_event_id
+    session = db.query(models.TrainingSession).filter(models.TrainingSession.id == id).first()
+    if not session:
+        raise HTTPException(status_code=404, detail="Training session not found")
+    
+    if last_event_id and last_event_id.isdigit():
+        stream = event_stream(id, int(last_event_id))
+    else:
+        snapshot = (after_id, "snapshot", event_payload(schemas.TrainingSession, session))
+        stream = event_stream(id, after_id, initial=snapshot)
+    
+    return StreamingResponse(
+        stream,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 @router.post("/{id}/feedback", response_model=schemas.SessionFeedback)
 def create_session_feedback(
     *,
@@ -153,6 +265,9 @@ def create_session_feedback(
     
     db_obj = models.SessionFeedback(**feedback_in.dict())
     db.add(db_obj)
+    db.flush()
+    daily_rollup.refresh_pool_days(db, daily_rollup.pool_session_dates(db, db_obj.session_id))
+    publish_on_commit(db, db_obj.session_id, "feedback", event_payload(schemas.SessionFeedback, db_obj))
     db.commit()
     db.refresh(db_obj)
     return db_obj
@@ -176,8 +291,7 @@ def add_series_to_session(
         session_id=session.id
     )
     db.add(series_obj)
-    db.commit()
-    db.refresh(series_obj)
+    db.flush()
     
     added_volume = 0.0
     for sub_data in subdivisions_data:
@@ -191,10 +305,50 @@ def add_series_to_session(
     # Update session total_volume
     session.total_volume = (session.total_volume or 0) + added_volume
     db.add(session)
+    daily_rollup.refresh_pool_days(db, {session.date})
+    publish_on_commit(db, session.id, "series", {
+        "series": event_payload(schemas.TrainingSeries, series_obj),
+        "total_volume": session.total_volume,
+    })
     db.commit()
     db.refresh(series_obj)
     return series_obj
 
+def clone_session_children(db: Session, source_id: int, target_id: int) -> None:
+    """
+    Copy the series and subdivisions of a session into another with two INSERT ... SELECT
+    statements, whatever the plan size. Every column but the keys is copied, including
+    functional_base_key (the ORM validator does not run here).
+    """
+    series = models.TrainingSeries.__table__
+    subdivision = models.TrainingSubdivision.__table__
+
+    series_columns = [c.name for c in series.c if c.name not in ("id", "session_id")]
+    db.execute(insert(series).from_select(
+        ["session_id", *series_columns],
+        select(literal(target_id, Integer), *[series.c[name] for name in series_columns])
+        .where(series.c.session_id == source_id)
+        .order_by(series.c.id),
+    ))
+
+    # The copies are inserted in id order, so the n-th series of both sessions match
+    def numbered_series(session_id):
+        return select(
+            series.c.id, func.row_number().over(order_by=series.c.id).label("position")
+        ).where(series.c.session_id == session_id).subquery()
+
+    source, target = numbered_series(source_id), numbered_series(target_id)
+    subdivision_columns = [c.name for c in subdivision.c if c.name not in ("id", "series_id")]
+    db.execute(insert(subdivision).from_select(
+        ["series_id", *subdivision_columns],
+        select(target.c.id, *[subdivision.c[name] for name in subdivision_columns])
+        .select_from(
+            subdivision.join(source, subdivision.c.series_id == source.c.id)
+            .join(target, target.c.position == source.c.position)
+        )
+        .order_by(subdivision.c.series_id, subdivision.c.id),
+    ))
+
 @router.post("/{id}/start", response_model=schemas.TrainingSession)
 def start_session(
     id: int,
@@ -223,46 +377,72 @@ def start_session(
         parent_session_id=original_session.id
     )
     db.add(new_session)
-    db.commit()
-    db.refresh(new_session)
-
-    # Clone Series
-    for series in original_session.series:
-        new_series = models.TrainingSeries(
-            session_id=new_session.id,
-            order=series.order,
-            name=series.name,
-            reps=series.reps,
-            rpe_target=series.rpe_target,
-            rpe_description=series.rpe_description,
-            instructions=series.instructions,
-            total_distance=series.total_distance
-        )
-        db.add(new_series)
-        db.commit()
-        db.refresh(new_series)
-
-        # Clone Subdivisions
-        for sub in series.subdivisions:
-            new_sub = models.TrainingSubdivision(
-                series_id=new_series.id,
-                order=sub.order,
-                type=sub.type,
-                reps=sub.reps,
-                distance=sub.distance,
-                style=sub.style,
-                interval_time=sub.interval_time,
-                pause_time=sub.pause_time,
-                da_re=sub.da_re,
-                da_er=sub.da_er,
-                observation=sub.observation,
-                functional_base=sub.functional_base,
-            )
-            db.add(new_sub)
+    db.flush()
+    # Clone Series and Subdivisions
+    clone_session_children(db, original_session.id, new_session.id)
     
+    daily_rollup.refresh_pool_days(db, {new_session.date})
+    # Clients following the plan learn which clone is being executed
+    publish_on_commit(db, original_session.id, "started", {"session_id": new_session.id})
     db.commit()
-    db.refresh(new_session)
-    return new_session
+    return query_sessions_with_children(db).filter(models.TrainingSession.id == new_session.id).first()
+
+def subdivision_volume(sub) -> float:
+    """Volume of a subdivision (distance * reps), from a row or a payload."""
+    return (sub.distance or 0) * (sub.reps or 1)
+
+def match_rows(rows: list, items: list) -> tuple:
+    """
+    Pair payload items with existing rows: by id when the item carries one of them,
+    otherwise by order among the rows left. Returns ([(item, row or None)], unmatched rows).
+    """
+    remaining = {row.id: row for row in rows}
+    matched = [remaining.pop(item.id, None) if item.id is not None else None for item in items]
+    by_order = {}
+    for row in sorted(remaining.values(), key=lambda row: row.id):
+        by_order.setdefault(row.order, []).append(row)
+    for i, item in enumerate(items):
+        if matched[i] is None and item.id is None and by_order.get(item.order):
+            matched[i] = by_order[item.order].pop(0)
+            del remaining[matched[i].id]
+    return list(zip(items, matched)), list(remaining.values())
+
+def update_changed(row, fields: dict) -> None:
+    for field, value in fields.items():
+        if getattr(row, field) != value:
+            setattr(row, field, value)
+
+def merge_series(db_session: models.TrainingSession, series_in: list) -> float:
+    """
+    Apply a series payload to a session in place, so the flush only inserts, updates
+    and deletes what changed. Returns the change in total volume.
+    """
+    volume_delta = 0.0
+    series_pairs, removed_series = match_rows(db_session.series, series_in)
+    for series in removed_series:
+        volume_delta -= sum(subdivision_volume(sub) for sub in series.subdivisions)
+        db_session.series.remove(series)
+
+    for series_data, series in series_pairs:
+        fields = series_data.dict(exclude={"id", "subdivisions"})
+        if series is None:
+            series = models.TrainingSeries(**fields)
+            db_session.series.append(series)
+        else:
+            update_changed(series, fields)
+
+        sub_pairs, removed_subs = match_rows(series.subdivisions, series_data.subdivisions)
+        for sub in removed_subs:
+            volume_delta -= subdivision_volume(sub)
+            series.subdivisions.remove(sub)
+        for sub_data, sub in sub_pairs:
+            volume_delta += subdivision_volume(sub_data)
+            if sub is None:
+                series.subdivisions.append(models.TrainingSubdivision(**sub_data.dict(exclude={"id"})))
+            else:
+                volume_delta -= subdivision_volume(sub)
+                update_changed(sub, sub_data.dict(exclude={"id"}))
+    return volume_delta
 
 @router.put("/{id}", response_model=schemas.TrainingSession)
 def update_training_session(
@@ -272,61 +452,31 @@ def update_training_session(
     session_in: schemas.TrainingSessionUpdate,
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
-    db_obj = db.query(models.TrainingSession).filter(models.TrainingSession.id == id).first()
+    db_obj = query_sessions_with_children(db).filter(models.TrainingSession.id == id).first()
     if not db_obj:
         raise HTTPException(status_code=404, detail="Training session not found")
     
-    update_data = session_in.dict(exclude_unset=True)
+    update_data = session_in.dict(exclude_unset=True, exclude={"series"})
+    previous_date = db_obj.date
+    series_updated = session_in.series is not None
     
-    # Handle series update if present
-    if "series" in update_data:
-        # Clear existing series (with delete-orphan this deletes them and their subdivisions)
-        db_obj.series = []
-        db.commit()
-        db.refresh(db_obj)
-        
-        # Create new series
-        series_data_list = update_data.pop("series")
-        total_volume = 0.0
-        
-        for series_data in series_data_list:
-            if hasattr(series_data, 'dict'):
-                s_data = series_data.dict()
-            else:
-                s_data = series_data
-                
-            subdivisions = s_data.pop("subdivisions", [])
-            
-            series_obj = models.TrainingSeries(
-                **s_data,
-                session_id=db_obj.id
-            )
-            db.add(series_obj)
-            db.commit()
-            db.refresh(series_obj)
-            
-            for sub_data in subdivisions:
-                if hasattr(sub_data, 'dict'):
-                    sub_dict = sub_data.dict()
-                else:
-                    sub_dict = sub_data
-                    
-                sub_obj = models.TrainingSubdivision(
-                    **sub_dict,
-                    series_id=series_obj.id
-                )
-                db.add(sub_obj)
-                total_volume += (sub_dict.get("distance") or 0) * (sub_dict.get("reps") or 1)
-            
-        update_data["total_volume"] = total_volume
+    # Merge series into the existing ones (ids are kept, so series feedback stays attached)
+    if series_updated:
+        volume_delta = merge_series(db_obj, session_in.series)
+        update_data["total_volume"] = (db_obj.total_volume or 0) + volume_delta
 
     for field in update_data:
         setattr(db_obj, field, update_data[field])
     
     db.add(db_obj)
+    daily_rollup.refresh_pool_days(db, {previous_date, db_obj.date})
+    session_fields = event_payload(schemas.TrainingSessionBase, db_obj)
+    publish_on_commit(db, db_obj.id, "session", {"id": db_obj.id, **session_fields})
+    if series_updated:
+        # Series may have been added, edited or removed: clients must re-fetch them
+        publish_on_commit(db, db_obj.id, "reload", {})
     db.commit()
-    db.refresh(db_obj)
-    return db_obj
+    return query_sessions_with_children(db).filter(models.TrainingSession.id == id).first()
 
 @router.delete("/{id}", response_model=schemas.TrainingSession)
 def delete_training_session(
@@ -339,6 +489,11 @@ def delete_training_session(
     if not db_obj:
         raise HTTPException(status_code=404, detail="Training session not found")
     
+    # An executed clone credits attendance to its plan's day; executed copies of a
+    # deleted plan lose their parent link, so their days change too
+    touched_dates = daily_rollup.pool_session_dates(db, id) | {copy.date for copy in db_obj.copies}
     db.delete(db_obj)
+    daily_rollup.refresh_pool_days(db, touched_dates)
+    publish_on_commit(db, id, "deleted", {"id": id})
     db.commit()
     return db_obj
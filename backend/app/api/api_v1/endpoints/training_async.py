@@ -0,0 +1,80 @@
+"""
+Async versions of the hot training endpoints (enabled with ASYNC_DB).
+
+Mounted ahead of the sync training router, so they take over the same paths.
+Integer path converters keep them from shadowing literal routes such as
+/functional-direction-ranges.
+"""
+from typing import Any, List
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import models, schemas
+from app.api import deps
+from app.db.loading import eager_load
+from app.db.query_budget import query_budget
+from app.services import daily_rollup
+from app.services.session_events import event_payload, publish_on_commit
+
+router = APIRouter()
+
+
+def session_with_children():
+    """Select TrainingSession with everything schemas.TrainingSession serializes."""
+    return select(models.TrainingSession).options(*eager_load(
+        (models.TrainingSession.series, models.TrainingSeries.subdivisions),
+        (models.TrainingSession.feedbacks,),
+    ))
+
+
+# Same page cap and budget as the sync list (see training.py)
+@router.get("/", response_model=List[schemas.TrainingSession])
+@query_budget(6)
+async def read_training_sessions(
+    db: AsyncSession = Depends(deps.get_async_db),
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=100),
+    current_user: models.User = Depends(deps.get_current_active_user_async),
+) -> Any:
+    result = await db.execute(session_with_children().offset(skip).limit(limit))
+    return result.scalars().all()
+
+@router.get("/{id:int}", response_model=schemas.TrainingSession)
+@query_budget(5)
+async def read_training_session(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    id: int,
+    current_user: models.User = Depends(deps.get_current_active_user_async),
+) -> Any:
+    result = await db.execute(session_with_children().where(models.TrainingSession.id == id))
+    session = result.scalar_one_or_none()
+    if not session:
+        raise HTTPException(status_code=404, detail="Training session not found")
+    return session
+
+@router.post("/{id:int}/feedback", response_model=schemas.SessionFeedback)
+async def create_session_feedback(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    id: int,
+    feedback_in: schemas.SessionFeedbackCreate,
+    current_user: models.User = Depends(deps.get_current_active_user_async),
+) -> Any:
+    session = await db.get(models.TrainingSession, id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Training session not found")
+
+    db_obj = models.SessionFeedback(**feedback_in.dict())
+    db.add(db_obj)
+    await db.flush()
+    await db.run_sync(
+        lambda s: daily_rollup.refresh_pool_days(s, daily_rollup.pool_session_dates(s, db_obj.session_id))
+    )
+    publish_on_commit(
+        db.sync_session, db_obj.session_id, "feedback", event_payload(schemas.SessionFeedback, db_obj)
+    )
+    await db.commit()
+    await db.refresh(db_obj)
+    return db_obj
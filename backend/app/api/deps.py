@@ -1,13 +1,15 @@
-from typing import Generator
+from typing import AsyncGenerator, Generator
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt
 from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app import models, schemas
 from app.core import security
 from app.core.config import settings
+from app.db import async_session
 from app.db.session import SessionLocal
 
 reusable_oauth2 = OAuth2PasswordBearer(
@@ -21,19 +23,26 @@ def get_db() -> Generator:
     finally:
         db.close()
 
-def get_current_user(
-    db: Session = Depends(get_db), token: str = Depends(reusable_oauth2)
-) -> models.User:
+async def get_async_db() -> AsyncGenerator:
+    async with async_session.AsyncSessionLocal() as db:
+        yield db
+
+def decode_token(token: str) -> schemas.TokenPayload:
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
         )
-        token_data = schemas.TokenPayload(**payload)
+        return schemas.TokenPayload(**payload)
     except (jwt.JWTError, ValidationError):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Could not validate credentials",
         )
+
+def get_current_user(
+    db: Session = Depends(get_db), token: str = Depends(reusable_oauth2)
+) -> models.User:
+    token_data = decode_token(token)
     user = db.query(models.User).filter(models.User.id == token_data.sub).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
@@ -46,6 +55,22 @@ def get_current_active_user(
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
 
+async def get_current_user_async(
+    db: AsyncSession = Depends(get_async_db), token: str = Depends(reusable_oauth2)
+) -> models.User:
+    token_data = decode_token(token)
+    user = await db.get(models.User, token_data.sub) if token_data.sub is not None else None
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    return user
+
+async def get_current_active_user_async(
+    current_user: models.User = Depends(get_current_user_async),
+) -> models.User:
+    if not security.verify_active_user(current_user):
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return current_user
+
 def get_current_active_superuser(
     current_user: models.User = Depends(get_current_user),
 ) -> models.User:
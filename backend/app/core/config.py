@@ -1,4 +1,4 @@
-from typing import List, Union
+from typing import List, Optional, Union
 from pydantic import AnyHttpUrl, validator
 from pydantic_settings import BaseSettings
 
@@ -19,12 +19,28 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = "sqlite:///./winners.db"
+    # Serve the hot endpoints (dashboards, feedback, session reads) with AsyncSession
+    ASYNC_DB: bool = False
+    # Derived from DATABASE_URL when unset (sqlite+aiosqlite / postgresql+asyncpg)
+    ASYNC_DATABASE_URL: Optional[str] = None
+
+    # Statements slower than this are logged with their route (0 disables)
+    SLOW_QUERY_MS: float = 200
+    LOG_LEVEL: str = "INFO"
+    # Warn (QueryBudgetWarning + log line) when an endpoint exceeds its @query_budget
+    DEBUG: bool = False
 
     # JWT
     SECRET_KEY: str = "CHANGE_THIS_IN_PROD_TO_A_REAL_SECRET_KEY"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 1 week
 
+    # Dashboard cache
+    DASHBOARD_CACHE_TTL_SECONDS: int = 300
+    DASHBOARD_CACHE_MAX_ENTRIES: int = 256  # 0 disables the cache
+    # Threads evaluating dashboard sections concurrently (1 = sequential on the request session)
+    DASHBOARD_SECTION_WORKERS: int = 4
+
     class Config:
         case_sensitive = True
         env_file = ".env"
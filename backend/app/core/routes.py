@@ -0,0 +1,22 @@
+import re
+from typing import Optional
+
+# "{id:int}" -> "{id}", so sync and async routes report the same template
+_CONVERTER = re.compile(r"\{(\w+):\w+\}")
+
+
+def route_template(scope: dict) -> Optional[str]:
+    """Full template of the matched route (e.g. /api/v1/cycles/micros/{id}/dashboard).
+
+    Routes of included routers may only carry the path below their prefix, so the
+    prefix is taken from the leading segments of the request path. Before routing
+    (or for unmatched paths) the raw path is returned.
+    """
+    path = scope.get("path")
+    route_path = getattr(scope.get("route"), "path", None)
+    if route_path is None or path is None:
+        return path
+    segments = [segment for segment in path.split("/") if segment]
+    route_segments = [segment for segment in route_path.split("/") if segment]
+    prefix = "".join(f"/{segment}" for segment in segments[:max(len(segments) - len(route_segments), 0)])
+    return _CONVERTER.sub(r"{\1}", prefix + route_path)
@@ -0,0 +1,27 @@
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from app.core.config import settings
+from app.db.session import track_queries
+
+
+def make_async_url(url: str) -> str:
+    """Map a sync DATABASE_URL to its async driver (aiosqlite for SQLite, asyncpg for Postgres)."""
+    scheme, _, rest = url.partition("://")
+    driver = {
+        "sqlite": "sqlite+aiosqlite",
+        "postgres": "postgresql+asyncpg",
+        "postgresql": "postgresql+asyncpg",
+        "postgresql+psycopg2": "postgresql+asyncpg",
+    }.get(scheme, scheme)
+    return f"{driver}://{rest}"
+
+
+# Only created in async mode, so the async drivers stay optional otherwise
+async_engine = None
+AsyncSessionLocal = None
+
+if settings.ASYNC_DB:
+    async_engine = create_async_engine(settings.ASYNC_DATABASE_URL or make_async_url(settings.DATABASE_URL))
+    track_queries(async_engine.sync_engine)
+    AsyncSessionLocal = async_sessionmaker(
+        bind=async_engine, autocommit=False, autoflush=False, expire_on_commit=False
+    )
@@ -7,5 +7,6 @@ from app.models.training import (  # noqa
     SessionFeedback, ConfigCategory, ConfigExerciseType, 
     ConfigIntensityInterval, ConfigFunctionalDirectionRange
 )
-from app.models.gym import GymTemplate, GymExercise, GymSession, GymFeedback  # noqa
+from app.models.gym import GymTemplate, GymExercise, GymSession, GymFeedback, GymLoadEntry  # noqa
 from app.models.analytics import Assessment, Wellness  # noqa
+from app.models.rollup import DailyTrainingRollup  # noqa
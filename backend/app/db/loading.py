@@ -0,0 +1,36 @@
+"""
+Loader options for endpoints that serialize nested objects.
+
+eager_load() turns the relationship paths a response schema walks into selectinload
+chains: one SELECT ... IN per level and per 500 parent ids, so list endpoints cap their
+page size to keep a fixed query budget. With DEBUG=true every
+other relationship of the loaded objects is set to raiseload (objects already in the
+session still resolve), so a lazy load the chains missed (one query per row) fails
+loudly in development instead of going unnoticed.
+"""
+from typing import List
+
+from sqlalchemy.orm import defaultload, raiseload, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from app.core.config import settings
+
+
+def eager_load(*paths: tuple) -> List[LoaderOption]:
+    """
+    Options for `query.options(*eager_load(...))`. Each path is a tuple of relationship
+    attributes, e.g. (MacroCycle.mesos, MesoCycle.micros).
+    """
+    options = []
+    for path in paths:
+        loader = selectinload(path[0])
+        for attribute in path[1:]:
+            loader = loader.selectinload(attribute)
+        options.append(loader)
+
+    if settings.DEBUG:
+        options.append(raiseload("*", sql_only=True))
+        for path in paths:
+            for depth in range(1, len(path) + 1):
+                options.append(defaultload(*path[:depth]).raiseload("*", sql_only=True))
+    return options
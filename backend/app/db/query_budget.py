@@ -0,0 +1,105 @@
+"""
+Query budgets: upper bounds on the SQL statements an endpoint (or any block) may run.
+
+Endpoints declare their budget with @query_budget(n), sized for their largest
+page (list endpoints cap `limit`). It does not grow with the data, so a
+lazy-loading loop (one query per row) shows up as soon as it is introduced:
+
+- every response of a budgeted route carries X-DB-Query-Budget next to
+  X-DB-Queries, and with DEBUG=true the request middleware emits a
+  QueryBudgetWarning (and a log line) when the budget is exceeded;
+- tests wrap a block in assert_max_queries(n), or check a response with
+  assert_within_budget(response) (both exposed as pytest fixtures in conftest.py).
+"""
+import threading
+import warnings
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional
+
+from sqlalchemy import event
+
+QUERY_BUDGET_HEADER = "X-DB-Query-Budget"
+
+
+class QueryBudgetWarning(RuntimeWarning):
+    pass
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+def query_budget(limit: int) -> Callable:
+    """Declare the most SQL statements an endpoint should run (place below the route decorator)."""
+    def decorate(endpoint: Callable) -> Callable:
+        endpoint.query_budget = limit
+        return endpoint
+    return decorate
+
+
+def route_query_budget(scope: dict) -> Optional[int]:
+    """Budget declared by the endpoint of the matched route, if any."""
+    return getattr(getattr(scope.get("route"), "endpoint", None), "query_budget", None)
+
+
+def warn_over_budget(route: Optional[str], count: int, budget: int) -> None:
+    warnings.warn(
+        f"{route} ran {count} SQL statements, over its query budget of {budget}",
+        QueryBudgetWarning,
+        stacklevel=2,
+    )
+
+
+class QueryCounter:
+    def __init__(self):
+        self.statements: List[str] = []
+        self._lock = threading.Lock()
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        with self._lock:
+            self.statements.append(statement)
+
+
+def _engines() -> list:
+    from app.db import async_session
+    from app.db.session import engine
+
+    engines = [engine]
+    if async_session.async_engine is not None:
+        engines.append(async_session.async_engine.sync_engine)
+    return engines
+
+
+@contextmanager
+def assert_max_queries(limit: int, engines: Optional[list] = None) -> Iterator[QueryCounter]:
+    """Fail with QueryBudgetExceeded if the block runs more than `limit` statements.
+
+    Counts on the engines themselves, so statements issued from other threads
+    (TestClient, dashboard section workers) are included.
+    """
+    counter = QueryCounter()
+    engines = engines or _engines()
+    for engine in engines:
+        event.listen(engine, "after_cursor_execute", counter._record)
+    try:
+        yield counter
+    finally:
+        for engine in engines:
+            event.remove(engine, "after_cursor_execute", counter._record)
+    if counter.count > limit:
+        statements = "\n".join(f"  {statement}" for statement in counter.statements)
+        raise QueryBudgetExceeded(f"{counter.count} SQL statements, budget {limit}:\n{statements}")
+
+
+def assert_within_budget(response) -> None:
+    """Fail if a response ran more statements than its route's declared budget."""
+    budget = response.headers.get(QUERY_BUDGET_HEADER)
+    if budget is None:
+        raise QueryBudgetExceeded(f"{response.request.url.path} has no query budget")
+    count = int(response.headers["X-DB-Queries"])
+    if count > int(budget):
+        raise QueryBudgetExceeded(f"{response.request.url.path} ran {count} SQL statements, budget {budget}")
@@ -1,8 +1,74 @@
-from sqlalchemy import create_engine
+import json
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.core.routes import route_template
+
+logger = logging.getLogger("app.db")
+
+
+class QueryStats:
+    """SQL statements executed and DB time spent while serving one request."""
+
+    def __init__(self, scope: Optional[dict] = None):
+        self.count = 0
+        self.duration = 0.0  # seconds
+        self._scope = scope or {}
+        # Dashboard sections run on worker threads that share this object
+        self._lock = threading.Lock()
+
+    @property
+    def route(self) -> Optional[str]:
+        """Route template (e.g. /api/v1/cycles/micros/{id}/dashboard), or the raw path before routing."""
+        return route_template(self._scope)
+
+    def add(self, duration: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.duration += duration
+
+
+# Set by the request middleware in app/main.py; None outside requests
+query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def track_queries(engine: Engine) -> None:
+    """Count statements and DB time into query_stats, and log the ones slower than SLOW_QUERY_MS."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        duration = time.perf_counter() - conn.info["query_started"].pop()
+        stats = query_stats.get()
+        if stats is not None:
+            stats.add(duration)
+        if settings.SLOW_QUERY_MS and duration * 1000 >= settings.SLOW_QUERY_MS:
+            logger.warning(json.dumps({
+                "event": "slow_query",
+                "duration_ms": round(duration * 1000, 1),
+                "route": stats.route if stats else None,
+                "statement": statement,
+            }))
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        started = exception_context.connection.info.get("query_started") if exception_context.connection else None
+        if started:
+            started.pop()
+
 
 engine = create_engine(
     settings.DATABASE_URL, connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {}
 )
+track_queries(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
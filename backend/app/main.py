@@ -1,9 +1,20 @@
-from fastapi import FastAPI
+import json
+import logging
+import time
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from app.core.config import settings
+from app.core.routes import route_template
 from app.api.api_v1.api import api_router
 from app.db.base import Base
-from app.db.session import engine
+from app.db.query_budget import QUERY_BUDGET_HEADER, route_query_budget, warn_over_budget
+from app.db.session import QueryStats, engine, query_stats
+from app.services import metrics
+
+logging.basicConfig(level=settings.LOG_LEVEL, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+request_logger = logging.getLogger("app.request")
 
 # Create tables on startup (Use Alembic for Migrations)
 # Base.metadata.create_all(bind=engine)
@@ -23,8 +34,57 @@ if settings.BACKEND_CORS_ORIGINS:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["Server-Timing", "X-DB-Queries", QUERY_BUDGET_HEADER],
     )
 
+def metrics_route(request: Request) -> str:
+    """Route template label; unmatched paths share one label so scanners can't blow up the series count."""
+    return route_template(request.scope) if request.scope.get("route") else "<unmatched>"
+
+@app.middleware("http")
+async def track_request_queries(request: Request, call_next):
+    """Report the SQL statements and DB time of each request in headers, one log line and /metrics."""
+    stats = QueryStats(request.scope)
+    token = query_stats.set(stats)
+    metrics.requests_in_flight.inc()
+    started = time.perf_counter()
+    try:
+        response = await call_next(request)
+    except Exception:
+        metrics.observe_request(
+            request.method, metrics_route(request), 500, time.perf_counter() - started, None, stats.count
+        )
+        raise
+    finally:
+        query_stats.reset(token)
+        metrics.requests_in_flight.dec()
+    duration = time.perf_counter() - started
+    duration_ms = duration * 1000
+    metrics.observe_request(
+        request.method, metrics_route(request), response.status_code, duration,
+        response.headers.get("content-length"), stats.count,
+    )
+
+    db_ms = stats.duration * 1000
+    response.headers.append("Server-Timing", f'db;dur={db_ms:.1f};desc="{stats.count} queries", app;dur={duration_ms:.1f}')
+    response.headers["X-DB-Queries"] = str(stats.count)
+    budget = route_query_budget(request.scope)
+    if budget is not None:
+        response.headers[QUERY_BUDGET_HEADER] = str(budget)
+    request_logger.info(json.dumps({
+        "method": request.method,
+        "route": stats.route,
+        "status": response.status_code,
+        "duration_ms": round(duration_ms, 1),
+        "db_queries": stats.count,
+        "db_time_ms": round(db_ms, 1),
+    }))
+    if settings.DEBUG and budget is not None and stats.count > budget:
+        request_logger.warning(json.dumps({"event": "query_budget_exceeded", "route": stats.route,
+                                           "db_queries": stats.count, "budget": budget}))
+        warn_over_budget(stats.route, stats.count, budget)
+    return response
+
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
 @app.get("/")
@@ -34,3 +94,8 @@ def root():
 @app.get("/health")
 def health_check():
     return {"status": "ok"}
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def read_metrics():
+    """Prometheus text exposition of this worker's request, DB pool and cache metrics."""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -6,5 +6,6 @@ from .training import (
     SessionFeedback, ConfigCategory, ConfigExerciseType, ConfigIntensityInterval,
     ConfigFunctionalDirectionRange
 )
-from .gym import GymTemplate, GymExercise, GymSession, GymFeedback
+from .gym import GymTemplate, GymExercise, GymSession, GymFeedback, GymLoadEntry
 from .analytics import Assessment, Wellness
+from .rollup import DailyTrainingRollup
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, Float, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Date, Float, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
 from app.db.base_class import Base
 
@@ -18,6 +18,10 @@ class Assessment(Base):
     
     observation = Column(String, nullable=True)
 
+    __table_args__ = (
+        Index("ix_assessment_athlete_id_date", "athlete_id", "date"),
+    )
+
 class Wellness(Base):
     id = Column(Integer, primary_key=True, index=True)
     athlete_id = Column(Integer, ForeignKey("athlete.id"), nullable=False)
@@ -30,8 +30,13 @@ class Athlete(Base):
     avatar_url = Column(String, nullable=True)
     
     # Computed/Cached fields can be regular columns updated by logic
-    recent_load = Column(Float, default=0.0)
-    fatigue_score = Column(Float, default=0.0)
+    # Load averages and fatigue are maintained by app/services/athlete_load.py
+    recent_load = Column(Float, default=0.0) # Acute (7-day) EWMA of the daily load
+    fatigue_score = Column(Float, default=0.0) # 0-10, as of load_updated_on
+    chronic_load = Column(Float, default=0.0) # Chronic (28-day) EWMA of the daily load
+    load_updated_on = Column(Date, nullable=True) # Day the load averages are as of
+    wellness_fatigue = Column(Float, nullable=True) # EWMA of wellness fatigue_level
+    wellness_updated_on = Column(Date, nullable=True) # Date of the last report folded in
     body_weight = Column(Float, default=0.0)
 
     @property
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, Float, Enum, ForeignKey, Time, Text, JSON
+from sqlalchemy import Column, Integer, String, Date, Float, Enum, ForeignKey, Time, Text, JSON, Index
 from sqlalchemy.orm import relationship
 from app.db.base_class import Base
 
@@ -72,3 +72,28 @@ class GymFeedback(Base):
     attendance = Column(String) # Present, Absent
 
     session = relationship("GymSession", back_populates="feedbacks")
+    load_entries = relationship("GymLoadEntry", back_populates="feedback", cascade="all, delete-orphan")
+
+class GymLoadEntry(Base):
+    """One performed set: normalized copy of GymFeedback.performed_loads.
+
+    Rows are rewritten from the JSON by app/services/gym_loads.py whenever a
+    feedback (or the session's exercises) changes, so tonnage and capacity
+    breakdowns can be aggregated in SQL.
+    """
+    id = Column(Integer, primary_key=True, index=True)
+    feedback_id = Column(Integer, ForeignKey("gymfeedback.id", ondelete="CASCADE"), nullable=False)
+    session_id = Column(Integer, ForeignKey("gymsession.id", ondelete="CASCADE"), nullable=False)
+    athlete_id = Column(Integer, ForeignKey("athlete.id", ondelete="CASCADE"), nullable=False)
+
+    exercise_name = Column(String, nullable=False)
+    physical_motor_capacity = Column(String, nullable=True) # From the session's exercises snapshot
+    set_index = Column(Integer, nullable=False) # Position in the performed loads list (0-based)
+    load = Column(Float, nullable=False)
+
+    feedback = relationship("GymFeedback", back_populates="load_entries")
+
+    __table_args__ = (
+        Index("ix_gymloadentry_session_athlete", "session_id", "athlete_id"),
+        Index("ix_gymloadentry_feedback_id", "feedback_id"),
+    )
@@ -0,0 +1,54 @@
+from sqlalchemy import Column, Integer, String, Date, Float, ForeignKey, JSON, Index
+from app.db.base_class import Base
+
+class DailyTrainingRollup(Base):
+    """Pre-aggregated training metrics for one day.
+
+    One row per (date, kind, category, athlete_id). Team rows have athlete_id NULL
+    and athlete rows hold the same metrics restricted to that athlete.
+    Rows are rebuilt for the touched days by app/services/daily_rollup.py
+    whenever sessions, series, subdivisions or feedbacks are written.
+    """
+    id = Column(Integer, primary_key=True, index=True)
+    date = Column(Date, nullable=False)
+    kind = Column(String, nullable=False) # "pool" or "gym"
+    category = Column(String, nullable=True) # Session category
+    athlete_id = Column(Integer, ForeignKey("athlete.id", ondelete="CASCADE"), nullable=True) # NULL = team
+
+    # Swimming - PLANNED sessions (volume in meters, distance * reps)
+    planned_sessions = Column(Integer, default=0)
+    planned_volume = Column(Float, default=0.0)
+    ddr_volume = Column(Float, default=0.0)
+    dcr_volume = Column(Float, default=0.0)
+    # { "functional_base_key": volume } - resolved against configured directions at read time
+    functional_base_volumes = Column(JSON, default={})
+
+    # Distance-weighted DA-ER / DA-RE sums (average = weighted / distance)
+    er_weighted = Column(Float, default=0.0)
+    er_distance = Column(Float, default=0.0)
+    re_weighted = Column(Float, default=0.0)
+    re_distance = Column(Float, default=0.0)
+
+    # Swimming - COMPLETED sessions (volume in meters, distance * (reps or 1))
+    completed_volume = Column(Float, default=0.0)
+    completed_ddr_volume = Column(Float, default=0.0)
+    completed_dcr_volume = Column(Float, default=0.0)
+
+    # Swimming - session-RPE load (rpe_real * km of the session or series the feedback refers to)
+    rpe_load = Column(Float, default=0.0)
+    rpe_athletes = Column(Integer, default=0) # Athletes with an RPE that day (1 on athlete rows)
+
+    # Gym - sum of performed loads
+    gym_sessions = Column(Integer, default=0) # Sessions with performed loads
+    gym_load = Column(Float, default=0.0)
+    # { "Força Máxima": load, ... } keyed by physicalMotorCapacity
+    gym_capacity_loads = Column(JSON, default={})
+
+    # Attendance (SessionFeedback for pool, GymFeedback for gym)
+    feedback_count = Column(Integer, default=0)
+    present_count = Column(Integer, default=0)
+
+    __table_args__ = (
+        Index("ix_dailytrainingrollup_date_kind", "date", "kind"),
+        Index("ix_dailytrainingrollup_athlete_date", "athlete_id", "date"),
+    )
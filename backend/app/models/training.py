@@ -1,7 +1,16 @@
-from sqlalchemy import Column, Integer, String, Date, Float, Enum, ForeignKey, Time, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Date, Float, Enum, ForeignKey, Time, Text, Index
+from sqlalchemy.orm import relationship, validates
 from app.db.base_class import Base
 
+
+def normalize_functional_base(name):
+    """Matching key of a functional base or direction name ("Aeróbico A1" -> "aerobico_a1")."""
+    if not name:
+        return None
+    key = name.strip().lower().replace("á", "a").replace("é", "e").replace("ó", "o").replace(" ", "_")
+    return key or None
+
+
 # --- Configurations ---
 
 class ConfigCategory(Base):
@@ -50,6 +59,11 @@ class TrainingSession(Base):
     series = relationship("TrainingSeries", back_populates="session", cascade="all, delete-orphan")
     feedbacks = relationship("SessionFeedback", backref="session", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Keyset pagination of the session listing
+        Index("ix_trainingsession_date_id", "date", "id"),
+    )
+
 class TrainingSeries(Base):
     id = Column(Integer, primary_key=True, index=True)
     session_id = Column(Integer, ForeignKey("trainingsession.id"), nullable=False)
@@ -81,9 +95,16 @@ class TrainingSubdivision(Base):
     da_re = Column(Float, nullable=True)
     da_er = Column(Float, nullable=True)
     functional_base = Column(String, nullable=True)
+    # Normalized functional_base used for direction matching (kept in sync by the validator below)
+    functional_base_key = Column(String, nullable=True, index=True)
     observation = Column(Text, nullable=True)
 
     series = relationship("TrainingSeries", back_populates="subdivisions")
+
+    @validates("functional_base")
+    def _sync_functional_base_key(self, key, value):
+        self.functional_base_key = normalize_functional_base(value)
+        return value
     
 # --- Live Execution / History ---
 # Storing individual feedback per athlete per series in a session
@@ -7,8 +7,10 @@ from .cycles import (
     MicroCycle, MicroCycleCreate, MicroCycleUpdate
 )
 from .training import (
-    TrainingSession, TrainingSessionCreate, TrainingSessionUpdate,
-    TrainingSeries, TrainingSeriesCreate, TrainingSubdivision, SessionFeedback, SessionFeedbackCreate,
+    TrainingSession, TrainingSessionBase, TrainingSessionCreate, TrainingSessionBulkCreate, TrainingSessionUpdate,
+    TrainingSessionSummary, TrainingSessionPage,
+    TrainingSeries, TrainingSeriesCreate, TrainingSeriesUpdate, TrainingSubdivision, TrainingSubdivisionUpdate,
+    SessionFeedback, SessionFeedbackCreate,
     ConfigFunctionalDirectionRange, ConfigFunctionalDirectionRangeCreate
 )
 from .gym import (
@@ -22,7 +24,9 @@ from .analytics import (
 from .cycles_dashboard import (
     SwimmingDashboard, GymDashboard, GymDetailedDashboard,
     AthletesDashboard, WellnessDashboard, FunctionalDirection,
-    MacroDashboardResponse, MesoDashboardResponse, MicroDashboardResponse
+    MacroDashboardResponse, MesoDashboardResponse, MicroDashboardResponse,
+    MicroDashboardItem, SquadAthleteMetrics, SquadDashboardResponse,
+    TimeseriesDay, TimeseriesWeek, MacroTimeseriesResponse
 )
 from .home_dashboard import (
     MicroInfo, MesoInfo, SessionSummary, HomeDashboardResponse
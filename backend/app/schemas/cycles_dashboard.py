@@ -1,5 +1,6 @@
 from pydantic import BaseModel
-from typing import Optional, Dict
+from typing import Optional, Dict, List
+from datetime import date
 
 class SwimmingDashboard(BaseModel):
     total_volume: float
@@ -62,3 +63,53 @@ class MicroDashboardResponse(BaseModel):
     wellness: WellnessDashboard
     functional_direction: FunctionalDirection
     relative_load: Optional[float] = None
+
+class MicroDashboardItem(BaseModel):
+    micro_id: int
+    name: str
+    start_date: date
+    end_date: date
+    dashboard: MicroDashboardResponse
+
+class SquadAthleteMetrics(BaseModel):
+    athlete_id: int
+    name: str
+    category: Optional[str] = None
+    swimming: SwimmingDashboard
+    gym: GymDashboard
+    relative_load: Optional[float] = None
+    average_attendance: float
+    wellness: WellnessDashboard
+
+class SquadDashboardResponse(BaseModel):
+    start_date: date
+    end_date: date
+    athletes: List[SquadAthleteMetrics]
+
+class TimeseriesDay(BaseModel):
+    date: date
+    planned_volume: float  # km
+    completed_volume: float  # km
+    gym_load: float
+    rpe_load: float  # Team view: average per athlete with an RPE that day
+    acwr: Optional[float] = None
+
+class TimeseriesWeek(BaseModel):
+    week: int
+    start_date: date
+    end_date: date
+    planned_volume: float
+    completed_volume: float
+    gym_load: float
+    rpe_load: float
+    load: float  # Weekly sum of the selected metric
+    acwr: Optional[float] = None  # At the last day of the week
+    monotony: Optional[float] = None
+    strain: Optional[float] = None
+
+class MacroTimeseriesResponse(BaseModel):
+    macro_id: int
+    athlete_id: Optional[int] = None
+    metric: str
+    days: List[TimeseriesDay]
+    weeks: List[TimeseriesWeek]
@@ -34,6 +34,9 @@ class TrainingSubdivisionBase(BaseModel):
 class TrainingSubdivisionCreate(TrainingSubdivisionBase):
     pass
 
+class TrainingSubdivisionUpdate(TrainingSubdivisionBase):
+    id: int | None = None  # existing subdivision to update; matched by order when omitted
+
 class TrainingSubdivision(TrainingSubdivisionBase):
     id: int
     series_id: int
@@ -53,6 +56,10 @@ class TrainingSeriesBase(BaseModel):
 class TrainingSeriesCreate(TrainingSeriesBase):
     subdivisions: list["TrainingSubdivisionCreate"] = []
 
+class TrainingSeriesUpdate(TrainingSeriesBase):
+    id: int | None = None  # existing series to update; matched by order when omitted
+    subdivisions: list["TrainingSubdivisionUpdate"] = []
+
 class TrainingSeries(TrainingSeriesBase):
     id: int
     session_id: int
@@ -75,6 +82,9 @@ class TrainingSessionBase(BaseModel):
 class TrainingSessionCreate(TrainingSessionBase):
     series: list["TrainingSeriesCreate"] = []
 
+class TrainingSessionBulkCreate(BaseModel):
+    sessions: list["TrainingSessionCreate"]
+
 class TrainingSessionUpdate(BaseModel):
     date: datetime.date | None = None
     time: datetime.time | None = None
@@ -84,7 +94,7 @@ class TrainingSessionUpdate(BaseModel):
     status: str | None = None
     description: str | None = None
     total_volume: float | None = None
-    series: list["TrainingSeriesCreate"] | None = None
+    series: list["TrainingSeriesUpdate"] | None = None
 
 class TrainingSession(TrainingSessionBase):
     id: int
@@ -94,6 +104,16 @@ class TrainingSession(TrainingSessionBase):
     class Config:
         from_attributes = True
 
+class TrainingSessionSummary(TrainingSessionBase):
+    """Session without its series and feedbacks (listing/calendar views)."""
+    id: int
+    class Config:
+        from_attributes = True
+
+class TrainingSessionPage(BaseModel):
+    items: list["TrainingSessionSummary"]
+    next_cursor: str | None = None  # pass as `cursor` to get the next page
+
 # --- Live Feedback ---
 class SessionFeedbackCreate(BaseModel):
     session_id: int
@@ -0,0 +1,188 @@
+"""
+Incrementally maintained training load and fatigue of each athlete.
+
+Athlete.recent_load and Athlete.chronic_load are exponentially weighted moving
+averages (EWMA) of the daily training load, sampled once per day:
+
+    ewma[d] = (1 - λ) * ewma[d - 1] + λ * load[d],   λ = 2 / (span + 1)
+
+The recurrence is linear, so a change δ to the load of any day d (new, edited
+or deleted feedback, edited session) moves the average stored as of day u >= d
+by λ * δ * (1 - λ) ** (u - d): every write costs O(1) per athlete and day
+touched, whatever the history length. Deltas come from the daily rollup, whose
+athlete rows are rebuilt for the touched days by daily_rollup.refresh_*_days.
+
+Wellness fatigue (0-10) is an EWMA over the athlete's reports, updated in O(1)
+when a report is newer than the last one and recomputed otherwise.
+
+fatigue_score (0-10) blends the acute:chronic balance, 10 * acute / (acute +
+chronic) (5 = steady load), with the wellness fatigue when there is one.
+
+The stored averages are as of load_updated_on, which never moves past the day of
+the write; reads decay them to today with load_as_of() without writing.
+"""
+from collections import defaultdict
+from datetime import date
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app import models
+
+ACUTE_SPAN = 7  # days
+CHRONIC_SPAN = 28  # days
+WELLNESS_SPAN = 7  # reports
+
+ACUTE_ALPHA = 2 / (ACUTE_SPAN + 1)
+CHRONIC_ALPHA = 2 / (CHRONIC_SPAN + 1)
+WELLNESS_ALPHA = 2 / (WELLNESS_SPAN + 1)
+
+# Arbitrary units per kg lifted, so gym tonnage is comparable to swim session-RPE (RPE * km)
+GYM_LOAD_FACTOR = 0.01
+
+
+def training_load(rpe_load: Optional[float], gym_load: Optional[float]) -> float:
+    """Daily load of a rollup row: swim session-RPE plus weighted gym tonnage."""
+    return (rpe_load or 0.0) + (gym_load or 0.0) * GYM_LOAD_FACTOR
+
+
+def _decay_factors(athlete: models.Athlete, day: date) -> Tuple[float, float]:
+    """Factors moving the stored averages forward to `day` (days without load count as 0)."""
+    days = (day - athlete.load_updated_on).days if athlete.load_updated_on else 0
+    if days <= 0:
+        return 1.0, 1.0
+    return (1 - ACUTE_ALPHA) ** days, (1 - CHRONIC_ALPHA) ** days
+
+
+def _decay(athlete: models.Athlete, day: date) -> None:
+    """Move the load averages of an athlete forward to `day`."""
+    if athlete.load_updated_on is None:
+        athlete.recent_load = 0.0
+        athlete.chronic_load = 0.0
+        athlete.load_updated_on = day
+        return
+    if day <= athlete.load_updated_on:
+        return
+    acute_factor, chronic_factor = _decay_factors(athlete, day)
+    athlete.recent_load = (athlete.recent_load or 0.0) * acute_factor
+    athlete.chronic_load = (athlete.chronic_load or 0.0) * chronic_factor
+    athlete.load_updated_on = day
+
+
+def _apply_delta(athlete: models.Athlete, day: date, delta: float, today: date) -> None:
+    # The averages stay anchored at today at the latest: a future-dated load (e.g. a
+    # session entered ahead) is folded in with a negative age instead of moving the anchor
+    _decay(athlete, today)
+    age = (athlete.load_updated_on - day).days
+    athlete.recent_load += ACUTE_ALPHA * delta * (1 - ACUTE_ALPHA) ** age
+    athlete.chronic_load += CHRONIC_ALPHA * delta * (1 - CHRONIC_ALPHA) ** age
+
+
+def fatigue_score(recent_load: Optional[float], chronic_load: Optional[float], wellness_fatigue: Optional[float]) -> float:
+    acute = max(recent_load or 0.0, 0.0)
+    chronic = max(chronic_load or 0.0, 0.0)
+    balance = 10 * acute / (acute + chronic) if acute + chronic > 1e-9 else 0.0
+    if wellness_fatigue is None:
+        return round(balance, 2)
+    return round((balance + wellness_fatigue) / 2, 2)
+
+
+def update_fatigue_score(athlete: models.Athlete) -> None:
+    athlete.fatigue_score = fatigue_score(athlete.recent_load, athlete.chronic_load, athlete.wellness_fatigue)
+
+
+def load_as_of(athlete: models.Athlete, day: date) -> dict:
+    """recent_load, chronic_load and fatigue_score of an athlete as of `day`, without changing the athlete."""
+    acute_factor, chronic_factor = _decay_factors(athlete, day)
+    recent_load = (athlete.recent_load or 0.0) * acute_factor
+    chronic_load = (athlete.chronic_load or 0.0) * chronic_factor
+    return {
+        "recent_load": recent_load,
+        "chronic_load": chronic_load,
+        "fatigue_score": fatigue_score(recent_load, chronic_load, athlete.wellness_fatigue),
+    }
+
+
+def apply_load_deltas(db: Session, deltas: Dict[Tuple[int, date], float], today: Optional[date] = None) -> None:
+    """Apply {(athlete_id, day): load change} to the stored averages (call before commit)."""
+    today = today or date.today()
+    by_athlete: dict = defaultdict(list)
+    for (athlete_id, day), delta in deltas.items():
+        if abs(delta) > 1e-9:
+            by_athlete[athlete_id].append((day, delta))
+    if not by_athlete:
+        return
+
+    for athlete in db.query(models.Athlete).filter(models.Athlete.id.in_(by_athlete.keys())):
+        for day, delta in sorted(by_athlete[athlete.id]):
+            _apply_delta(athlete, day, delta, today)
+        update_fatigue_score(athlete)
+
+
+def record_wellness(db: Session, wellness: models.Wellness) -> None:
+    """Fold a new wellness report into the athlete's fatigue (call before commit)."""
+    athlete = db.get(models.Athlete, wellness.athlete_id)
+    if athlete is None:
+        return
+    if athlete.wellness_updated_on is not None and wellness.date < athlete.wellness_updated_on:
+        # Back-dated report: replay the athlete's reports in order
+        recompute_wellness(db, athlete)
+        return
+    if wellness.fatigue_level is not None:
+        if athlete.wellness_fatigue is None:
+            athlete.wellness_fatigue = float(wellness.fatigue_level)
+        else:
+            athlete.wellness_fatigue += WELLNESS_ALPHA * (wellness.fatigue_level - athlete.wellness_fatigue)
+        athlete.wellness_updated_on = wellness.date
+    update_fatigue_score(athlete)
+
+
+def recompute_wellness(db: Session, athlete: models.Athlete) -> None:
+    """Rebuild the wellness fatigue of an athlete from all their reports."""
+    db.flush()
+    athlete.wellness_fatigue = None
+    athlete.wellness_updated_on = None
+    for report_date, fatigue_level in db.query(
+        models.Wellness.date, models.Wellness.fatigue_level
+    ).filter(
+        models.Wellness.athlete_id == athlete.id,
+        models.Wellness.fatigue_level.isnot(None)
+    ).order_by(models.Wellness.date, models.Wellness.id):
+        if athlete.wellness_fatigue is None:
+            athlete.wellness_fatigue = float(fatigue_level)
+        else:
+            athlete.wellness_fatigue += WELLNESS_ALPHA * (fatigue_level - athlete.wellness_fatigue)
+        athlete.wellness_updated_on = report_date
+    update_fatigue_score(athlete)
+
+
+def decay_to(db: Session, today: date) -> int:
+    """Store the averages last updated before `today` as of today. Returns the number of athletes updated."""
+    stale = db.query(models.Athlete).filter(models.Athlete.load_updated_on < today).all()
+    for athlete in stale:
+        _decay(athlete, today)
+        update_fatigue_score(athlete)
+    return len(stale)
+
+
+def rebuild_all(db: Session, today: Optional[date] = None) -> None:
+    """Recompute every athlete's load and fatigue from the rollup and wellness reports."""
+    db.flush()
+    athletes = db.query(models.Athlete).all()
+    for athlete in athletes:
+        athlete.recent_load = 0.0
+        athlete.chronic_load = 0.0
+        athlete.load_updated_on = None
+
+    rollup = models.DailyTrainingRollup
+    loads: dict = defaultdict(float)
+    for athlete_id, day, rpe_load, gym_load in db.query(
+        rollup.athlete_id, rollup.date, rollup.rpe_load, rollup.gym_load
+    ).filter(rollup.athlete_id.isnot(None)):
+        loads[(athlete_id, day)] += training_load(rpe_load, gym_load)
+    today = today or date.today()
+    apply_load_deltas(db, loads, today)
+
+    for athlete in athletes:
+        recompute_wellness(db, athlete)
+    decay_to(db, today)
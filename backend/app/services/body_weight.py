@@ -0,0 +1,87 @@
+"""
+Body-weight timeline built from Assessment.weight.
+
+Loads every weighed assessment once and answers "weight of athlete X as of
+day D" with a bisect, so team-wide lookups (relative load, gym load
+prescriptions) cost one query whatever the roster size.
+"""
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import date
+from typing import Iterable, Optional
+
+from sqlalchemy.orm import Session
+
+from app import models
+
+
+class BodyWeightTimeline:
+    def __init__(self, rows: Iterable[tuple]):
+        """Build from (athlete_id, date, weight) rows sorted by date."""
+        self._dates: dict = defaultdict(list)
+        self._weights: dict = defaultdict(list)
+        for athlete_id, weigh_date, weight in rows:
+            self._dates[athlete_id].append(weigh_date)
+            self._weights[athlete_id].append(weight)
+
+    @classmethod
+    def load(
+        cls,
+        db: Session,
+        until: Optional[date] = None,
+        athlete_id: Optional[int] = None,
+        active_only: bool = False,
+    ) -> "BodyWeightTimeline":
+        """Fetch the weighed assessments (up to `until`) in one query."""
+        query = db.query(
+            models.Assessment.athlete_id,
+            models.Assessment.date,
+            models.Assessment.weight
+        ).filter(models.Assessment.weight.isnot(None))
+
+        if until:
+            query = query.filter(models.Assessment.date <= until)
+        if athlete_id:
+            query = query.filter(models.Assessment.athlete_id == athlete_id)
+        if active_only:
+            query = query.join(
+                models.Athlete, models.Athlete.id == models.Assessment.athlete_id
+            ).filter(models.Athlete.status == "Active")
+
+        return cls(query.order_by(models.Assessment.date, models.Assessment.id).all())
+
+    @property
+    def athlete_ids(self) -> list:
+        return list(self._dates.keys())
+
+    def weight_at(self, athlete_id: int, on_date: date) -> Optional[float]:
+        """Latest weight recorded on or before `on_date`."""
+        dates = self._dates.get(athlete_id)
+        if not dates:
+            return None
+        index = bisect_right(dates, on_date)
+        return self._weights[athlete_id][index - 1] if index else None
+
+    def latest_weight(self, athlete_id: int) -> Optional[float]:
+        weights = self._weights.get(athlete_id)
+        return weights[-1] if weights else None
+
+    def weights_at(self, on_date: date, athlete_ids: Optional[Iterable[int]] = None) -> dict:
+        """Weight of every athlete as of `on_date` ({athlete_id: weight}, unknown ones left out)."""
+        weights = {}
+        for athlete_id in (athlete_ids if athlete_ids is not None else self.athlete_ids):
+            weight = self.weight_at(athlete_id, on_date)
+            if weight is not None:
+                weights[athlete_id] = weight
+        return weights
+
+
+def sync_athlete_body_weight(db: Session, athlete_id: int) -> None:
+    """Set Athlete.body_weight to the most recent weighed assessment (call after flush)."""
+    athlete = db.query(models.Athlete).filter(models.Athlete.id == athlete_id).first()
+    if not athlete:
+        return
+    latest = BodyWeightTimeline.load(db, athlete_id=athlete_id).latest_weight(athlete_id)
+    if latest:
+        athlete.body_weight = latest
+        db.add(athlete)
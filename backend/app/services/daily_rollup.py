@@ -0,0 +1,491 @@
+"""
+Incrementally maintained daily training rollup.
+
+Write endpoints call refresh_pool_days/refresh_gym_days with the dates they
+touched, before committing, so DailyTrainingRollup rows are rebuilt in the same
+transaction (and cached dashboards covering those days are invalidated on
+commit). The load changes of the athlete rows are passed on to athlete_load,
+which keeps Athlete.recent_load/fatigue_score current. Dashboards then read range sums from the rollup instead of walking
+sessions, series and subdivisions.
+"""
+from collections import defaultdict
+from datetime import date
+from typing import Iterable, Optional
+
+from sqlalchemy import func, case, true
+from sqlalchemy.orm import Session, aliased
+
+from app import models
+from app.services import athlete_load
+from app.services.dashboard_cache import invalidate_on_commit, invalidate_all_on_commit
+
+POOL = "pool"
+GYM = "gym"
+
+ROLLUP_SUM_FIELDS = (
+    "planned_sessions", "planned_volume", "ddr_volume", "dcr_volume",
+    "er_weighted", "er_distance", "re_weighted", "re_distance",
+    "completed_volume", "completed_ddr_volume", "completed_dcr_volume",
+    "rpe_load", "rpe_athletes",
+    "gym_sessions", "gym_load", "feedback_count", "present_count",
+)
+
+
+def _new_row() -> dict:
+    row = {field: 0 for field in ROLLUP_SUM_FIELDS}
+    row["functional_base_volumes"] = defaultdict(float)
+    row["gym_capacity_loads"] = defaultdict(float)
+    return row
+
+
+def _date_filter(column, dates: Optional[set]):
+    """Restrict a date column to the given days (None = every day)."""
+    if dates is None:
+        return true()
+    return column.in_(dates)
+
+
+def _add_volume_by_type(row: dict, subdiv_type: str, volume: float, prefix: str = "") -> None:
+    if subdiv_type == "DDR":
+        row[f"{prefix}ddr_volume"] += volume
+    elif subdiv_type == "DCR":
+        row[f"{prefix}dcr_volume"] += volume
+
+
+def _compute_pool_rows(db: Session, dates: Optional[set]) -> dict:
+    """Aggregate swimming data per (date, category, athlete_id) for the given days."""
+    session = models.TrainingSession
+    subdiv = models.TrainingSubdivision
+    rows: dict = defaultdict(_new_row)
+
+    # --- PLANNED sessions (no parent) ---
+    planned = {
+        session_id: (session_date, category)
+        for session_id, session_date, category in db.query(
+            session.id, session.date, session.category
+        ).filter(
+            _date_filter(session.date, dates),
+            session.parent_session_id.is_(None)
+        )
+    }
+    planned_ids = session.parent_session_id.is_(None) & _date_filter(session.date, dates)
+
+    for session_date, category in planned.values():
+        rows[(session_date, category, None)]["planned_sessions"] += 1
+
+    # Volume per planned session and subdivision type: SUM(distance * reps)
+    session_volumes: dict = defaultdict(list)
+    planned_volume = func.coalesce(subdiv.distance, 0) * func.coalesce(subdiv.reps, 0)
+    for session_id, subdiv_type, volume, er_weighted, er_distance, re_weighted, re_distance in db.query(
+        models.TrainingSeries.session_id,
+        subdiv.type,
+        func.sum(planned_volume),
+        func.sum(case((subdiv.da_er.isnot(None) & (subdiv.distance > 0), subdiv.da_er * subdiv.distance), else_=0)),
+        func.sum(case((subdiv.da_er.isnot(None) & (subdiv.distance > 0), subdiv.distance), else_=0)),
+        func.sum(case((subdiv.da_re.isnot(None) & (subdiv.distance > 0), subdiv.da_re * subdiv.distance), else_=0)),
+        func.sum(case((subdiv.da_re.isnot(None) & (subdiv.distance > 0), subdiv.distance), else_=0)),
+    ).join(
+        models.TrainingSeries
+    ).join(
+        session
+    ).filter(
+        planned_ids
+    ).group_by(models.TrainingSeries.session_id, subdiv.type):
+        volume = float(volume or 0)
+        session_volumes[session_id].append((subdiv_type, volume))
+
+        row = rows[planned[session_id] + (None,)]
+        row["planned_volume"] += volume
+        _add_volume_by_type(row, subdiv_type, volume)
+        row["er_weighted"] += float(er_weighted or 0)
+        row["er_distance"] += float(er_distance or 0)
+        row["re_weighted"] += float(re_weighted or 0)
+        row["re_distance"] += float(re_distance or 0)
+
+    # Functional base volumes by normalized key (only subdivisions with positive volume)
+    for session_id, functional_base_key, volume in db.query(
+        models.TrainingSeries.session_id,
+        subdiv.functional_base_key,
+        func.sum(planned_volume)
+    ).join(
+        models.TrainingSeries
+    ).join(
+        session
+    ).filter(
+        planned_ids,
+        subdiv.functional_base_key.isnot(None),
+        planned_volume > 0
+    ).group_by(models.TrainingSeries.session_id, subdiv.functional_base_key):
+        rows[planned[session_id] + (None,)]["functional_base_volumes"][functional_base_key] += float(volume)
+
+    # Planned sessions attended by each athlete (feedback on the plan or on one of its clones)
+    plan = aliased(models.TrainingSession)
+    attended = db.query(plan.id, models.SessionFeedback.athlete_id).join(
+        session, models.SessionFeedback.session_id == session.id
+    ).join(
+        plan, plan.id == func.coalesce(session.parent_session_id, session.id)
+    ).filter(
+        plan.parent_session_id.is_(None),
+        _date_filter(plan.date, dates)
+    ).distinct().all()
+
+    for attended_plan_id, athlete_id in attended:
+        row = rows[planned[attended_plan_id] + (athlete_id,)]
+        row["planned_sessions"] += 1
+        for subdiv_type, volume in session_volumes.get(attended_plan_id, []):
+            row["planned_volume"] += volume
+            _add_volume_by_type(row, subdiv_type, volume)
+
+    # --- COMPLETED sessions (plans or executions), volume = distance * (reps or 1) ---
+    completed_volumes: dict = defaultdict(list)  # session_id -> [(date, category, type, volume)]
+    for session_id, session_date, category, subdiv_type, volume in db.query(
+        session.id,
+        session.date,
+        session.category,
+        subdiv.type,
+        func.sum(subdiv.distance * func.coalesce(func.nullif(subdiv.reps, 0), 1))
+    ).join(
+        models.TrainingSeries, models.TrainingSeries.session_id == session.id
+    ).join(
+        subdiv, subdiv.series_id == models.TrainingSeries.id
+    ).filter(
+        _date_filter(session.date, dates),
+        session.status == "Completed",
+        subdiv.distance.isnot(None),
+        subdiv.distance != 0
+    ).group_by(session.id, session.date, session.category, subdiv.type):
+        volume = float(volume or 0)
+        completed_volumes[session_id].append((session_date, category, subdiv_type, volume))
+        row = rows[(session_date, category, None)]
+        row["completed_volume"] += volume
+        _add_volume_by_type(row, subdiv_type, volume, prefix="completed_")
+
+    # Executed volume of each athlete: the whole session for every athlete present at it
+    if completed_volumes:
+        for session_id, athlete_id in db.query(
+            models.SessionFeedback.session_id, models.SessionFeedback.athlete_id
+        ).join(
+            session, models.SessionFeedback.session_id == session.id
+        ).filter(
+            _date_filter(session.date, dates),
+            session.status == "Completed",
+            func.coalesce(models.SessionFeedback.attendance, "") != "Absent"
+        ).distinct():
+            for session_date, category, subdiv_type, volume in completed_volumes.get(session_id, []):
+                row = rows[(session_date, category, athlete_id)]
+                row["completed_volume"] += volume
+                _add_volume_by_type(row, subdiv_type, volume, prefix="completed_")
+
+    # --- Session-RPE load: rpe_real * km (of the series when the feedback is per series) ---
+    series_volume = db.query(
+        models.TrainingSeries.id.label("series_id"),
+        func.sum(subdiv.distance * func.coalesce(func.nullif(subdiv.reps, 0), 1)).label("volume")
+    ).join(
+        subdiv, subdiv.series_id == models.TrainingSeries.id
+    ).join(
+        session, models.TrainingSeries.session_id == session.id
+    ).filter(
+        _date_filter(session.date, dates)
+    ).group_by(models.TrainingSeries.id).subquery()
+
+    feedback_volume = case(
+        (models.SessionFeedback.series_id.isnot(None), func.coalesce(series_volume.c.volume, 0)),
+        else_=func.coalesce(session.total_volume, 0)
+    )
+    for session_date, category, athlete_id, rpe_load in db.query(
+        session.date,
+        session.category,
+        models.SessionFeedback.athlete_id,
+        func.sum(models.SessionFeedback.rpe_real * feedback_volume / 1000)
+    ).join(
+        session, models.SessionFeedback.session_id == session.id
+    ).outerjoin(
+        series_volume, series_volume.c.series_id == models.SessionFeedback.series_id
+    ).filter(
+        _date_filter(session.date, dates),
+        models.SessionFeedback.rpe_real.isnot(None),
+        func.coalesce(models.SessionFeedback.attendance, "") != "Absent"
+    ).group_by(session.date, session.category, models.SessionFeedback.athlete_id):
+        for key in ((session_date, category, None), (session_date, category, athlete_id)):
+            rows[key]["rpe_load"] += float(rpe_load or 0)
+            rows[key]["rpe_athletes"] += 1
+
+    # --- Attendance (all feedbacks, keyed by the date of their session) ---
+    for session_date, category, athlete_id, feedback_count, present_count in db.query(
+        session.date,
+        session.category,
+        models.SessionFeedback.athlete_id,
+        func.count(models.SessionFeedback.id),
+        func.sum(case((models.SessionFeedback.attendance == "Present", 1), else_=0))
+    ).join(
+        session, models.SessionFeedback.session_id == session.id
+    ).filter(
+        _date_filter(session.date, dates)
+    ).group_by(session.date, session.category, models.SessionFeedback.athlete_id):
+        for key in ((session_date, category, None), (session_date, category, athlete_id)):
+            rows[key]["feedback_count"] += feedback_count
+            rows[key]["present_count"] += int(present_count or 0)
+
+    return rows
+
+
+def _compute_gym_rows(db: Session, dates: Optional[set]) -> dict:
+    """Aggregate gym data per (date, category, athlete_id) for the given days."""
+    gym_session = models.GymSession
+    feedback = models.GymFeedback
+    load = models.GymLoadEntry
+    rows: dict = defaultdict(_new_row)
+
+    # --- Attendance ---
+    for session_date, category, athlete_id, feedback_count, present_count in db.query(
+        gym_session.date,
+        gym_session.category,
+        feedback.athlete_id,
+        func.count(feedback.id),
+        func.sum(case((feedback.attendance == "Present", 1), else_=0))
+    ).join(
+        feedback, feedback.session_id == gym_session.id
+    ).filter(
+        _date_filter(gym_session.date, dates)
+    ).group_by(gym_session.date, gym_session.category, feedback.athlete_id):
+        for row in (rows[(session_date, category, None)], rows[(session_date, category, athlete_id)]):
+            row["feedback_count"] += feedback_count
+            row["present_count"] += present_count or 0
+
+    # --- Loads (normalized per set), split by physical-motor capacity ---
+    for session_date, category, athlete_id, capacity, load_sum in db.query(
+        gym_session.date,
+        gym_session.category,
+        load.athlete_id,
+        load.physical_motor_capacity,
+        func.sum(load.load)
+    ).join(
+        load, load.session_id == gym_session.id
+    ).filter(
+        _date_filter(gym_session.date, dates)
+    ).group_by(gym_session.date, gym_session.category, load.athlete_id, load.physical_motor_capacity):
+        for row in (rows[(session_date, category, None)], rows[(session_date, category, athlete_id)]):
+            row["gym_load"] += load_sum or 0.0
+            if capacity:
+                row["gym_capacity_loads"][capacity] += load_sum or 0.0
+
+    # --- Sessions with recorded loads: once per athlete, once for the team ---
+    # Counted from the feedbacks (any non-empty performed_loads), not from the load
+    # entries, so a feedback whose sets are all empty still counts as a session.
+    sessions_with_loads = set()
+    for session_date, category, session_id, athlete_id, performed_loads in db.query(
+        gym_session.date,
+        gym_session.category,
+        feedback.session_id,
+        feedback.athlete_id,
+        feedback.performed_loads
+    ).join(
+        feedback, feedback.session_id == gym_session.id
+    ).filter(
+        _date_filter(gym_session.date, dates)
+    ):
+        if not performed_loads:
+            continue
+        rows[(session_date, category, athlete_id)]["gym_sessions"] += 1
+        if session_id not in sessions_with_loads:
+            sessions_with_loads.add(session_id)
+            rows[(session_date, category, None)]["gym_sessions"] += 1
+
+    return rows
+
+
+def _replace_rows(db: Session, kind: str, dates: Optional[set], rows: dict) -> None:
+    query = db.query(models.DailyTrainingRollup).filter(models.DailyTrainingRollup.kind == kind)
+    if dates is not None:
+        query = query.filter(models.DailyTrainingRollup.date.in_(dates))
+    query.delete(synchronize_session=False)
+
+    db.add_all([
+        models.DailyTrainingRollup(
+            date=row_date,
+            kind=kind,
+            category=category,
+            athlete_id=athlete_id,
+            **{field: values[field] for field in ROLLUP_SUM_FIELDS},
+            functional_base_volumes=dict(values["functional_base_volumes"]),
+            gym_capacity_loads=dict(values["gym_capacity_loads"]),
+        )
+        for (row_date, category, athlete_id), values in rows.items()
+    ])
+    db.flush()
+
+
+def _stored_athlete_loads(db: Session, kind: str, dates: set) -> dict:
+    """Current {(athlete_id, date): training load} of the athlete rows of the given days."""
+    rollup = models.DailyTrainingRollup
+    loads: dict = defaultdict(float)
+    for athlete_id, row_date, rpe_load, gym_load in db.query(
+        rollup.athlete_id, rollup.date, rollup.rpe_load, rollup.gym_load
+    ).filter(
+        rollup.kind == kind,
+        rollup.date.in_(dates),
+        rollup.athlete_id.isnot(None)
+    ):
+        loads[(athlete_id, row_date)] += athlete_load.training_load(rpe_load, gym_load)
+    return loads
+
+
+def _replace_days(db: Session, kind: str, dates: set, rows: dict) -> None:
+    """Replace the rows of the given days and pass the athletes' load changes to athlete_load."""
+    deltas = defaultdict(float)
+    for key, load in _stored_athlete_loads(db, kind, dates).items():
+        deltas[key] -= load
+    _replace_rows(db, kind, dates, rows)
+    for (row_date, _, athlete_id), values in rows.items():
+        if athlete_id is not None:
+            deltas[(athlete_id, row_date)] += athlete_load.training_load(values["rpe_load"], values["gym_load"])
+    athlete_load.apply_load_deltas(db, deltas)
+
+
+def _as_dates(dates: Iterable[Optional[date]]) -> set:
+    return {d for d in dates if d is not None}
+
+
+def refresh_pool_days(db: Session, dates: Iterable[Optional[date]]) -> None:
+    """Rebuild the swimming rollup rows of the given days (call before commit)."""
+    dates = _as_dates(dates)
+    if not dates:
+        return
+    db.flush()
+    _replace_days(db, POOL, dates, _compute_pool_rows(db, dates))
+    invalidate_on_commit(db, dates)
+
+
+def refresh_gym_days(db: Session, dates: Iterable[Optional[date]]) -> None:
+    """Rebuild the gym rollup rows of the given days (call before commit)."""
+    dates = _as_dates(dates)
+    if not dates:
+        return
+    db.flush()
+    _replace_days(db, GYM, dates, _compute_gym_rows(db, dates))
+    invalidate_on_commit(db, dates)
+
+
+def pool_session_dates(db: Session, session_id: int) -> set:
+    """Days whose pool rollup depends on a session: its own and its plan's."""
+    session = db.query(models.TrainingSession).filter(models.TrainingSession.id == session_id).first()
+    if not session:
+        return set()
+    dates = {session.date}
+    if session.parent_session:
+        dates.add(session.parent_session.date)
+    return dates
+
+
+def rebuild_all(db: Session) -> None:
+    """Rebuild every rollup row from the raw training data (backfill), then the athletes' loads."""
+    _replace_rows(db, POOL, None, _compute_pool_rows(db, None))
+    _replace_rows(db, GYM, None, _compute_gym_rows(db, None))
+    athlete_load.rebuild_all(db)
+    invalidate_all_on_commit(db)
+
+
+def sum_rollup(db: Session, kind: str, start_date: date, end_date: date, athlete_id: Optional[int] = None) -> dict:
+    """Sum the rollup rows of a date range for the team (athlete_id None) or one athlete."""
+    rollup = models.DailyTrainingRollup
+    filters = [
+        rollup.kind == kind,
+        rollup.date >= start_date,
+        rollup.date <= end_date,
+        rollup.athlete_id == athlete_id if athlete_id else rollup.athlete_id.is_(None),
+    ]
+
+    sums = db.query(
+        *[func.coalesce(func.sum(getattr(rollup, field)), 0) for field in ROLLUP_SUM_FIELDS]
+    ).filter(*filters).one()
+    totals = dict(zip(ROLLUP_SUM_FIELDS, sums))
+
+    json_field = "functional_base_volumes" if kind == POOL else "gym_capacity_loads"
+    merged: dict = defaultdict(float)
+    for (values,) in db.query(getattr(rollup, json_field)).filter(*filters):
+        for key, value in (values or {}).items():
+            merged[key] += value
+    totals[json_field] = dict(merged)
+
+    return totals
+
+
+def sum_rollup_by_day(db: Session, kind: str, start_date: date, end_date: date, athlete_id: Optional[int] = None) -> dict:
+    """Like sum_rollup, but returns one totals dict per day so callers can bucket a range."""
+    rollup = models.DailyTrainingRollup
+    json_field = "functional_base_volumes" if kind == POOL else "gym_capacity_loads"
+
+    days: dict = {}
+    for row in db.query(
+        rollup.date,
+        *[getattr(rollup, field) for field in ROLLUP_SUM_FIELDS],
+        getattr(rollup, json_field)
+    ).filter(
+        rollup.kind == kind,
+        rollup.date >= start_date,
+        rollup.date <= end_date,
+        rollup.athlete_id == athlete_id if athlete_id else rollup.athlete_id.is_(None),
+    ):
+        day = days.setdefault(row[0], {field: 0 for field in ROLLUP_SUM_FIELDS} | {json_field: defaultdict(float)})
+        for field, value in zip(ROLLUP_SUM_FIELDS, row[1:-1]):
+            day[field] += value or 0
+        for key, value in (row[-1] or {}).items():
+            day[json_field][key] += value
+
+    return days
+
+
+def sum_rollup_series(
+    db: Session, start_date: date, end_date: date, fields: Iterable[str], athlete_id: Optional[int] = None
+) -> dict:
+    """Daily sums of some rollup fields for both kinds in one GROUP BY. Returns {(kind, date): {field: value}}."""
+    rollup = models.DailyTrainingRollup
+    fields = list(fields)
+
+    days: dict = {}
+    for row in db.query(
+        rollup.kind,
+        rollup.date,
+        *[func.coalesce(func.sum(getattr(rollup, field)), 0) for field in fields]
+    ).filter(
+        rollup.date >= start_date,
+        rollup.date <= end_date,
+        rollup.athlete_id == athlete_id if athlete_id else rollup.athlete_id.is_(None),
+    ).group_by(rollup.kind, rollup.date):
+        days[(row[0], row[1])] = dict(zip(fields, row[2:]))
+
+    return days
+
+
+def combine_totals(kind: str, totals_list: Iterable[dict]) -> dict:
+    """Add up totals dicts returned by sum_rollup/sum_rollup_by_day."""
+    json_field = "functional_base_volumes" if kind == POOL else "gym_capacity_loads"
+    combined = {field: 0 for field in ROLLUP_SUM_FIELDS}
+    merged: dict = defaultdict(float)
+    for totals in totals_list:
+        for field in ROLLUP_SUM_FIELDS:
+            combined[field] += totals[field]
+        for key, value in totals[json_field].items():
+            merged[key] += value
+    combined[json_field] = dict(merged)
+    return combined
+
+
+def sum_rollup_by_athlete(db: Session, kind: str, start_date: date, end_date: date) -> dict:
+    """Sum the athlete rows of a date range with one GROUP BY athlete_id. Returns {athlete_id: totals}."""
+    rollup = models.DailyTrainingRollup
+    filters = [
+        rollup.kind == kind,
+        rollup.date >= start_date,
+        rollup.date <= end_date,
+        rollup.athlete_id.isnot(None),
+    ]
+
+    athletes: dict = {}
+    for row in db.query(
+        rollup.athlete_id,
+        *[func.coalesce(func.sum(getattr(rollup, field)), 0) for field in ROLLUP_SUM_FIELDS]
+    ).filter(*filters).group_by(rollup.athlete_id):
+        athletes[row[0]] = dict(zip(ROLLUP_SUM_FIELDS, row[1:]))
+
+    return athletes
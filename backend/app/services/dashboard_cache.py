@@ -0,0 +1,177 @@
+"""
+In-process cache for cycle dashboard responses.
+
+Entries are keyed by (cycle level, cycle id, athlete_id), expire after a TTL
+and are evicted in LRU order. Writes register the days they touched with
+invalidate_on_commit(); once the transaction commits, every entry whose cycle
+date range contains one of those days is dropped. Changes that also affect later
+ranges (a body weight applies until the next weighing) use
+invalidate_from_on_commit(), which drops every range ending on or after the day.
+
+The cache lives in the worker process, so with several workers an entry can
+outlive a write made through another worker for at most the TTL.
+"""
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Callable, Hashable, Iterable, List, Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+PENDING_DATES_KEY = "dashboard_cache_pending_dates"
+PENDING_CLEAR_KEY = "dashboard_cache_pending_clear"
+PENDING_SINCE_KEY = "dashboard_cache_pending_since"
+
+
+class DashboardCache:
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        # Bumped on every invalidation so results computed before a write are not stored
+        self.generation = 0
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, start_date: date, end_date: date) -> Optional[Any]:
+        """Return the cached value, or None if missing, expired or the cycle range changed."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, entry_start, entry_end, expires_at = entry
+                if expires_at > time.monotonic() and (entry_start, entry_end) == (start_date, end_date):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, key: Hashable, value: Any, start_date: date, end_date: date, generation: int) -> None:
+        """Store a value computed while the cache was at `generation`."""
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = (value, start_date, end_date, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate_dates(self, dates: Iterable[date]) -> None:
+        """Drop every entry whose date range contains one of the given days."""
+        dates = [d for d in dates if d is not None]
+        if not dates:
+            return
+        with self._lock:
+            self.generation += 1
+            stale = [
+                key for key, (_, start_date, end_date, _) in self._entries.items()
+                if any(start_date <= d <= end_date for d in dates)
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def invalidate_since(self, since: date) -> None:
+        """Drop every entry whose date range ends on or after `since`."""
+        with self._lock:
+            self.generation += 1
+            stale = [key for key, (_, _, end_date, _) in self._entries.items() if end_date >= since]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+dashboard_cache = DashboardCache(
+    max_entries=settings.DASHBOARD_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.DASHBOARD_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_on_commit(db: Session, dates: Iterable[Optional[date]]) -> None:
+    """Invalidate the dashboards covering these days once `db` commits."""
+    db.info.setdefault(PENDING_DATES_KEY, set()).update(d for d in dates if d is not None)
+
+
+def invalidate_from_on_commit(db: Session, dates: Iterable[Optional[date]]) -> None:
+    """Invalidate the dashboards ending on or after the earliest of these days once `db` commits."""
+    dates = [d for d in dates if d is not None]
+    if not dates:
+        return
+    since = db.info.get(PENDING_SINCE_KEY)
+    db.info[PENDING_SINCE_KEY] = min(dates) if since is None else min(since, *dates)
+
+
+def invalidate_all_on_commit(db: Session) -> None:
+    """Clear the whole cache once `db` commits (e.g. configuration or roster changes)."""
+    db.info[PENDING_CLEAR_KEY] = True
+
+
+# Other in-memory views fed by the same write notifications (e.g. the home snapshot)
+Listener = Callable[[Optional[Set[date]], Optional[date]], None]
+_invalidation_listeners: List[Listener] = []
+
+
+def on_invalidate(listener: Listener) -> None:
+    """
+    Call `listener(dates, since)` after each commit that invalidated something: ranges
+    containing one of `dates` and ranges ending on or after `since` are stale
+    (`listener(None, None)` on a full clear).
+    """
+    _invalidation_listeners.append(listener)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    dates = session.info.pop(PENDING_DATES_KEY, None)
+    since = session.info.pop(PENDING_SINCE_KEY, None)
+    if session.info.pop(PENDING_CLEAR_KEY, False):
+        dashboard_cache.clear()
+        dates = since = None
+    elif dates or since:
+        if dates:
+            dashboard_cache.invalidate_dates(dates)
+        if since:
+            dashboard_cache.invalidate_since(since)
+        dates = dates or set()
+    else:
+        return
+    for listener in _invalidation_listeners:
+        listener(dates, since)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(PENDING_DATES_KEY, None)
+    session.info.pop(PENDING_CLEAR_KEY, None)
+    session.info.pop(PENDING_SINCE_KEY, None)
@@ -0,0 +1,113 @@
+"""
+Concurrent evaluation of independent dashboard sections.
+
+Each section is a read-only callable taking a Session. With
+DASHBOARD_SECTION_WORKERS > 1 the sections of one dashboard run in a shared
+thread pool, each on its own pooled connection, so the wall-clock time is close
+to the slowest section instead of the sum. In async mode run_sections_async
+does the same with one AsyncSession per section. Per-section durations (ms) are
+collected for the Server-Timing header.
+
+Before fanning out, the request session's read-only transaction is ended so its
+connection goes back to the pool: otherwise every concurrent dashboard would hold
+one connection while waiting for the sections' ones, and enough of them at once
+exhaust the pool and time out.
+"""
+import asyncio
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db import async_session
+from app.db.session import SessionLocal
+
+Section = Callable[[Session], Any]
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.DASHBOARD_SECTION_WORKERS,
+            thread_name_prefix="dashboard-section",
+        )
+    return _executor
+
+
+def _timed(section: Section, db: Session) -> tuple:
+    started = time.perf_counter()
+    value = section(db)
+    return value, (time.perf_counter() - started) * 1000
+
+
+def _release_connection(db: Session) -> None:
+    """Return the connection of a session without pending changes to the pool, keeping its objects loaded."""
+    if not db.in_transaction() or db.new or db.dirty or db.deleted:
+        return
+    expire_on_commit = db.expire_on_commit
+    db.expire_on_commit = False
+    try:
+        db.commit()
+    finally:
+        db.expire_on_commit = expire_on_commit
+
+
+def _run_on_own_session(section: Section) -> tuple:
+    db = SessionLocal()
+    try:
+        return _timed(section, db)
+    finally:
+        db.close()
+
+
+def run_sections(db: Session, sections: Dict[str, Section], timings: Optional[dict] = None) -> dict:
+    """Evaluate {name: section} and return {name: value}, recording durations into `timings`."""
+    if settings.DASHBOARD_SECTION_WORKERS <= 1 or len(sections) <= 1:
+        outcomes = {name: _timed(section, db) for name, section in sections.items()}
+    else:
+        _release_connection(db)
+        executor = _get_executor()
+        # Run in a copy of the request context so per-request query stats keep counting
+        futures = {
+            name: executor.submit(contextvars.copy_context().run, _run_on_own_session, section)
+            for name, section in sections.items()
+        }
+        outcomes = {name: future.result() for name, future in futures.items()}
+
+    if timings is not None:
+        timings.update({name: duration for name, (_, duration) in outcomes.items()})
+    return {name: value for name, (value, _) in outcomes.items()}
+
+
+async def run_sections_async(
+    sections: Dict[str, Section],
+    timings: Optional[dict] = None,
+    db: Optional[AsyncSession] = None,
+) -> dict:
+    """Async counterpart of run_sections: every section runs on its own AsyncSession."""
+    if db is not None:
+        await db.run_sync(_release_connection)
+    async def run(section: Section) -> tuple:
+        async with async_session.AsyncSessionLocal() as db:
+            started = time.perf_counter()
+            value = await db.run_sync(section)
+            return value, (time.perf_counter() - started) * 1000
+
+    results = await asyncio.gather(*(run(section) for section in sections.values()))
+    outcomes = dict(zip(sections.keys(), results))
+
+    if timings is not None:
+        timings.update({name: duration for name, (_, duration) in outcomes.items()})
+    return {name: value for name, (value, _) in outcomes.items()}
+
+
+def server_timing_header(timings: dict) -> str:
+    """Format {metric: duration_ms} as a Server-Timing header value."""
+    return ", ".join(f"{name};dur={duration:.1f}" for name, duration in timings.items())
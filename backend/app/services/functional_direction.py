@@ -0,0 +1,63 @@
+"""
+Functional base -> configured functional direction matching.
+
+Subdivisions store a normalized key of their functional base at write time
+(TrainingSubdivision.functional_base_key), and the rollup sums volume per key
+in SQL. Dashboards then resolve the few distinct keys with a matcher compiled
+once per configuration of ConfigFunctionalDirectionRange.
+"""
+from functools import lru_cache
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app import models
+from app.models.training import normalize_functional_base
+
+
+class FunctionalDirectionMatcher:
+    def __init__(self, directions: tuple):
+        """Compile from the configured direction names, in configuration order."""
+        self.directions = directions
+        self._name_by_key: dict = {}
+        for direction in directions:
+            self._name_by_key[normalize_functional_base(direction) or ""] = direction
+        self._resolved: dict = {}
+
+    def resolve(self, functional_base_key: str) -> Optional[str]:
+        """Configured direction of a key: exact match first, then substring match either way."""
+        if functional_base_key in self._resolved:
+            return self._resolved[functional_base_key]
+
+        key = normalize_functional_base(functional_base_key) or ""
+        direction = self._name_by_key.get(key)
+        if direction is None:
+            for normalized_key, name in self._name_by_key.items():
+                if normalized_key in key or key in normalized_key:
+                    direction = name
+                    break
+
+        self._resolved[functional_base_key] = direction
+        return direction
+
+    def direction_volumes(self, functional_base_volumes: dict) -> dict:
+        """Sum {functional_base_key: volume} into {direction: volume} (every configured direction present)."""
+        volumes = {direction: 0.0 for direction in self.directions}
+        for key, volume in functional_base_volumes.items():
+            direction = self.resolve(key)
+            if direction is not None:
+                volumes[direction] += volume
+        return volumes
+
+
+@lru_cache(maxsize=8)
+def _compile_matcher(directions: tuple) -> FunctionalDirectionMatcher:
+    return FunctionalDirectionMatcher(directions)
+
+
+def get_direction_matcher(db: Session) -> FunctionalDirectionMatcher:
+    """Matcher for the current configuration (compiled once per distinct configuration)."""
+    directions = tuple(direction for (direction,) in db.query(
+        models.ConfigFunctionalDirectionRange.direction
+    ).order_by(models.ConfigFunctionalDirectionRange.id))
+    return _compile_matcher(directions)
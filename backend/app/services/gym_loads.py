@@ -0,0 +1,61 @@
+"""
+Normalized gym loads.
+
+GymFeedback.performed_loads ({"Exercise": [load, ...]}) stays the source of
+truth for the API; every write also rewrites the feedback's GymLoadEntry rows
+(one per set, tagged with the exercise's physical-motor capacity from the
+session snapshot) so aggregations can GROUP BY in SQL.
+"""
+from typing import Iterable, Optional
+
+from app import models
+
+
+def exercise_capacities(exercises_snapshot: Optional[Iterable[dict]]) -> dict:
+    """Map exercise name -> physical-motor capacity (first occurrence wins)."""
+    capacities = {}
+    for ex in exercises_snapshot or []:
+        capacities.setdefault(ex.get("name"), ex.get("physicalMotorCapacity") or None)
+    return capacities
+
+
+def build_load_entries(
+    performed_loads: Optional[dict],
+    capacities: dict,
+    session_id: int,
+    athlete_id: int,
+) -> list:
+    """Load entry dicts (one per set) for a feedback's performed_loads JSON."""
+    entries = []
+    for exercise_name, loads in (performed_loads or {}).items():
+        if not isinstance(loads, list):
+            continue
+        for set_index, load in enumerate(loads):
+            if load is None:
+                continue
+            entries.append({
+                "session_id": session_id,
+                "athlete_id": athlete_id,
+                "exercise_name": exercise_name,
+                "physical_motor_capacity": capacities.get(exercise_name),
+                "set_index": set_index,
+                "load": float(load),
+            })
+    return entries
+
+
+def sync_feedback_loads(feedback: models.GymFeedback, capacities: dict) -> None:
+    """Rewrite the load entries of one feedback from its performed_loads (old rows are orphan-deleted)."""
+    feedback.load_entries = [
+        models.GymLoadEntry(**entry)
+        for entry in build_load_entries(
+            feedback.performed_loads, capacities, feedback.session_id, feedback.athlete_id
+        )
+    ]
+
+
+def sync_session_loads(session: models.GymSession) -> None:
+    """Rewrite the load entries of every feedback of a session (e.g. after its exercises changed)."""
+    capacities = exercise_capacities(session.exercises_snapshot)
+    for feedback in session.feedbacks:
+        sync_feedback_loads(feedback, capacities)
@@ -0,0 +1,89 @@
+"""
+In-memory snapshot of the home dashboard indicators for the current day.
+
+The snapshot is split into parts, each tied to the date range it aggregates
+(the current week for the week volume, the current meso for the DDR/DCR split)
+or to none (athlete count, current micro/meso). A commit that touches some days
+(see dashboard_cache.invalidate_on_commit) only drops the parts whose range
+contains one of them (or, for body-weight changes, ends on or after the day), so
+the next request recomputes those parts alone; roster and cycle changes clear the
+whole snapshot. It also starts over on a new day
+and after DASHBOARD_CACHE_TTL_SECONDS, which bounds staleness across workers.
+
+Today's agendas are not part of the snapshot: they are read live on every request.
+"""
+import threading
+import time
+from datetime import date
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.services.dashboard_cache import on_invalidate
+
+DateRange = Optional[Tuple[date, date]]
+
+
+class HomeSnapshot:
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self.day: Optional[date] = None
+        self.expires_at = 0.0
+        self.hits = 0
+        self.refreshes = 0
+        # Bumped on every invalidation so parts computed before a write are not stored
+        self.generation = 0
+        self._parts: Dict[str, Tuple[Any, DateRange]] = {}
+        self._lock = threading.Lock()
+
+    def part(self, today: date, name: str, date_range: DateRange, compute: Callable[[], Any]) -> Any:
+        """Value of a part for `today`, computed (and stored) only when missing or its range changed."""
+        with self._lock:
+            if self.day != today or self.expires_at <= time.monotonic():
+                self._parts.clear()
+                self.day = today
+                self.expires_at = time.monotonic() + self.ttl_seconds
+            entry = self._parts.get(name)
+            if entry is not None and entry[1] == date_range:
+                self.hits += 1
+                return entry[0]
+            generation = self.generation
+
+        value = compute()
+        with self._lock:
+            self.refreshes += 1
+            if generation == self.generation and self.day == today and self.ttl_seconds > 0:
+                self._parts[name] = (value, date_range)
+        return value
+
+    def invalidate(self, dates: Optional[Set[date]], since: Optional[date] = None) -> None:
+        """
+        Drop the parts covering any of `dates` or ending on or after `since`
+        (every part when `dates` is None), the same rule as the dashboard cache.
+        """
+        with self._lock:
+            self.generation += 1
+            if dates is None:
+                self._parts.clear()
+                return
+            stale = [
+                name for name, (_, date_range) in self._parts.items()
+                if date_range is not None and (
+                    any(date_range[0] <= d <= date_range[1] for d in dates)
+                    or (since is not None and date_range[1] >= since)
+                )
+            ]
+            for name in stale:
+                del self._parts[name]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "day": self.day,
+                "parts": sorted(self._parts),
+                "hits": self.hits,
+                "refreshes": self.refreshes,
+            }
+
+
+home_snapshot = HomeSnapshot(ttl_seconds=settings.DASHBOARD_CACHE_TTL_SECONDS)
+on_invalidate(home_snapshot.invalidate)
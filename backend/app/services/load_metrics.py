@@ -0,0 +1,57 @@
+"""
+Training-load monitoring metrics over daily load series.
+
+Everything is computed from prefix sums (cumulative sum of the loads and of
+their squares), so any rolling-window sum, mean or standard deviation is a
+difference of two prefix values: O(n) for the whole series however long the
+windows are.
+
+- ACWR (acute:chronic workload ratio): 7-day load / average weekly load of the
+  last 28 days (coupled rolling averages).
+- Monotony: mean daily load / standard deviation of the daily loads of a week.
+- Strain: weekly load * monotony.
+"""
+from itertools import accumulate
+from math import sqrt
+from typing import List, Optional, Sequence
+
+ACUTE_DAYS = 7
+CHRONIC_DAYS = 28
+
+
+def prefix_sums(values: Sequence[float]) -> List[float]:
+    """[0, v0, v0+v1, ...] so sum(values[i:j]) == sums[j] - sums[i]."""
+    return list(accumulate(values, initial=0.0))
+
+
+def square_prefix_sums(values: Sequence[float]) -> List[float]:
+    return prefix_sums([value * value for value in values])
+
+
+def rolling_sums(sums: List[float], window: int) -> List[float]:
+    """Sum of the last `window` values at each position (shorter at the start)."""
+    return [sums[i] - sums[max(0, i - window)] for i in range(1, len(sums))]
+
+
+def acwr_series(loads: Sequence[float]) -> List[Optional[float]]:
+    """Daily ACWR; None until 28 days of history are available or while the chronic load is 0."""
+    sums = prefix_sums(loads)
+    acute = rolling_sums(sums, ACUTE_DAYS)
+    chronic = rolling_sums(sums, CHRONIC_DAYS)
+    return [
+        acute[i] / (chronic[i] / (CHRONIC_DAYS / ACUTE_DAYS)) if i >= CHRONIC_DAYS - 1 and chronic[i] > 0 else None
+        for i in range(len(loads))
+    ]
+
+
+def window_monotony_strain(sums: List[float], square_sums: List[float], start: int, end: int) -> tuple:
+    """(total, monotony, strain) of loads[start:end]; monotony is None for a constant window."""
+    days = end - start
+    total = sums[end] - sums[start]
+    mean = total / days
+    variance = (square_sums[end] - square_sums[start]) / days - mean * mean
+    # Relative tolerance: the prefix-sum difference leaves rounding noise on constant windows
+    if variance <= 1e-12 * mean * mean:
+        return total, None, None
+    monotony = mean / sqrt(variance)
+    return total, monotony, total * monotony
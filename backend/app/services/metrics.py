@@ -0,0 +1,200 @@
+"""
+Prometheus metrics served by the app itself at /metrics (text exposition format).
+
+Request metrics are recorded by the middleware in app/main.py. Gauges that can
+be read on demand (DB pool, dashboard cache) are collected when /metrics is
+scraped. Values live in the worker process: with several workers, each one
+reports its own series (scrape them individually or aggregate per instance).
+"""
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Tuple
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+Labels = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Histogram:
+    def __init__(self, name: str, documentation: str, label_names: Labels, buckets: Tuple[float, ...]):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.buckets = tuple(buckets)
+        # labels -> [per-bucket counts (+Inf last), sum, count]
+        self._series: Dict[Labels, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: Labels, value: float) -> None:
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][bisect_left(self.buckets, value)] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = {labels: (list(counts), total, count) for labels, (counts, total, count) in self._series.items()}
+        for labels, (counts, total, count) in sorted(series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                bucket_labels = _format_labels(self.label_names + ("le",), labels + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            label_text = _format_labels(self.label_names, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(total)}")
+            lines.append(f"{self.name}_count{label_text} {count}")
+        return lines
+
+
+class Gauge:
+    def __init__(self, name: str, documentation: str):
+        self.name = name
+        self.documentation = documentation
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} gauge",
+            f"{self.name} {_format_value(self.value)}",
+        ]
+
+
+# A collector returns (name, type, help, [(labels dict, value), ...]) tuples at scrape time
+Collector = Callable[[], Iterable[tuple]]
+
+_collectors: List[Collector] = []
+
+
+def register_collector(collector: Collector) -> Collector:
+    _collectors.append(collector)
+    return collector
+
+
+def _render_collected(name: str, metric_type: str, documentation: str, samples: Iterable[tuple]) -> List[str]:
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} {metric_type}"]
+    for labels, value in samples:
+        lines.append(f"{name}{_format_labels(labels.keys(), labels.values())} {_format_value(value)}")
+    return lines
+
+
+request_latency = Histogram(
+    "http_request_duration_seconds", "Request latency by route template.",
+    ("method", "route", "status"), LATENCY_BUCKETS,
+)
+response_size = Histogram(
+    "http_response_size_bytes", "Response body size by route template (when Content-Length is known).",
+    ("method", "route"), SIZE_BUCKETS,
+)
+request_queries = Histogram(
+    "http_request_db_queries", "SQL statements executed per request by route template.",
+    ("method", "route"), QUERY_BUCKETS,
+)
+requests_in_flight = Gauge("http_requests_in_flight", "Requests being served.")
+
+
+def observe_request(method: str, route: str, status: int, duration: float, size, queries: int) -> None:
+    request_latency.observe((method, route, str(status)), duration)
+    request_queries.observe((method, route), queries)
+    if size is not None:
+        response_size.observe((method, route), int(size))
+
+
+def render() -> str:
+    lines: List[str] = []
+    for metric in (request_latency, response_size, request_queries, requests_in_flight):
+        lines.extend(metric.render())
+    # Collectors may report the same family (e.g. cache_hits_total for each cache): the
+    # exposition format allows one HELP/TYPE per name, so their samples are merged
+    families: Dict[str, tuple] = {}
+    for collector in _collectors:
+        for name, metric_type, documentation, samples in collector():
+            family = families.setdefault(name, (metric_type, documentation, []))
+            if family[0] != metric_type:
+                raise ValueError(f"metric {name} collected as both {family[0]} and {metric_type}")
+            family[2].extend(samples)
+    for name, (metric_type, documentation, samples) in families.items():
+        lines.extend(_render_collected(name, metric_type, documentation, samples))
+    return "\n".join(lines) + "\n"
+
+
+@register_collector
+def _collect_db_pools() -> Iterable[tuple]:
+    from app.db import async_session
+    from app.db.session import engine
+
+    engines = [("sync", engine)]
+    if async_session.async_engine is not None:
+        engines.append(("async", async_session.async_engine.sync_engine))
+
+    pools = [(name, engine.pool) for name, engine in engines]
+    for metric, method, documentation in (
+        ("db_pool_size", "size", "Configured pool size."),
+        ("db_pool_checked_out", "checkedout", "Connections currently checked out of the pool."),
+        ("db_pool_overflow", "overflow", "Connections opened beyond the pool size."),
+        ("db_pool_checked_in", "checkedin", "Idle connections in the pool."),
+    ):
+        samples = [({"pool": name}, getattr(pool, method)()) for name, pool in pools if hasattr(pool, method)]
+        if method == "overflow":
+            # QueuePool counts from -pool_size until the pool is full
+            samples = [(labels, max(value, 0)) for labels, value in samples]
+        if samples:
+            yield metric, "gauge", documentation, samples
+
+
+@register_collector
+def _collect_dashboard_cache() -> Iterable[tuple]:
+    from app.services.dashboard_cache import dashboard_cache
+
+    stats = dashboard_cache.stats()
+    cache = {"cache": "dashboard"}
+    yield "cache_hits_total", "counter", "Cache lookups served from the cache.", [(cache, stats["hits"])]
+    yield "cache_misses_total", "counter", "Cache lookups that had to compute the value.", [(cache, stats["misses"])]
+    yield "cache_hit_ratio", "gauge", "Hits / lookups since the process started.", [(cache, stats["hit_ratio"])]
+    yield "cache_entries", "gauge", "Entries currently cached.", [(cache, stats["entries"])]
+    yield "cache_evictions_total", "counter", "Entries evicted to respect the size limit.", [(cache, stats["evictions"])]
+    yield "cache_invalidations_total", "counter", "Entries dropped by writes.", [(cache, stats["invalidations"])]
+
+
+@register_collector
+def _collect_home_snapshot() -> Iterable[tuple]:
+    from app.services.home_snapshot import home_snapshot
+
+    stats = home_snapshot.stats()
+    cache = {"cache": "home_snapshot"}
+    lookups = stats["hits"] + stats["refreshes"]
+    yield "cache_hits_total", "counter", "Cache lookups served from the cache.", [(cache, stats["hits"])]
+    yield "cache_misses_total", "counter", "Cache lookups that had to compute the value.", [(cache, stats["refreshes"])]
+    yield "cache_hit_ratio", "gauge", "Hits / lookups since the process started.", [
+        (cache, round(stats["hits"] / lookups, 4) if lookups else 0.0)
+    ]
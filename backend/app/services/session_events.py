@@ -0,0 +1,163 @@
+"""
+Live events of training sessions, streamed to clients as Server-Sent Events.
+
+Write endpoints register events with publish_on_commit(); once the transaction
+commits they are fanned out to every subscriber of that session (and kept in a
+short per-session history so reconnecting clients can resume from
+Last-Event-ID). Rolled back transactions publish nothing.
+
+The broker lives in the worker process: with several workers, clients only see
+events of writes handled by the worker they are connected to.
+"""
+import asyncio
+import json
+import threading
+from collections import OrderedDict, deque
+from typing import Any, AsyncIterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+PENDING_EVENTS_KEY = "session_events_pending"
+
+HISTORY_SIZE = 200  # Events kept per session for Last-Event-ID resumption
+MAX_SESSIONS = 128  # Sessions with history kept (least recently published dropped first)
+QUEUE_SIZE = 500  # Per-subscriber backlog before it is told to reload
+
+
+class SessionEventBroker:
+    def __init__(self):
+        self._last_id = 0
+        # session_id -> [recent messages, id of the newest message dropped from them]
+        self._history: "OrderedDict[int, list]" = OrderedDict()
+        # Newest message id among the histories dropped to respect MAX_SESSIONS
+        self._evicted_up_to = 0
+        self._subscribers: dict = {}
+        self._lock = threading.Lock()
+
+    @property
+    def last_event_id(self) -> int:
+        """Cursor to subscribe from, to receive everything published after this point."""
+        with self._lock:
+            return self._last_id
+
+    def publish(self, session_id: int, event_name: str, data: Any) -> None:
+        """Send an event to the subscribers of a session (safe to call from any thread)."""
+        with self._lock:
+            self._last_id += 1
+            message = (self._last_id, event_name, data)
+            history = self._history.get(session_id)
+            if history is None:
+                history = self._history[session_id] = [deque(maxlen=HISTORY_SIZE), 0]
+            messages = history[0]
+            if len(messages) == messages.maxlen:
+                history[1] = messages[0][0]
+            messages.append(message)
+            self._history.move_to_end(session_id)
+            while len(self._history) > MAX_SESSIONS:
+                _, (evicted, _) = self._history.popitem(last=False)
+                self._evicted_up_to = max(self._evicted_up_to, evicted[-1][0])
+            subscribers = list(self._subscribers.get(session_id, ()))
+
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(_enqueue, queue, message)
+            except RuntimeError:
+                # Subscriber's event loop already closed
+                pass
+
+    def subscribe(self, session_id: int, after_id: Optional[int] = None) -> asyncio.Queue:
+        """Queue receiving the session's events, starting with those published after `after_id`.
+        
+        If events after that cursor can no longer be replayed (history trimmed, or a
+        cursor from another process), the queue starts with a "reload" event instead.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        with self._lock:
+            self._subscribers.setdefault(session_id, set()).add((asyncio.get_running_loop(), queue))
+            if after_id is not None:
+                history = self._history.get(session_id)
+                trimmed_up_to = history[1] if history else self._evicted_up_to
+                if after_id > self._last_id or after_id < trimmed_up_to:
+                    queue.put_nowait((None, "reload", {}))
+                elif history:
+                    for message in history[0]:
+                        if message[0] > after_id:
+                            queue.put_nowait(message)
+        return queue
+
+    def unsubscribe(self, session_id: int, queue: asyncio.Queue) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(session_id)
+            if not subscribers:
+                return
+            subscribers.difference_update({entry for entry in subscribers if entry[1] is queue})
+            if not subscribers:
+                del self._subscribers[session_id]
+
+
+def _enqueue(queue: asyncio.Queue, message: tuple) -> None:
+    try:
+        queue.put_nowait(message)
+    except asyncio.QueueFull:
+        # Slow client: drop the backlog and ask it to re-fetch the session
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait((None, "reload", {}))
+
+
+def event_payload(schema: Any, obj: Any) -> dict:
+    """JSON-ready payload of an ORM object through a response schema."""
+    return schema.model_validate(obj, from_attributes=True).model_dump(mode="json")
+
+
+def format_sse(message: tuple) -> str:
+    event_id, event_name, data = message
+    lines = [] if event_id is None else [f"id: {event_id}"]
+    lines.append(f"event: {event_name}")
+    lines.append(f"data: {json.dumps(data, default=str)}")
+    return "\n".join(lines) + "\n\n"
+
+
+async def event_stream(
+    session_id: int,
+    after_id: Optional[int] = None,
+    initial: Optional[tuple] = None,
+    heartbeat_seconds: float = 15.0,
+) -> AsyncIterator[str]:
+    """SSE body for one session: optional initial message, then live events until it is deleted."""
+    queue = session_events.subscribe(session_id, after_id)
+    try:
+        if initial is not None:
+            yield format_sse(initial)
+        while True:
+            try:
+                message = await asyncio.wait_for(queue.get(), timeout=heartbeat_seconds)
+            except asyncio.TimeoutError:
+                # Comment line keeps proxies from closing an idle connection
+                yield ": keep-alive\n\n"
+                continue
+            yield format_sse(message)
+            if message[1] == "deleted":
+                break
+    finally:
+        session_events.unsubscribe(session_id, queue)
+
+
+session_events = SessionEventBroker()
+
+
+def publish_on_commit(db: Session, session_id: int, event_name: str, data: Any) -> None:
+    """Publish an event for a training session once `db` commits (data must be JSON-ready)."""
+    db.info.setdefault(PENDING_EVENTS_KEY, []).append((session_id, event_name, data))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_after_commit(session: Session) -> None:
+    for session_id, event_name, data in session.info.pop(PENDING_EVENTS_KEY, []):
+        session_events.publish(session_id, event_name, data)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(PENDING_EVENTS_KEY, None)
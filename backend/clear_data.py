@@ -13,13 +13,15 @@ from app.models.gym import (
     GymTemplate, 
     GymExercise, 
     GymSession, 
-    GymFeedback
+    GymFeedback,
+    GymLoadEntry
 )
 from app.models.cycles import (
     MacroCycle, 
     MesoCycle, 
     MicroCycle
 )
+from app.models.rollup import DailyTrainingRollup
 
 def clear_all_data():
     db: Session = SessionLocal()
@@ -55,6 +57,11 @@ def clear_all_data():
         # --- Preparo Físico (Gym) ---
         print("\n🏋️ Limpando dados de PREPARO FÍSICO...")
         
+        # GymLoadEntry
+        gym_load_count = db.query(GymLoadEntry).count()
+        db.query(GymLoadEntry).delete()
+        print(f"   ✓ GymLoadEntry: {gym_load_count} registros removidos")
+        
         # GymFeedback
         gym_feedback_count = db.query(GymFeedback).count()
         db.query(GymFeedback).delete()
@@ -75,6 +82,14 @@ def clear_all_data():
         db.query(GymTemplate).delete()
         print(f"   ✓ GymTemplate: {gym_template_count} registros removidos")
         
+        # --- Agregados diários (Dashboards) ---
+        print("\n📈 Limpando AGREGADOS DIÁRIOS...")
+        
+        # DailyTrainingRollup
+        rollup_count = db.query(DailyTrainingRollup).count()
+        db.query(DailyTrainingRollup).delete()
+        print(f"   ✓ DailyTrainingRollup: {rollup_count} registros removidos")
+        
         # --- Ciclos (Periodização) ---
         print("\n📅 Limpando dados de CICLOS (Periodização)...")
         
@@ -103,6 +118,7 @@ def clear_all_data():
         total = (
             feedback_count + subdivision_count + series_count + session_count +
             gym_feedback_count + gym_session_count + gym_exercise_count + gym_template_count +
+            rollup_count +
             micro_count + meso_count + macro_count
         )
         print(f"\n📊 TOTAL: {total} registros removidos")
@@ -0,0 +1,21 @@
+"""Shared pytest fixtures."""
+import pytest
+
+from app.db.query_budget import QueryBudgetWarning, assert_max_queries, assert_within_budget
+
+
+@pytest.fixture
+def max_queries():
+    """`with max_queries(5): ...` fails the test if the block runs more than 5 SQL statements."""
+    return assert_max_queries
+
+
+@pytest.fixture
+def within_query_budget():
+    """`within_query_budget(response)` fails the test if the request exceeded its route's @query_budget."""
+    return assert_within_budget
+
+
+def pytest_configure(config):
+    # Budget overruns reported by the request middleware (DEBUG=true) fail the test
+    config.addinivalue_line("filterwarnings", f"error::{QueryBudgetWarning.__module__}.{QueryBudgetWarning.__name__}")
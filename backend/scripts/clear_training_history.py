@@ -7,6 +7,7 @@ sys.path.insert(0, '.')
 
 from app.db.session import SessionLocal
 from app.models import TrainingSession
+from app.services import daily_rollup
 
 def clear_history():
     db = SessionLocal()
@@ -28,10 +29,15 @@ def clear_history():
             print("Operação cancelada.")
             return
         
+        touched_dates = set()
         for session in history_sessions:
             print(f"  Deletando sessão {session.id} ({session.description}) - Status: {session.status}")
+            touched_dates.add(session.date)
+            if session.parent_session:
+                touched_dates.add(session.parent_session.date)
             db.delete(session)
         
+        daily_rollup.refresh_pool_days(db, touched_dates)
         db.commit()
         print(f"\n✅ Deletadas {count} sessões do histórico.")
     except Exception as e:
@@ -0,0 +1,317 @@
+"""
+Script para gerar uma temporada sintética com volume realista, para benchmarks
+e testes de carga.
+
+Cria atletas, um macrociclo com mesos (4 semanas) e micros (1 semana), sessões
+de natação planejadas com séries e subdivisões, execuções com feedback por
+série, sessões de academia com cargas realizadas (performed_loads), wellness e
+avaliações. A temporada é centrada em hoje: dias passados têm execuções e
+feedbacks, dias futuros só o planejamento. Ao final reconstrói os agregados
+diários e a carga/fadiga dos atletas, como scripts/rebuild_daily_rollup.py.
+
+Usa o DATABASE_URL configurado (SQLite ou Postgres). Tabelas ausentes são
+criadas; com --reset os dados de treino existentes são apagados antes.
+
+Exemplo:
+    python scripts/generate_season.py --athletes 40 --weeks 52 --pool-sessions-per-day 4 --reset
+"""
+import argparse
+import random
+import sys
+from datetime import date, time, timedelta
+from typing import Optional
+sys.path.insert(0, '.')
+
+from app import models
+from app.core.security import get_password_hash
+from app.db.base import Base
+from app.db.session import SessionLocal, engine
+from app.services import daily_rollup, gym_loads
+
+COACH_EMAIL = "coach@example.com"
+COACH_PASSWORD = "winners"
+
+CATEGORIES = ["Infantil", "Juvenil", "Júnior", "Sênior"]
+PROFILES = ["Fundo", "Velocidade", "Meio Fundo", "Técnica"]
+STYLES = ["Livre", "Costas", "Peito", "Borboleta", "Medley"]
+FUNCTIONAL_BASES = ["Aeróbico A1", "Aeróbico A2", "VO2", "Limiar Lático", "Anaeróbico", "Técnica"]
+DIRECTION_RANGES = [
+    # re_min, re_max, er_min, er_max, direction
+    (2.0, 3.0, 0.0, 1.2, "VO2"),
+    (1.0, 2.0, 0.0, 1.2, "Aeróbico"),
+    (0.0, 1.0, 1.2, 3.0, "Anaeróbico"),
+]
+GYM_EXERCISES = [
+    ("Agachamento", "Pernas", "Força Máxima"),
+    ("Supino", "Peito", "Força Máxima"),
+    ("Salto Vertical", "Pernas", "Força Explosiva"),
+    ("Arremesso Medicine Ball", "Tronco", "Força Explosiva"),
+    ("Remada", "Costas", "Força Resistiva"),
+    ("Puxada", "Costas", "Resistência Força"),
+    ("Levantamento Terra", "Posterior", "Força Rápida"),
+    ("Prancha", "Core", "Resistência Força"),
+]
+INTENSITIES = ["Low", "Medium", "High", "Medium"]
+
+# Tables emptied by --reset, children first (users and configuration are kept)
+RESET_MODELS = [
+    models.DailyTrainingRollup, models.GymLoadEntry, models.GymFeedback, models.GymSession,
+    models.SessionFeedback, models.TrainingSubdivision, models.TrainingSeries, models.TrainingSession,
+    models.MicroCycle, models.MesoCycle, models.MacroCycle, models.Wellness, models.Assessment, models.Athlete,
+]
+
+
+def reset_data(db) -> None:
+    # Copies point at their plans; detach them so the plans can go in the same DELETE
+    db.query(models.TrainingSession).update({models.TrainingSession.parent_session_id: None})
+    db.query(models.GymSession).update({models.GymSession.parent_session_id: None})
+    for model in RESET_MODELS:
+        db.query(model).delete(synchronize_session=False)
+    db.flush()
+
+
+def ensure_reference_data(db) -> None:
+    if not db.query(models.User).filter(models.User.email == COACH_EMAIL).first():
+        db.add(models.User(
+            email=COACH_EMAIL, hashed_password=get_password_hash(COACH_PASSWORD),
+            full_name="Treinador Benchmark", is_active=True, is_superuser=True,
+        ))
+    if not db.query(models.ConfigFunctionalDirectionRange).first():
+        for re_min, re_max, er_min, er_max, direction in DIRECTION_RANGES:
+            db.add(models.ConfigFunctionalDirectionRange(
+                re_min=re_min, re_max=re_max, er_min=er_min, er_max=er_max, direction=direction
+            ))
+
+
+def create_athletes(db, rng: random.Random, count: int) -> list:
+    athletes = []
+    for i in range(count):
+        athletes.append(models.Athlete(
+            first_name=f"Atleta{i:03d}", last_name="Sintético", cpf=f"synthetic-{i:06d}",
+            email=f"atleta{i:03d}@example.com", category=CATEGORIES[i % len(CATEGORIES)],
+            status="Active" if rng.random() > 0.05 else "Blocked",
+            birth_date=date(2005 + i % 10, 1 + i % 12, 1 + i % 28),
+            body_weight=round(rng.uniform(45, 85), 1),
+        ))
+    db.add_all(athletes)
+    db.flush()
+    return athletes
+
+
+def create_cycles(db, start: date, weeks: int) -> dict:
+    """Macro > mesos of 4 weeks > weekly micros. Returns {monday: micro}."""
+    macro = models.MacroCycle(
+        name="Temporada Sintética", season=str(start.year), start_date=start,
+        end_date=start + timedelta(weeks=weeks, days=-1), model="Tradicional",
+    )
+    db.add(macro)
+    micros = {}
+    for first_week in range(0, weeks, 4):
+        meso_weeks = min(4, weeks - first_week)
+        meso_start = start + timedelta(weeks=first_week)
+        meso = models.MesoCycle(
+            name=f"Meso {first_week // 4 + 1}", start_date=meso_start,
+            end_date=meso_start + timedelta(weeks=meso_weeks, days=-1), macro=macro,
+        )
+        for week in range(meso_weeks):
+            monday = meso_start + timedelta(weeks=week)
+            micros[monday] = models.MicroCycle(
+                name=f"Micro {first_week + week + 1}", start_date=monday, end_date=monday + timedelta(days=6),
+                intensity=INTENSITIES[week % len(INTENSITIES)], focus="Aeróbico, Técnica", meso=meso,
+            )
+    db.add_all(micros.values())
+    db.flush()
+    return micros
+
+
+def build_series(rng: random.Random, order: int) -> models.TrainingSeries:
+    subdivisions = []
+    for sub_order in range(rng.randint(1, 4)):
+        functional_base = rng.choice(FUNCTIONAL_BASES)
+        subdivisions.append(models.TrainingSubdivision(
+            order=sub_order, type=rng.choice(["DDR", "DCR"]), reps=rng.choice([1, 2, 4, 6, 8, 10]),
+            distance=rng.choice([25, 50, 100, 200, 400, 800]), style=rng.choice(STYLES),
+            interval_time=rng.choice(["1:30", "2:00", "3:00", None]), pause_time=rng.choice(["15s", "30s", None]),
+            da_re=round(rng.uniform(0.2, 3.0), 2), da_er=round(rng.uniform(0.0, 3.0), 2),
+            functional_base=functional_base,
+        ))
+    return models.TrainingSeries(
+        order=order, name=f"Série {order + 1}", reps="1x", rpe_target=rng.randint(3, 9),
+        rpe_description=rng.choice(FUNCTIONAL_BASES).upper(),
+        total_distance=sum(sub.distance * sub.reps for sub in subdivisions), subdivisions=subdivisions,
+    )
+
+
+def copy_series(series: models.TrainingSeries) -> models.TrainingSeries:
+    return models.TrainingSeries(
+        order=series.order, name=series.name, reps=series.reps, rpe_target=series.rpe_target,
+        rpe_description=series.rpe_description, total_distance=series.total_distance,
+        subdivisions=[
+            models.TrainingSubdivision(
+                order=sub.order, type=sub.type, reps=sub.reps, distance=sub.distance, style=sub.style,
+                interval_time=sub.interval_time, pause_time=sub.pause_time, da_re=sub.da_re, da_er=sub.da_er,
+                functional_base=sub.functional_base,
+            )
+            for sub in series.subdivisions
+        ],
+    )
+
+
+def create_pool_day(db, rng, day: date, micro, athletes_by_category: dict, sessions: int, executed: bool) -> None:
+    for _ in range(sessions):
+        category = rng.choice(CATEGORIES)
+        series = [build_series(rng, order) for order in range(rng.randint(3, 7))]
+        plan = models.TrainingSession(
+            date=day, time=rng.choice([time(6, 0), time(17, 0)]), profile=rng.choice(PROFILES),
+            category=category, micro_cycle_id=micro.id if micro else None, status="Planned",
+            description="Sessão sintética", total_volume=sum(s.total_distance for s in series), series=series,
+        )
+        db.add(plan)
+        if not executed or rng.random() > 0.9:
+            continue
+        execution = models.TrainingSession(
+            date=day, time=plan.time, profile=plan.profile, category=category, micro_cycle_id=plan.micro_cycle_id,
+            status="Completed", description=plan.description, total_volume=plan.total_volume,
+            parent_session=plan, series=[copy_series(s) for s in series],
+        )
+        db.add(execution)
+        db.flush()
+        for athlete in athletes_by_category.get(category, []):
+            present = rng.random() < 0.85
+            for s in execution.series:
+                db.add(models.SessionFeedback(
+                    session_id=execution.id, series_id=s.id, athlete_id=athlete.id,
+                    rpe_real=min(10, max(1, s.rpe_target + rng.randint(-2, 2))) if present else None,
+                    exhaustion_level=rng.choice(["Baixo", "Médio", "Alto"]) if present else None,
+                    attendance="Present" if present else "Absent",
+                ))
+
+
+def create_gym_day(db, rng, day: date, athletes_by_category: dict, executed: bool) -> None:
+    category = rng.choice(CATEGORIES)
+    exercises = [
+        {
+            "name": name, "muscle_group": group, "physicalMotorCapacity": capacity,
+            "sets": 3, "reps": rng.choice(["6", "8", "10", "12"]), "rest_time": "60s",
+            "relative_load_meta": [rng.choice([40, 50, 60, 70]) for _ in range(3)],
+        }
+        for name, group, capacity in rng.sample(GYM_EXERCISES, rng.randint(4, 6))
+    ]
+    plan = models.GymSession(date=day, time=time(15, 0), title="Treino A", category=category, status="Planned",
+                             exercises_snapshot=exercises)
+    db.add(plan)
+    if not executed:
+        return
+    execution = models.GymSession(date=day, time=time(15, 0), title=plan.title, category=category,
+                                  status="Completed", exercises_snapshot=exercises, parent_session=plan)
+    db.add(execution)
+    db.flush()
+    capacities = gym_loads.exercise_capacities(exercises)
+    for athlete in athletes_by_category.get(category, []):
+        present = rng.random() < 0.85
+        performed_loads = {
+            ex["name"]: [round(athlete.body_weight * pct / 100 * rng.uniform(0.9, 1.1), 1)
+                         for pct in ex["relative_load_meta"]]
+            for ex in exercises
+        } if present else {}
+        feedback = models.GymFeedback(session_id=execution.id, athlete_id=athlete.id,
+                                      performed_loads=performed_loads, attendance="Present" if present else "Absent")
+        db.add(feedback)
+        gym_loads.sync_feedback_loads(feedback, capacities)
+
+
+def create_athlete_reports(db, rng, day: date, athletes: list) -> None:
+    for athlete in athletes:
+        if rng.random() < 0.7:
+            scores = [rng.randint(1, 5) for _ in range(4)]
+            db.add(models.Wellness(
+                athlete_id=athlete.id, date=day, sleep_quality=scores[0], fatigue_level=scores[1],
+                muscle_soreness=scores[2], stress_level=scores[3], overall_score=sum(scores) / 4,
+            ))
+        if day.weekday() == 0 and (day.toordinal() // 7) % 4 == athlete.id % 4:
+            db.add(models.Assessment(
+                athlete_id=athlete.id, date=day, weight=round(athlete.body_weight + rng.uniform(-1.5, 1.5), 1),
+                jump_height=round(rng.uniform(25, 55), 1), throw_distance=round(rng.uniform(4, 9), 2),
+            ))
+
+
+def generate_season(
+    db,
+    athletes: int = 40,
+    weeks: int = 52,
+    pool_sessions_per_day: int = 4,
+    gym_sessions_per_week: int = 3,
+    seed: int = 1,
+    today: Optional[date] = None,
+) -> dict:
+    """Generate a season centred on `today`. Returns the number of rows per table."""
+    rng = random.Random(seed)
+    today = today or date.today()
+    start = today - timedelta(days=today.weekday(), weeks=weeks // 2)
+
+    ensure_reference_data(db)
+    roster = create_athletes(db, rng, athletes)
+    athletes_by_category: dict = {}
+    for athlete in roster:
+        if athlete.status == "Active":
+            athletes_by_category.setdefault(athlete.category, []).append(athlete)
+    micros = create_cycles(db, start, weeks)
+
+    for offset in range(weeks * 7):
+        day = start + timedelta(days=offset)
+        if day.weekday() == 6:
+            continue
+        executed = day < today
+        micro = micros.get(day - timedelta(days=day.weekday()))
+        create_pool_day(db, rng, day, micro, athletes_by_category, pool_sessions_per_day, executed)
+        if rng.random() < gym_sessions_per_week / 6:
+            create_gym_day(db, rng, day, athletes_by_category, executed)
+        if executed:
+            create_athlete_reports(db, rng, day, roster)
+    db.flush()
+    daily_rollup.rebuild_all(db)
+    return table_counts(db)
+
+
+def table_counts(db) -> dict:
+    return {
+        model.__tablename__: db.query(model).count()
+        for model in reversed(RESET_MODELS)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gera uma temporada sintética para benchmarks.")
+    parser.add_argument("--athletes", type=int, default=40)
+    parser.add_argument("--weeks", type=int, default=52)
+    parser.add_argument("--pool-sessions-per-day", type=int, default=4)
+    parser.add_argument("--gym-sessions-per-week", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--reset", action="store_true", help="Apaga os dados de treino existentes antes de gerar")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        if args.reset:
+            reset_data(db)
+            print("✓ Dados de treino existentes apagados.")
+        counts = generate_season(
+            db, athletes=args.athletes, weeks=args.weeks, pool_sessions_per_day=args.pool_sessions_per_day,
+            gym_sessions_per_week=args.gym_sessions_per_week, seed=args.seed,
+        )
+        db.commit()
+        print("\n✅ Temporada sintética gerada:")
+        for table, count in counts.items():
+            print(f"  {table}: {count}")
+        print(f"\nLogin do treinador: {COACH_EMAIL} / {COACH_PASSWORD}")
+    except Exception as e:
+        print(f"❌ Erro: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
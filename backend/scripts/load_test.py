@@ -0,0 +1,363 @@
+"""
+Teste de carga com clientes HTTP assíncronos contra o app FastAPI.
+
+Usuários virtuais concorrentes repetem o tráfego de um dia de treino:
+
+- treinadores: login, dashboard da home e polling do dashboard do micro atual
+  (às vezes por atleta, o dashboard de micros do meso e a série temporal do macro);
+- sessões ao vivo: iniciam um treino de natação do dia e postam feedbacks em
+  rajada (todos os atletas da categoria ao mesmo tempo) a cada série;
+- academia: iniciam uma sessão de academia e regravam (upsert) as cargas dos atletas.
+
+Ao final mostra, por rota, requisições, vazão (req/s), taxa de erro e
+latência p50/p95/p99 (ms). Serve para dimensionar workers e pool de conexões.
+
+Por padrão o app roda no mesmo processo (httpx ASGITransport). Com --uvicorn o
+script sobe um uvicorn local com --workers processos; com --url usa um
+servidor já em execução. Nos três casos os ids são lidos do DATABASE_URL
+configurado, que deve ser o mesmo banco do servidor.
+
+O teste grava feedbacks e inicia sessões: rode contra um banco dedicado,
+gerado com scripts/generate_season.py.
+
+Exemplo:
+    python scripts/generate_season.py --reset
+    python scripts/load_test.py --coaches 30 --live-sessions 4 --gym-sessions 2 --duration 120 --uvicorn --workers 4
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Optional
+sys.path.insert(0, '.')
+
+import httpx
+
+from scripts.benchmark import percentile
+from scripts.generate_season import COACH_EMAIL, COACH_PASSWORD
+
+API = "/api/v1"
+
+
+@dataclass
+class Targets:
+    """Ids the virtual users work on, read from the database before the run."""
+    micro_id: int
+    meso_id: int
+    macro_id: int
+    athlete_ids: list
+    pool_plans: list  # [(plan id, [athlete ids of its category])]
+    gym_plans: list  # [(plan id, exercise names, [athlete ids of its category])]
+
+
+def load_targets() -> Targets:
+    from app import models
+    from app.db.session import SessionLocal
+
+    today = date.today()
+    db = SessionLocal()
+    try:
+        micro = db.query(models.MicroCycle).filter(
+            models.MicroCycle.start_date <= today
+        ).order_by(models.MicroCycle.start_date.desc()).first()
+        if micro is None:
+            raise RuntimeError("Nenhum microciclo encontrado: gere dados com scripts/generate_season.py")
+        athletes = db.query(models.Athlete.id, models.Athlete.category).filter(
+            models.Athlete.status == "Active"
+        ).order_by(models.Athlete.id).all()
+        by_category = defaultdict(list)
+        for athlete_id, category in athletes:
+            by_category[category].append(athlete_id)
+
+        # Today's plans (the latest day with plans if there are none today)
+        plan_date = db.query(models.TrainingSession.date).filter(
+            models.TrainingSession.parent_session_id.is_(None), models.TrainingSession.date <= today
+        ).order_by(models.TrainingSession.date.desc()).limit(1).scalar()
+        pool_plans = [
+            (plan.id, by_category.get(plan.category, []))
+            for plan in db.query(models.TrainingSession).filter(
+                models.TrainingSession.parent_session_id.is_(None), models.TrainingSession.date == plan_date
+            ).order_by(models.TrainingSession.id)
+        ]
+        gym_plans = [
+            (plan.id, [ex.get("name") for ex in plan.exercises_snapshot or []], by_category.get(plan.category, []))
+            for plan in db.query(models.GymSession).filter(
+                models.GymSession.parent_session_id.is_(None), models.GymSession.date <= today
+            ).order_by(models.GymSession.date.desc(), models.GymSession.id).limit(10)
+        ]
+        return Targets(
+            micro_id=micro.id, meso_id=micro.meso_id, macro_id=micro.meso.macro_id,
+            athlete_ids=[athlete_id for athlete_id, _ in athletes],
+            pool_plans=[plan for plan in pool_plans if plan[1]],
+            gym_plans=[plan for plan in gym_plans if plan[1] and plan[2]],
+        )
+    finally:
+        db.close()
+
+
+@dataclass
+class Recorder:
+    latencies: dict = field(default_factory=lambda: defaultdict(list))
+    errors: dict = field(default_factory=lambda: defaultdict(int))
+    error_samples: dict = field(default_factory=dict)
+
+    async def request(self, client: httpx.AsyncClient, method: str, route: str, url: str, **kwargs) -> Optional[httpx.Response]:
+        """Send one request, recording its latency under `route` (the route template)."""
+        label = f"{method} {route}"
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except Exception as e:  # connection refused, timeouts, app exceptions in-process
+            response, error = None, f"{type(e).__name__}: {e}"
+        else:
+            error = f"HTTP {response.status_code}" if response.status_code >= 400 else None
+        self.latencies[label].append((time.perf_counter() - started) * 1000)
+        if error:
+            self.errors[label] += 1
+            self.error_samples.setdefault(label, error)
+            return None
+        return response
+
+
+async def login(client: httpx.AsyncClient, recorder: Recorder) -> Optional[dict]:
+    response = await recorder.request(
+        client, "POST", f"{API}/auth/access-token", f"{API}/auth/access-token",
+        data={"username": COACH_EMAIL, "password": COACH_PASSWORD},
+    )
+    return {"Authorization": f"Bearer {response.json()['access_token']}"} if response else None
+
+
+async def think(rng: random.Random, seconds: float, scale: float) -> None:
+    await asyncio.sleep(seconds * scale * rng.uniform(0.5, 1.5))
+
+
+async def coach(client, recorder: Recorder, targets: Targets, rng, deadline: float, scale: float) -> None:
+    """Opens the home dashboard, then keeps polling the current micro dashboard."""
+    headers = await login(client, recorder)
+    if headers is None:
+        return
+    cycles = f"{API}/cycles"
+    while time.monotonic() < deadline:
+        await recorder.request(client, "GET", f"{API}/home/dashboard", f"{API}/home/dashboard", headers=headers)
+        for _ in range(rng.randint(3, 6)):
+            if time.monotonic() >= deadline:
+                return
+            params = {"athlete_id": rng.choice(targets.athlete_ids)} if rng.random() < 0.3 else {}
+            await recorder.request(
+                client, "GET", f"{cycles}/micros/{{id}}/dashboard", f"{cycles}/micros/{targets.micro_id}/dashboard",
+                params=params, headers=headers,
+            )
+            await think(rng, 5, scale)
+        if rng.random() < 0.3:
+            await recorder.request(
+                client, "GET", f"{cycles}/mesos/{{id}}/micros/dashboard",
+                f"{cycles}/mesos/{targets.meso_id}/micros/dashboard", headers=headers,
+            )
+        if rng.random() < 0.2:
+            await recorder.request(
+                client, "GET", f"{cycles}/macros/{{id}}/timeseries",
+                f"{cycles}/macros/{targets.macro_id}/timeseries", headers=headers,
+            )
+
+
+async def live_session(client, recorder: Recorder, plan: tuple, rng, deadline: float, scale: float) -> None:
+    """Starts a pool session and posts every athlete's feedback at once after each series."""
+    plan_id, athlete_ids = plan
+    headers = await login(client, recorder)
+    if headers is None:
+        return
+    response = await recorder.request(
+        client, "POST", f"{API}/training/{{id}}/start", f"{API}/training/{plan_id}/start", headers=headers
+    )
+    if response is None:
+        return
+    session = response.json()
+    series_ids = [series["id"] for series in session["series"]] or [None]
+    while time.monotonic() < deadline:
+        for series_id in series_ids:
+            if time.monotonic() >= deadline:
+                return
+            await think(rng, 15, scale)
+            await asyncio.gather(*[
+                recorder.request(
+                    client, "POST", f"{API}/training/{{id}}/feedback", f"{API}/training/{session['id']}/feedback",
+                    headers=headers, json={
+                        "session_id": session["id"], "series_id": series_id, "athlete_id": athlete_id,
+                        "rpe_real": rng.randint(3, 10), "attendance": "Present",
+                    },
+                )
+                for athlete_id in athlete_ids
+            ])
+            await recorder.request(
+                client, "GET", f"{API}/training/{{id}}", f"{API}/training/{session['id']}", headers=headers
+            )
+
+
+async def gym_session(client, recorder: Recorder, plan: tuple, rng, deadline: float, scale: float) -> None:
+    """Starts a gym session and keeps upserting the athletes' performed loads."""
+    plan_id, exercise_names, athlete_ids = plan
+    headers = await login(client, recorder)
+    if headers is None:
+        return
+    response = await recorder.request(
+        client, "POST", f"{API}/gym/sessions/{{id}}/start", f"{API}/gym/sessions/{plan_id}/start",
+        headers=headers, json={"time": "15:00"},
+    )
+    if response is None:
+        return
+    session_id = response.json()["id"]
+    while time.monotonic() < deadline:
+        athlete_id = rng.choice(athlete_ids)
+        performed_loads = {
+            name: [float(rng.randint(10, 80)) for _ in range(3)]
+            for name in exercise_names[:rng.randint(1, len(exercise_names))]
+        }
+        await recorder.request(
+            client, "POST", f"{API}/gym/sessions/{{id}}/feedback", f"{API}/gym/sessions/{session_id}/feedback",
+            headers=headers, json={"athlete_id": athlete_id, "performed_loads": performed_loads, "attendance": "Present"},
+        )
+        await think(rng, 3, scale)
+
+
+async def run(client: httpx.AsyncClient, targets: Targets, args) -> Recorder:
+    recorder = Recorder()
+    rng = random.Random(args.seed)
+    deadline = time.monotonic() + args.ramp_up + args.duration
+
+    async def delayed(user, *user_args):
+        await asyncio.sleep(rng.uniform(0, args.ramp_up))
+        await user(client, recorder, *user_args, random.Random(rng.random()), deadline, args.think_scale)
+
+    users = [delayed(coach, targets) for _ in range(args.coaches)]
+    users += [delayed(live_session, plan) for plan in targets.pool_plans[:args.live_sessions]]
+    users += [delayed(gym_session, plan) for plan in targets.gym_plans[:args.gym_sessions]]
+    await asyncio.gather(*users)
+    return recorder
+
+
+def report(recorder: Recorder, elapsed: float) -> dict:
+    routes = {}
+    for label, latencies in sorted(recorder.latencies.items()):
+        routes[label] = {
+            "requests": len(latencies),
+            "throughput_rps": round(len(latencies) / elapsed, 2),
+            "error_rate": round(recorder.errors[label] / len(latencies), 4),
+            "p50_ms": round(percentile(latencies, 0.50), 1),
+            "p95_ms": round(percentile(latencies, 0.95), 1),
+            "p99_ms": round(percentile(latencies, 0.99), 1),
+            "first_error": recorder.error_samples.get(label),
+        }
+    total = sum(len(latencies) for latencies in recorder.latencies.values())
+    all_latencies = [latency for latencies in recorder.latencies.values() for latency in latencies]
+    return {
+        "elapsed_s": round(elapsed, 1),
+        "requests": total,
+        "throughput_rps": round(total / elapsed, 2) if elapsed else 0,
+        "error_rate": round(sum(recorder.errors.values()) / total, 4) if total else 0,
+        "p50_ms": round(percentile(all_latencies, 0.50), 1) if all_latencies else None,
+        "p95_ms": round(percentile(all_latencies, 0.95), 1) if all_latencies else None,
+        "p99_ms": round(percentile(all_latencies, 0.99), 1) if all_latencies else None,
+        "routes": routes,
+    }
+
+
+def print_report(result: dict) -> None:
+    print(f"\n{'rota':52} {'req':>6} {'req/s':>7} {'erros':>7} {'p50':>8} {'p95':>8} {'p99':>8}")
+    for label, stats in result["routes"].items():
+        print(
+            f"{label:52} {stats['requests']:>6} {stats['throughput_rps']:>7.1f} {stats['error_rate']:>7.1%} "
+            f"{stats['p50_ms']:>8.1f} {stats['p95_ms']:>8.1f} {stats['p99_ms']:>8.1f}"
+        )
+    print(
+        f"\nTotal: {result['requests']} requisições em {result['elapsed_s']}s "
+        f"({result['throughput_rps']} req/s), erros {result['error_rate']:.1%}, "
+        f"p50 {result['p50_ms']} ms, p95 {result['p95_ms']} ms, p99 {result['p99_ms']} ms"
+    )
+    for label, stats in result["routes"].items():
+        if stats["first_error"]:
+            print(f"  ⚠ {label}: {stats['first_error']}")
+
+
+def start_uvicorn(port: int, workers: int) -> subprocess.Popen:
+    server = subprocess.Popen([
+        sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port),
+        "--workers", str(workers), "--log-level", "warning",
+    ], env={**os.environ, "LOG_LEVEL": os.environ.get("LOG_LEVEL", "WARNING")})
+    for _ in range(100):
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health").status_code == 200:
+                return server
+        except httpx.HTTPError:
+            pass
+        if server.poll() is not None:
+            break
+        time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("uvicorn não respondeu em /health")
+
+
+async def main_async(args) -> dict:
+    targets = load_targets()
+    server = None
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, timeout=args.timeout)
+    elif args.uvicorn:
+        server = start_uvicorn(args.port, args.workers)
+        client = httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{args.port}", timeout=args.timeout,
+            limits=httpx.Limits(max_connections=None, max_keepalive_connections=None),
+        )
+    else:
+        from app.main import app
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://loadtest", timeout=args.timeout)
+
+    print(
+        f"Usuários: {args.coaches} treinadores, {min(args.live_sessions, len(targets.pool_plans))} sessões ao vivo, "
+        f"{min(args.gym_sessions, len(targets.gym_plans))} sessões de academia; {args.duration}s "
+        f"(+{args.ramp_up}s de rampa)"
+    )
+    started = time.perf_counter()
+    try:
+        async with client:
+            recorder = await run(client, targets, args)
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+    return report(recorder, time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Teste de carga do app com clientes assíncronos.")
+    parser.add_argument("--coaches", type=int, default=10, help="Treinadores consultando dashboards")
+    parser.add_argument("--live-sessions", type=int, default=2, help="Sessões de natação ao vivo postando feedback")
+    parser.add_argument("--gym-sessions", type=int, default=1, help="Sessões de academia gravando cargas")
+    parser.add_argument("--duration", type=float, default=60, help="Segundos de carga após a rampa")
+    parser.add_argument("--ramp-up", type=float, default=5, help="Segundos para todos os usuários começarem")
+    parser.add_argument("--think-scale", type=float, default=1.0, help="Multiplica as pausas entre ações (0.1 = 10x mais carga)")
+    parser.add_argument("--url", help="Servidor já em execução (ex.: http://localhost:8000)")
+    parser.add_argument("--uvicorn", action="store_true", help="Sobe um uvicorn local para o teste")
+    parser.add_argument("--workers", type=int, default=1, help="Workers do uvicorn (com --uvicorn)")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="Grava o resultado em JSON")
+    args = parser.parse_args()
+
+    result = asyncio.run(main_async(args))
+    print_report(result)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"args": vars(args), **result}, f, indent=2, ensure_ascii=False)
+        print(f"\n✓ Resultado gravado em {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Script para reconstruir a tabela de agregados diários (DailyTrainingRollup)
+a partir das sessões, séries, subdivisões e feedbacks existentes, e em seguida
+a carga recente e o índice de fadiga dos atletas.
+
+Com --gym-loads, regrava antes as cargas normalizadas (GymLoadEntry) a partir
+do JSON performed_loads dos feedbacks de academia.
+
+Com --if-empty, só reconstrói se a tabela ainda estiver vazia (primeira subida
+após a migração); depois disso os agregados são mantidos incrementalmente.
+"""
+import sys
+sys.path.insert(0, '.')
+
+from app.db.session import SessionLocal
+from app.models import DailyTrainingRollup, GymSession
+from app.services import daily_rollup, gym_loads
+
+def rebuild_daily_rollup(resync_gym_loads: bool = False, if_empty: bool = False):
+    db = SessionLocal()
+    try:
+        if if_empty and db.query(DailyTrainingRollup.id).first() is not None:
+            print("✓ Agregados diários já existem, nada a reconstruir.")
+            return
+        if resync_gym_loads:
+            sessions = db.query(GymSession).all()
+            for session in sessions:
+                gym_loads.sync_session_loads(session)
+            db.flush()
+            print(f"✓ Cargas de academia regravadas para {len(sessions)} sessões.")
+        daily_rollup.rebuild_all(db)
+        db.commit()
+        count = db.query(DailyTrainingRollup).count()
+        print(f"\n✅ Agregados diários reconstruídos: {count} linhas.")
+        print("✓ Carga recente e fadiga dos atletas recalculadas.")
+    except Exception as e:
+        print(f"❌ Erro: {e}")
+        db.rollback()
+        sys.exit(1)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    rebuild_daily_rollup(resync_gym_loads="--gym-loads" in sys.argv, if_empty="--if-empty" in sys.argv)
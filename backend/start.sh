@@ -12,6 +12,10 @@ echo "Waiting for database..."
 echo "Running migrations..."
 alembic upgrade head
 
+# Fill the pre-aggregated dashboard data once (kept up to date incrementally afterwards)
+echo "Checking daily training rollup..."
+python scripts/rebuild_daily_rollup.py --if-empty
+
 # Create superuser
 echo "Creating superuser..."
 python create_superuser.py
@@ -0,0 +1,57 @@
+"""
+Fixtures for the endpoint tests: a throwaway SQLite database seeded with a small
+season from scripts/generate_season.py, and an authenticated TestClient.
+
+The environment is set before the app is imported. DEBUG=true turns missed eager loads
+into errors and budget overruns into QueryBudgetWarning (an error in the tests). Run
+with ASYNC_DB=true to exercise the async routes instead.
+"""
+import os
+import tempfile
+
+import pytest
+
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='winners-tests-'), 'test.db')}"
+os.environ["DEBUG"] = "true"
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app import models  # noqa: E402
+from app.core import security  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.services.dashboard_cache import dashboard_cache  # noqa: E402
+from scripts.generate_season import COACH_EMAIL, generate_season  # noqa: E402
+
+# Small enough to seed in a few seconds; a training page of 100 sessions still
+# spans more than one selectinload chunk of series
+SEASON = {"athletes": 12, "weeks": 10, "pool_sessions_per_day": 2, "gym_sessions_per_week": 3}
+
+
+@pytest.fixture(scope="session")
+def season():
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    generate_season(db, **SEASON)
+    db.commit()
+    ids = {
+        "user": db.query(models.User.id).filter(models.User.email == COACH_EMAIL).scalar(),
+        "macro": db.query(models.MacroCycle.id).scalar(),
+        "mesos": [id for id, in db.query(models.MesoCycle.id).order_by(models.MesoCycle.id)],
+        "micros": [id for id, in db.query(models.MicroCycle.id).order_by(models.MicroCycle.id)],
+        "athlete": db.query(models.Athlete.id).order_by(models.Athlete.id).first()[0],
+        "session": db.query(models.TrainingSession.id).order_by(models.TrainingSession.id).first()[0],
+    }
+    db.close()
+    return ids
+
+
+@pytest.fixture
+def client(season):
+    """Client authenticated as the seeded coach; the dashboard cache starts empty."""
+    dashboard_cache.clear()
+    with TestClient(app) as test_client:
+        test_client.headers["Authorization"] = f"Bearer {security.create_access_token(season['user'])}"
+        yield test_client
@@ -0,0 +1,69 @@
+"""The daily rollup follows the training writes without a full rebuild."""
+from datetime import date, timedelta
+
+from app import models
+from app.db.session import SessionLocal
+
+API = "/api/v1"
+
+
+def pool_athlete_row(plan_date: date, category: str, athlete_id: int):
+    db = SessionLocal()
+    try:
+        return db.query(models.DailyTrainingRollup).filter(
+            models.DailyTrainingRollup.kind == "pool",
+            models.DailyTrainingRollup.date == plan_date,
+            models.DailyTrainingRollup.category == category,
+            models.DailyTrainingRollup.athlete_id == athlete_id,
+        ).first()
+    finally:
+        db.close()
+
+
+def test_deleting_a_clone_refreshes_its_plan_day(client, season):
+    plan_date = date.today() + timedelta(days=400)  # outside the generated season
+    category = "Rollup"
+    athlete_id = season["athlete"]
+    plan = client.post(f"{API}/training/", json={
+        "date": plan_date.isoformat(), "category": category,
+        "series": [{"order": 1, "name": "S1", "reps": "1x", "subdivisions": [
+            {"order": 1, "type": "DDR", "reps": 4, "distance": 100, "style": "Livre"},
+        ]}],
+    }).json()
+    clone = client.post(f"{API}/training/{plan['id']}/start").json()
+    # Executed the day after the plan: attendance is still credited to the plan's day
+    response = client.put(f"{API}/training/{clone['id']}", json={"date": (plan_date + timedelta(days=1)).isoformat()})
+    assert response.status_code == 200, response.text
+    response = client.post(f"{API}/training/{clone['id']}/feedback", json={
+        "session_id": clone["id"], "athlete_id": athlete_id, "rpe_real": 6, "attendance": "Present",
+    })
+    assert response.status_code == 200, response.text
+
+    row = pool_athlete_row(plan_date, category, athlete_id)
+    assert (row.planned_sessions, row.planned_volume) == (1, 400)
+
+    assert client.delete(f"{API}/training/{clone['id']}").status_code == 200
+    row = pool_athlete_row(plan_date, category, athlete_id)
+    assert row is None or (row.planned_sessions, row.planned_volume) == (0, 0)
+
+
+def test_present_athletes_are_credited_with_the_executed_volume(client, season):
+    plan_date = date.today() + timedelta(days=410)
+    category = "Rollup"
+    athlete_id = season["athlete"]
+    plan = client.post(f"{API}/training/", json={
+        "date": plan_date.isoformat(), "category": category,
+        "series": [{"order": 1, "name": "S1", "reps": "1x", "subdivisions": [
+            {"order": 1, "type": "DCR", "reps": 3, "distance": 200, "style": "Livre"},
+        ]}],
+    }).json()
+    clone = client.post(f"{API}/training/{plan['id']}/start").json()
+    response = client.put(f"{API}/training/{clone['id']}", json={"status": "Completed"})
+    assert response.status_code == 200, response.text
+    response = client.post(f"{API}/training/{clone['id']}/feedback", json={
+        "session_id": clone["id"], "athlete_id": athlete_id, "rpe_real": 5, "attendance": "Present",
+    })
+    assert response.status_code == 200, response.text
+
+    row = pool_athlete_row(plan_date, category, athlete_id)
+    assert (row.completed_volume, row.completed_dcr_volume) == (600, 600)
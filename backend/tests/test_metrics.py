@@ -0,0 +1,22 @@
+"""/metrics is valid Prometheus text exposition."""
+from collections import Counter
+
+from prometheus_client.parser import text_string_to_metric_families
+
+API = "/api/v1"
+
+
+def test_metrics_parse_with_one_family_per_name(client, season):
+    client.get(f"{API}/home/dashboard")
+    client.get(f"{API}/cycles/micros/{season['micros'][0]}/dashboard")
+    response = client.get("/metrics")
+    assert response.status_code == 200
+
+    type_lines = Counter(line.split()[2] for line in response.text.splitlines() if line.startswith("# TYPE "))
+    assert [name for name, count in type_lines.items() if count > 1] == []
+
+    families = {family.name: family for family in text_string_to_metric_families(response.text)}
+    # Counters are exposed without their _total suffix by the parser
+    for name in ("cache_hits", "cache_misses", "cache_hit_ratio"):
+        assert {sample.labels["cache"] for sample in families[name].samples} == {"dashboard", "home_snapshot"}
+    assert "http_request_duration_seconds" in families
@@ -0,0 +1,93 @@
+"""Every endpoint with a @query_budget stays within it on a generated season."""
+import pytest
+
+from app.api.api_v1.endpoints import (
+    cycles,
+    cycles_dashboard,
+    cycles_dashboard_async,
+    gym,
+    home_dashboard,
+    training,
+    training_async,
+)
+
+API = "/api/v1"
+
+# Endpoint modules with budgeted routes, and the prefix api_router mounts them under
+ROUTERS = [
+    ("/cycles", cycles.router),
+    ("/cycles", cycles_dashboard.router),
+    ("/cycles", cycles_dashboard_async.router),
+    ("/gym", gym.router),
+    ("/home", home_dashboard.router),
+    ("/training", training.router),
+    ("/training", training_async.router),
+]
+
+# Route template -> URLs to request, built from the seeded ids
+BUDGETED_ROUTES = {
+    "/home/dashboard": lambda s: ["/home/dashboard"],
+    "/cycles/macros/": lambda s: ["/cycles/macros/"],
+    "/cycles/macros/{id}/dashboard": lambda s: [f"/cycles/macros/{s['macro']}/dashboard"],
+    "/cycles/mesos/{id}/dashboard": lambda s: [f"/cycles/mesos/{id}/dashboard" for id in s["mesos"]],
+    "/cycles/micros/{id}/dashboard": lambda s: [
+        f"/cycles/micros/{s['micros'][0]}/dashboard",
+        f"/cycles/micros/{s['micros'][-1]}/dashboard?athlete_id={s['athlete']}",
+    ],
+    "/cycles/mesos/{id}/micros/dashboard": lambda s: [
+        f"/cycles/mesos/{s['mesos'][0]}/micros/dashboard",
+        f"/cycles/mesos/{s['mesos'][-1]}/micros/dashboard?athlete_id={s['athlete']}",
+    ],
+    "/cycles/macros/{id}/timeseries": lambda s: [
+        f"/cycles/macros/{s['macro']}/timeseries",
+        f"/cycles/macros/{s['macro']}/timeseries?athlete_id={s['athlete']}",
+    ],
+    "/cycles/macros/{id}/squad": lambda s: [f"/cycles/macros/{s['macro']}/squad"],
+    "/cycles/mesos/{id}/squad": lambda s: [f"/cycles/mesos/{s['mesos'][0]}/squad"],
+    "/cycles/micros/{id}/squad": lambda s: [f"/cycles/micros/{s['micros'][0]}/squad"],
+    "/training/": lambda s: ["/training/", "/training/?skip=100"],
+    "/training/{id}": lambda s: [f"/training/{s['session']}"],
+    "/training/summary": lambda s: ["/training/summary", "/training/summary?limit=500"],
+    "/gym/templates/": lambda s: ["/gym/templates/"],
+    "/gym/sessions/": lambda s: ["/gym/sessions/", "/gym/sessions/?limit=500"],
+}
+
+
+def budgeted_route_templates() -> set:
+    return {
+        prefix + route.path.replace(":int}", "}")
+        for prefix, router in ROUTERS
+        for route in router.routes
+        if getattr(route.endpoint, "query_budget", None) is not None
+    }
+
+
+def test_every_budgeted_route_is_covered():
+    assert budgeted_route_templates() == set(BUDGETED_ROUTES)
+
+
+@pytest.mark.parametrize("route", sorted(BUDGETED_ROUTES))
+def test_route_within_query_budget(client, season, within_query_budget, route):
+    for url in BUDGETED_ROUTES[route](season):
+        response = client.get(API + url)
+        assert response.status_code == 200, response.text
+        within_query_budget(response)
+
+
+def test_training_list_full_page_within_budget(client, within_query_budget):
+    # 100 sessions of 3-7 series: the subdivisions of 500+ series take two selectinload queries
+    response = client.get(f"{API}/training/?limit=100")
+    assert response.status_code == 200, response.text
+    assert len(response.json()) == 100
+    assert sum(len(session["series"]) for session in response.json()) > 500
+    within_query_budget(response)
+
+
+def test_cached_dashboard_skips_the_sections(client, season, max_queries):
+    url = f"{API}/cycles/mesos/{season['mesos'][0]}/dashboard"
+    first = client.get(url)
+    assert first.status_code == 200, first.text
+    # Only the user and the meso are looked up
+    with max_queries(2):
+        cached = client.get(url)
+    assert cached.json() == first.json()
@@ -0,0 +1,136 @@
+"""Training writes keep the series and subdivisions of a session consistent."""
+from datetime import date, timedelta
+
+from app import models
+from app.db.session import SessionLocal
+
+API = "/api/v1"
+
+SERIES_KEYS = {"id", "session_id"}
+SUBDIVISION_KEYS = {"id", "series_id"}
+
+
+def subdivision(order: int, **fields) -> dict:
+    return {"order": order, "type": "DDR", "reps": 4, "distance": 100, "style": "Livre", **fields}
+
+
+def session_children(session_id: int) -> list:
+    """Every column but the keys of the series of a session and their subdivisions, in id order."""
+    series_table = models.TrainingSeries.__table__
+    subdivision_table = models.TrainingSubdivision.__table__
+    db = SessionLocal()
+    try:
+        children = []
+        for series in db.query(models.TrainingSeries).filter(
+            models.TrainingSeries.session_id == session_id
+        ).order_by(models.TrainingSeries.id):
+            subdivisions = [
+                {c.name: getattr(sub, c.name) for c in subdivision_table.c if c.name not in SUBDIVISION_KEYS}
+                for sub in sorted(series.subdivisions, key=lambda sub: sub.id)
+            ]
+            fields = {c.name: getattr(series, c.name) for c in series_table.c if c.name not in SERIES_KEYS}
+            children.append({**fields, "subdivisions": subdivisions})
+        return children
+    finally:
+        db.close()
+
+
+def test_clone_copies_series_and_subdivisions_in_order(client):
+    plan = client.post(f"{API}/training/", json={
+        "date": (date.today() + timedelta(days=420)).isoformat(), "category": "Clone",
+        "series": [
+            {"order": 1, "name": "Aquecimento", "reps": "1x", "rpe_target": 3, "subdivisions": [
+                subdivision(1, functional_base="A1", interval_time="2:00"),
+                subdivision(2, type="DCR", distance=50, observation="Pernada"),
+            ]},
+            {"order": 2, "name": "Principal", "reps": "2x", "instructions": "Forte", "subdivisions": [
+                subdivision(1, reps=8, distance=200, functional_base="AN 2"),
+            ]},
+            {"order": 3, "name": "Solto", "reps": "1x", "subdivisions": []},
+            {"order": 4, "name": "Final", "reps": "1x", "subdivisions": [
+                subdivision(2, style="Costas"), subdivision(1, style="Peito"), subdivision(3, reps=1),
+            ]},
+        ],
+    }).json()
+
+    clone = client.post(f"{API}/training/{plan['id']}/start").json()
+
+    assert clone["parent_session_id"] == plan["id"]
+    source, copy = session_children(plan["id"]), session_children(clone["id"])
+    assert [len(series["subdivisions"]) for series in source] == [2, 1, 0, 3]
+    assert copy == source
+
+
+def test_update_merges_series_and_subdivisions(client):
+    session = client.post(f"{API}/training/", json={
+        "date": (date.today() + timedelta(days=421)).isoformat(), "category": "Merge",
+        "series": [
+            {"order": 1, "name": "A", "reps": "1x", "subdivisions": [subdivision(1), subdivision(2)]},
+            {"order": 2, "name": "B", "reps": "1x", "subdivisions": [subdivision(1)]},
+            {"order": 3, "name": "C", "reps": "1x", "subdivisions": [subdivision(1, distance=50)]},
+        ],
+    }).json()
+    assert session["total_volume"] == 1400
+    a, b, c = session["series"]
+    a1, a2 = a["subdivisions"]
+
+    response = client.put(f"{API}/training/{session['id']}", json={"series": [
+        # Kept by id: a1 updated, a2 deleted, a new subdivision inserted
+        {"id": a["id"], "order": 1, "name": "A", "reps": "1x", "subdivisions": [
+            {**subdivision(1, distance=200), "id": a1["id"]},
+            subdivision(3, type="DCR", reps=2, distance=25),
+        ]},
+        # Without an id: matched to B by its order, and its subdivision too
+        {"order": 2, "name": "B2", "reps": "2x", "subdivisions": [subdivision(1, style="Costas")]},
+        # C is omitted (deleted); D is new
+        {"order": 4, "name": "D", "reps": "1x", "subdivisions": [subdivision(1, reps=1)]},
+    ]})
+    assert response.status_code == 200, response.text
+    series = {s["name"]: s for s in response.json()["series"]}
+
+    assert set(series) == {"A", "B2", "D"}
+    assert series["A"]["id"] == a["id"] and series["B2"]["id"] == b["id"]
+    assert series["D"]["id"] not in {a["id"], b["id"], c["id"]}
+    assert series["B2"]["reps"] == "2x"
+
+    a_subs = {sub["order"]: sub for sub in series["A"]["subdivisions"]}
+    assert set(a_subs) == {1, 3}
+    assert (a_subs[1]["id"], a_subs[1]["distance"]) == (a1["id"], 200)
+    assert a_subs[3]["id"] not in {a1["id"], a2["id"]}
+    [b_sub] = series["B2"]["subdivisions"]
+    assert (b_sub["id"], b_sub["style"]) == (b["subdivisions"][0]["id"], "Costas")
+
+    # Removed from the database, not only from the response
+    db = SessionLocal()
+    try:
+        assert db.get(models.TrainingSeries, c["id"]) is None
+        assert db.get(models.TrainingSubdivision, c["subdivisions"][0]["id"]) is None
+        assert db.get(models.TrainingSubdivision, a2["id"]) is None
+    finally:
+        db.close()
+    # 1400 - 400 (a2) - 200 (C) + 400 (a1: 400 -> 800) + 50 (new) + 100 (D)
+    assert response.json()["total_volume"] == 1350
+
+
+def test_summary_cursor_returns_every_session_once_across_equal_dates(client):
+    first_day = date.today() + timedelta(days=430)
+    days = [first_day, *[first_day + timedelta(days=1)] * 7, first_day + timedelta(days=2)]
+    response = client.post(f"{API}/training/bulk", json={"sessions": [
+        {"date": day.isoformat(), "category": "Paging"} for day in days
+    ]})
+    assert response.status_code == 200, response.text
+    expected = sorted((session["date"], session["id"]) for session in response.json())
+
+    params = {"start_date": first_day.isoformat(), "end_date": days[-1].isoformat(), "limit": 3}
+    pages, cursor = [], None
+    while True:
+        page = client.get(f"{API}/training/summary", params={**params, **({"cursor": cursor} if cursor else {})})
+        assert page.status_code == 200, page.text
+        pages.append([(item["date"], item["id"]) for item in page.json()["items"]])
+        cursor = page.json()["next_cursor"]
+        if cursor is None:
+            break
+
+    # The page boundaries fall inside the run of sessions on the same date
+    assert [len(page) for page in pages] == [3, 3, 3]
+    assert [row for page in pages for row in page] == expected
@@ -21,7 +21,15 @@ const mapAthlete = (data: any): Athlete => ({
 });
 
 export const athleteService = {
-    getAll: async (params?: { search?: string; category?: string; status?: string }) => {
+    getAll: async (params?: {
+        search?: string;
+        category?: string;
+        status?: string;
+        min_fatigue?: number;
+        max_fatigue?: number;
+        sort_by?: 'name' | 'fatigue_score' | 'recent_load';
+        sort_desc?: boolean;
+    }) => {
         const response = await api.get<any[]>('/athletes/', { params });
         return response.data.map(mapAthlete);
     },
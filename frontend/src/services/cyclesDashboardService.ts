@@ -76,6 +76,66 @@ export interface MicroDashboardData {
     relative_load: number | null;
 }
 
+export interface MicroDashboardItem {
+    micro_id: number;
+    name: string;
+    start_date: string;
+    end_date: string;
+    dashboard: MicroDashboardData;
+}
+
+export interface SquadAthleteMetrics {
+    athlete_id: number;
+    name: string;
+    category: string | null;
+    swimming: SwimmingDashboard;
+    gym: GymDashboard;
+    relative_load: number | null;
+    average_attendance: number;
+    wellness: WellnessDashboard;
+}
+
+export interface SquadDashboardData {
+    start_date: string;
+    end_date: string;
+    athletes: SquadAthleteMetrics[];
+}
+
+export type CycleLevel = 'macros' | 'mesos' | 'micros';
+
+export type TimeseriesMetric = 'rpe_load' | 'planned_volume' | 'completed_volume' | 'gym_load';
+
+export interface TimeseriesDay {
+    date: string;
+    planned_volume: number;
+    completed_volume: number;
+    gym_load: number;
+    rpe_load: number;
+    acwr: number | null;
+}
+
+export interface TimeseriesWeek {
+    week: number;
+    start_date: string;
+    end_date: string;
+    planned_volume: number;
+    completed_volume: number;
+    gym_load: number;
+    rpe_load: number;
+    load: number;
+    acwr: number | null;
+    monotony: number | null;
+    strain: number | null;
+}
+
+export interface MacroTimeseriesData {
+    macro_id: number;
+    athlete_id: number | null;
+    metric: TimeseriesMetric;
+    days: TimeseriesDay[];
+    weeks: TimeseriesWeek[];
+}
+
 export const cyclesDashboardService = {
     getMacroDashboard: async (id: string): Promise<MacroDashboardData> => {
         const response = await api.get<MacroDashboardData>(`/cycles/macros/${id}/dashboard`);
@@ -91,5 +151,25 @@ export const cyclesDashboardService = {
         const params = athleteId ? { athlete_id: athleteId } : {};
         const response = await api.get<MicroDashboardData>(`/cycles/micros/${id}/dashboard`, { params });
         return response.data;
+    },
+
+    // Dashboards of every micro in a meso in a single request
+    getMesoMicrosDashboard: async (mesoId: string, athleteId?: string): Promise<MicroDashboardItem[]> => {
+        const params = athleteId ? { athlete_id: athleteId } : {};
+        const response = await api.get<MicroDashboardItem[]>(`/cycles/mesos/${mesoId}/micros/dashboard`, { params });
+        return response.data;
+    },
+
+    // Per-athlete metrics of a cycle (squad comparison)
+    getSquadDashboard: async (level: CycleLevel, id: string): Promise<SquadDashboardData> => {
+        const response = await api.get<SquadDashboardData>(`/cycles/${level}/${id}/squad`);
+        return response.data;
+    },
+
+    // Daily/weekly load of a macro with ACWR, monotony and strain
+    getMacroTimeseries: async (id: string, athleteId?: string, metric: TimeseriesMetric = 'rpe_load'): Promise<MacroTimeseriesData> => {
+        const params = athleteId ? { athlete_id: athleteId, metric } : { metric };
+        const response = await api.get<MacroTimeseriesData>(`/cycles/macros/${id}/timeseries`, { params });
+        return response.data;
     }
 };
@@ -1,6 +1,11 @@
 import api from './api';
 import { Workout, WorkoutBlock, WorkoutSubdivision } from '@/types';
 
+export interface SessionEvent {
+    type: 'snapshot' | 'feedback' | 'series' | 'session' | 'started' | 'reload' | 'deleted' | 'message';
+    data: any;
+}
+
 // Mappers
 const mapSubdivision = (data: any): WorkoutSubdivision => ({
     id: data.id,
@@ -209,5 +214,56 @@ export const trainingService = {
     createFeedback: async (sessionId: string, data: any) => {
         const response = await api.post<any>(`/training/${sessionId}/feedback`, data);
         return response.data;
+    },
+
+    // Live session events (SSE). EventSource cannot send the auth header, so the
+    // stream is read with fetch. Reconnects with Last-Event-ID until unsubscribed.
+    subscribeToEvents: (sessionId: string, onEvent: (event: SessionEvent) => void) => {
+        const controller = new AbortController();
+        let lastEventId: string | null = null;
+
+        const connect = async () => {
+            while (!controller.signal.aborted) {
+                try {
+                    const headers: Record<string, string> = {};
+                    const token = localStorage.getItem('token');
+                    if (token) headers.Authorization = `Bearer ${token}`;
+                    if (lastEventId) headers['Last-Event-ID'] = lastEventId;
+
+                    const response = await fetch(`${api.defaults.baseURL}/training/${sessionId}/events`, {
+                        headers,
+                        signal: controller.signal,
+                    });
+                    if (!response.ok || !response.body) return;
+
+                    const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+                    let buffer = '';
+                    while (true) {
+                        const { value, done } = await reader.read();
+                        if (done) break;
+                        buffer += value;
+                        const messages = buffer.split('\n\n');
+                        buffer = messages.pop() || '';
+                        for (const message of messages) {
+                            const event: SessionEvent = { type: 'message', data: null };
+                            for (const line of message.split('\n')) {
+                                if (line.startsWith('id: ')) lastEventId = line.slice(4);
+                                else if (line.startsWith('event: ')) event.type = line.slice(7) as SessionEvent['type'];
+                                else if (line.startsWith('data: ')) event.data = JSON.parse(line.slice(6));
+                            }
+                            if (event.data === null) continue; // keep-alive comment
+                            onEvent(event);
+                            if (event.type === 'deleted') return;
+                        }
+                    }
+                } catch (error) {
+                    if (controller.signal.aborted) return;
+                }
+                await new Promise((resolve) => setTimeout(resolve, 2000));
+            }
+        };
+
+        connect();
+        return () => controller.abort();
     }
 };